@@ -333,3 +333,153 @@ def test_split_populations():
     deviation = (Skw0 - Skw1) / Skw0 * 100
 
     assert np.all(deviation < 1e-6), "Failed split populations test"
+
+
+def test_batch_spectral_density():
+    """
+    Checks that a batch of spectra matches the spectra computed one at a
+    time.
+    """
+    wavelengths = np.arange(520, 545, 0.05) * u.nm
+    probe_wavelength = 532 * u.nm
+    n = [5e17, 1e18, 2e16] * u.cm ** -3
+    Te = [[10, 20], [5, 30], [100, 50]] * u.eV
+    Ti = np.array([5, 2]) * u.eV
+    efract = np.array([0.6, 0.4])
+    ifract = np.array([[0.7, 0.3], [0.5, 0.5], [0.9, 0.1]])
+    ion_species = ["p+", "C-12 5+"]
+    electron_vel = np.array([[[300, 0, 0]], [[0, 100, 0]], [[0, 0, 0]]]) * u.km / u.s
+    ion_vel = np.array([[-500, 0, 0], [0, 500, 0]]) * u.km / u.s
+    probe_vec = np.array([1, 0, 0])
+    scatter_vec = np.array([1, 1, 0])
+
+    alpha, Skw = thomson.spectral_density_batch(
+        wavelengths,
+        probe_wavelength,
+        n,
+        Te,
+        Ti,
+        efract=efract,
+        ifract=ifract,
+        ion_species=ion_species,
+        electron_vel=electron_vel,
+        ion_vel=ion_vel,
+        probe_vec=probe_vec,
+        scatter_vec=scatter_vec,
+    )
+    assert alpha.shape == (3,)
+    assert Skw.shape == (3, wavelengths.size)
+    assert Skw.unit == u.s / u.rad
+
+    for i in range(3):
+        expected_alpha, expected_Skw = thomson.spectral_density(
+            wavelengths,
+            probe_wavelength,
+            n[i],
+            Te[i],
+            Ti,
+            efract=efract,
+            ifract=ifract[i],
+            ion_species=list(ion_species),
+            electron_vel=np.repeat(electron_vel[i], 2, axis=0),
+            ion_vel=ion_vel,
+            probe_vec=probe_vec,
+            scatter_vec=scatter_vec,
+        )
+        assert np.isclose(alpha[i].value, expected_alpha.value, rtol=1e-12)
+        assert np.allclose(Skw[i].value, expected_Skw.value, rtol=1e-12, atol=0)
+
+
+def test_batch_spectral_density_errors():
+    """
+    Checks that the shapes of the parameters of a batch are validated.
+    """
+    wavelengths = np.arange(520, 545, 0.05) * u.nm
+    n = [5e17, 1e18] * u.cm ** -3
+
+    # n must have a single batch axis
+    with pytest.raises(ValueError):
+        thomson.spectral_density_batch(
+            wavelengths, 532 * u.nm, n[:, np.newaxis], 10 * u.eV, 10 * u.eV
+        )
+
+    # Te cannot be broadcast to (B, Ne)
+    with pytest.raises(ValueError):
+        thomson.spectral_density_batch(
+            wavelengths, 532 * u.nm, n, [1, 2, 3] * u.eV, 10 * u.eV
+        )
+
+    # ifract is required for several ion species
+    with pytest.raises(ValueError):
+        thomson.spectral_density_batch(
+            wavelengths, 532 * u.nm, n, 10 * u.eV, 10 * u.eV, ion_species=["p+", "p+"]
+        )
+
+
+def test_thomson_model():
+    """
+    Checks that a ThomsonModel returns the spectra of spectral_density
+    and spectral_density_batch.
+    """
+    wavelengths = np.arange(520, 545, 0.05) * u.nm
+    probe_wavelength = 532 * u.nm
+    ion_species = ["p+", "C-12 5+"]
+    scatter_vec = np.array([1, 1, 0])
+    n = 5e17 * u.cm ** -3
+    Te = 10 * u.eV
+    Ti = np.array([5, 5]) * u.eV
+    ifract = np.array([0.7, 0.3])
+    ion_vel = np.array([[-500, 0, 0], [0, 500, 0]]) * u.km / u.s
+
+    model = thomson.ThomsonModel(
+        wavelengths, probe_wavelength, ion_species, scatter_vec=scatter_vec
+    )
+    alpha, Skw = model(n, Te, Ti, ifract=ifract, ion_vel=ion_vel)
+    expected_alpha, expected_Skw = thomson.spectral_density(
+        wavelengths,
+        probe_wavelength,
+        n,
+        Te,
+        Ti,
+        ifract=ifract,
+        ion_species=list(ion_species),
+        ion_vel=ion_vel,
+        scatter_vec=scatter_vec,
+    )
+    assert Skw.unit == u.s / u.rad
+    assert np.isclose(alpha.value, expected_alpha.value, rtol=1e-12)
+    assert np.allclose(Skw.value, expected_Skw.value, rtol=1e-12, atol=0)
+
+    # floats in SI units give floats
+    kelvin = u.temperature_energy()
+    alpha, Skw = model(
+        n.si.value,
+        Te.to_value(u.K, equivalencies=kelvin),
+        Ti.to_value(u.K, equivalencies=kelvin),
+        ifract=ifract,
+        ion_vel=ion_vel.si.value,
+    )
+    assert not isinstance(Skw, u.Quantity)
+    assert np.allclose(Skw, expected_Skw.value, rtol=1e-12, atol=0)
+
+    # a batch of densities
+    n = [5e17, 1e18] * u.cm ** -3
+    alpha, Skw = model(n, Te, Ti, ifract=ifract)
+    expected_alpha, expected_Skw = thomson.spectral_density_batch(
+        wavelengths,
+        probe_wavelength,
+        n,
+        Te,
+        Ti,
+        ifract=ifract,
+        ion_species=ion_species,
+        scatter_vec=scatter_vec,
+    )
+    assert Skw.shape == (2, wavelengths.size)
+    assert np.allclose(alpha.value, expected_alpha.value, rtol=1e-12)
+    assert np.allclose(Skw.value, expected_Skw.value, rtol=1e-12, atol=0)
+
+    with pytest.raises(ValueError):
+        model(n[:, np.newaxis], Te, Ti, ifract=ifract)
+    with pytest.raises(ValueError):
+        model(n, Te, Ti)
@@ -5,6 +5,8 @@ part of the diagnostics package.
 
 __all__ = [
     "spectral_density",
+    "spectral_density_batch",
+    "ThomsonModel",
 ]
 
 import astropy.constants as const
@@ -13,8 +15,7 @@ import numpy as np
 
 from typing import List, Tuple, Union
 
-from plasmapy.formulary.dielectric import permittivity_1D_Maxwellian
-from plasmapy.formulary.parameters import plasma_frequency, thermal_speed
+from plasmapy.dispersion.dispersionfunction import plasma_dispersion_func_deriv
 from plasmapy.particles import Particle
 from plasmapy.utils.decorators import validate_quantities
 
@@ -24,6 +25,128 @@ from plasmapy.utils.decorators import validate_quantities
 # atomic species.
 
 
+def _ion_particles(ion_species):
+    """Return the ion species as a list of `~plasmapy.particles.Particle`."""
+    if isinstance(ion_species, (str, Particle)):
+        ion_species = [ion_species]
+    if len(ion_species) == 0:
+        raise ValueError("At least one ion species needs to be defined.")
+    return [ion if isinstance(ion, Particle) else Particle(ion) for ion in ion_species]
+
+
+def _geometry(wavelengths, probe_wavelength, probe_vec, scatter_vec):
+    """
+    Return the frequency shifts, the scattered and probe frequencies,
+    the cosine of the scattering angle and the direction of the
+    scattering wavevector, in SI units, which do not depend on the
+    plasma parameters.
+    """
+    # Ensure unit vectors are normalized
+    probe_vec = probe_vec / np.linalg.norm(probe_vec)
+    scatter_vec = scatter_vec / np.linalg.norm(scatter_vec)
+
+    # Convert wavelengths to angular frequencies (electromagnetic waves, so
+    # phase speed is c)
+    ws = 2 * np.pi * const.c.si.value / wavelengths.si.value
+    wl = 2 * np.pi * const.c.si.value / probe_wavelength.si.value
+
+    # Compute the frequency shift (required by energy conservation)
+    w = ws - wl
+
+    cos_angle = np.dot(probe_vec, scatter_vec)
+    # Normal vector along k
+    k_vec = scatter_vec - probe_vec
+    return w, ws, wl, cos_angle, k_vec
+
+
+def _spectral_density(
+    geometry, n, efract, Te, electron_vel, ifract, Ti, ion_vel, ion_z, ion_mass
+):
+    """
+    Return the mean scattering parameter, shape (B,), and the spectral
+    density function in s/rad, shape (B, W), for a batch of B plasmas.
+
+    All arguments are in SI units and broadcast to shapes with the batch
+    axis first: ``n`` of shape (B,), ``efract`` and ``Te`` of shape
+    (B, Ne), ``electron_vel`` of shape (B, Ne, 3), ``ifract`` and ``Ti``
+    of shape (B, Ni), ``ion_vel`` of shape (B, Ni, 3), and the charge
+    numbers ``ion_z`` and masses ``ion_mass`` of the ions of shape
+    (Ni,).  ``geometry`` is returned by `_geometry`.
+    """
+    w, ws, wl, cos_angle, k_vec = geometry
+    C = const.c.si.value
+    e2_eps0 = const.e.si.value ** 2 / const.eps0.si.value
+    m_e = const.m_e.si.value
+    k_B = const.k_B.si.value
+
+    # Calculate plasma parameters
+    vTe = np.sqrt(2 * k_B * Te / m_e)
+    vTi = np.sqrt(2 * k_B * Ti / ion_mass)
+    zbar = ifract @ ion_z
+    ne = efract * n[:, np.newaxis]
+    ni = ifract * (n / zbar)[:, np.newaxis]  # ne/zbar = sum(ni)
+    # wpe is calculated for the entire plasma (all electron populations combined)
+    wpe2 = n * e2_eps0 / m_e
+
+    # Compute the wavenumbers in the plasma
+    # See Sheffield Sec. 1.8.1 and Eqs. 5.4.1 and 5.4.2
+    ks = np.sqrt(ws ** 2 - wpe2[:, np.newaxis]) / C
+    kl = np.sqrt(wl ** 2 - wpe2[:, np.newaxis]) / C
+
+    # Compute the wavenumber shift (required by momentum conservation)
+    # Eq. 1.7.10 in Sheffield, with a species axis before the wavelengths
+    k = np.sqrt(ks ** 2 + kl ** 2 - 2 * ks * kl * cos_angle)[:, np.newaxis, :]
+
+    # Compute Doppler-shifted frequencies for both the ions and electrons,
+    # of shape (batch, species, wavelengths)
+    w_e = w - (electron_vel @ k_vec)[..., np.newaxis] * k
+    w_i = w - (ion_vel @ k_vec)[..., np.newaxis] * k
+
+    # Compute the scattering parameter alpha
+    # expressed here using the fact that v_th/w_p = root(2) * Debye length
+    kvTe = k * vTe[..., np.newaxis]
+    kvTi = k * vTi[..., np.newaxis]
+    alpha = np.mean(np.sqrt(2 * wpe2)[:, np.newaxis, np.newaxis] / kvTe, axis=(1, 2))
+
+    # Calculate the normalized phase velocities (Sec. 3.4.2 in Sheffield)
+    xe = w_e / kvTe
+    xi = w_i / kvTi
+
+    # Calculate the susceptibilities, -alpha**2 / 2 Z'(x) for each species
+    # Treatment of multiple species is an extension of the discussion in
+    # Sheffield Sec. 5.1
+    wpi2 = ni * ion_z ** 2 * e2_eps0 / ion_mass
+    chiE = np.sum(
+        -(ne * e2_eps0 / m_e)[..., np.newaxis]
+        / kvTe ** 2
+        * plasma_dispersion_func_deriv(xe),
+        axis=1,
+    )
+    chiI = np.sum(
+        -wpi2[..., np.newaxis] / kvTi ** 2 * plasma_dispersion_func_deriv(xi), axis=1
+    )
+
+    # Calculate the longitudinal dielectric function
+    epsilon = 1 + chiE + chiI
+
+    econtr = np.sum(
+        efract[..., np.newaxis] * 2 * np.sqrt(np.pi) / kvTe * np.exp(-(xe ** 2)),
+        axis=1,
+    )
+    icontr = np.sum(
+        (ifract * ion_z)[..., np.newaxis]
+        * 2
+        * np.sqrt(np.pi)
+        / kvTi
+        * np.exp(-(xi ** 2)),
+        axis=1,
+    )
+    Skw = (
+        np.abs(1 - chiE / epsilon) ** 2 * econtr + np.abs(chiE / epsilon) ** 2 * icontr
+    )
+    return alpha, Skw
+
+
 @validate_quantities(
     wavelengths={"can_be_negative": False},
     probe_wavelength={"can_be_negative": False},
@@ -173,14 +296,7 @@ def spectral_density(
         ion_vel = np.zeros([ifract.size, 3]) * u.m / u.s
 
     # Condition ion_species
-    if isinstance(ion_species, (str, Particle)):
-        ion_species = [ion_species]
-    if len(ion_species) == 0:
-        raise ValueError("At least one ion species needs to be defined.")
-    for ii, ion in enumerate(ion_species):
-        if isinstance(ion, Particle):
-            continue
-        ion_species[ii] = Particle(ion)
+    ion_species = _ion_particles(ion_species)
 
     # Condition Te
     if Te.size == 1:
@@ -221,101 +337,339 @@ def spectral_density(
             f"Te ({Te.size}), or electron velocity ({electron_vel.shape[0]})."
         )
 
-    # Ensure unit vectors are normalized
-    probe_vec = probe_vec / np.linalg.norm(probe_vec)
-    scatter_vec = scatter_vec / np.linalg.norm(scatter_vec)
+    geometry = _geometry(wavelengths, probe_wavelength, probe_vec, scatter_vec)
+    alpha, Skw = _spectral_density(
+        geometry,
+        n.si.value[np.newaxis],
+        efract[np.newaxis],
+        Te.si.value[np.newaxis],
+        electron_vel.si.value[np.newaxis],
+        ifract[np.newaxis],
+        Ti.si.value[np.newaxis],
+        ion_vel.si.value[np.newaxis],
+        np.array([ion.integer_charge for ion in ion_species], dtype=float),
+        np.array([ion.mass.si.value for ion in ion_species]),
+    )
 
-    # Define some constants
-    C = const.c.si  # speed of light
+    return alpha[0] * u.dimensionless_unscaled, Skw[0] * u.s / u.rad
 
-    # Calculate plasma parameters
-    vTe = thermal_speed(Te, particle="e-")
-    vTi, ion_z = [], []
-    for T, ion in zip(Ti, ion_species):
-        vTi.append(thermal_speed(T, particle=ion).value)
-        ion_z.append(ion.integer_charge * u.dimensionless_unscaled)
-    vTi = vTi * vTe.unit
-    zbar = np.sum(ifract * ion_z)
-    ne = efract * n
-    ni = ifract * n / zbar  # ne/zbar = sum(ni)
-    # wpe is calculated for the entire plasma (all electron populations combined)
-    wpe = plasma_frequency(n=n, particle="e-")
 
-    # Convert wavelengths to angular frequencies (electromagnetic waves, so
-    # phase speed is c)
-    ws = (2 * np.pi * u.rad * C / wavelengths).to(u.rad / u.s)
-    wl = (2 * np.pi * u.rad * C / probe_wavelength).to(u.rad / u.s)
+def _broadcast_parameter(value, shape, name):
+    """
+    Return ``value`` broadcast to ``shape``, raising a `ValueError` if
+    the shapes are incompatible.
+    """
+    try:
+        return np.broadcast_to(value, shape)
+    except ValueError:
+        raise ValueError(
+            f"The shape {np.shape(value)} of {name} cannot be broadcast to {shape}."
+        ) from None
 
-    # Compute the frequency shift (required by energy conservation)
-    w = ws - wl
 
-    # Compute the wavenumbers in the plasma
-    # See Sheffield Sec. 1.8.1 and Eqs. 5.4.1 and 5.4.2
-    ks = np.sqrt(ws ** 2 - wpe ** 2) / C
-    kl = np.sqrt(wl ** 2 - wpe ** 2) / C
+def _batch_parameters(n, Te, Ti, efract, ifract, electron_vel, ion_vel, n_ions):
+    """
+    Return the plasma parameters in SI units, with ``n`` of shape (B,),
+    broadcast to the shapes of the arguments of `_spectral_density`, in
+    its order.  ``efract``, ``ifract`` and the velocities default to
+    their values in `spectral_density` if `None`.
+    """
+    batch = n.size
+    efract = np.ones((1, 1)) if efract is None else np.asarray(efract, dtype=float)
+    n_electrons = efract.shape[-1] if efract.ndim else 1
+    if ifract is None:
+        if n_ions != 1:
+            raise ValueError("ifract must be given for several ion species.")
+        ifract = np.ones(1)
+    if electron_vel is None:
+        electron_vel = np.zeros(3)
+    if ion_vel is None:
+        ion_vel = np.zeros(3)
+    return (
+        n,
+        _broadcast_parameter(efract, (batch, n_electrons), "efract"),
+        _broadcast_parameter(Te, (batch, n_electrons), "Te"),
+        _broadcast_parameter(electron_vel, (batch, n_electrons, 3), "electron_vel"),
+        _broadcast_parameter(
+            np.asarray(ifract, dtype=float), (batch, n_ions), "ifract"
+        ),
+        _broadcast_parameter(Ti, (batch, n_ions), "Ti"),
+        _broadcast_parameter(ion_vel, (batch, n_ions, 3), "ion_vel"),
+    )
 
-    # Compute the wavenumber shift (required by momentum conservation)
-    scattering_angle = np.arccos(np.dot(probe_vec, scatter_vec))
-    # Eq. 1.7.10 in Sheffield
-    k = np.sqrt(ks ** 2 + kl ** 2 - 2 * ks * kl * np.cos(scattering_angle))
-    # Normal vector along k
-    k_vec = (scatter_vec - probe_vec) * u.dimensionless_unscaled
 
-    # Compute Doppler-shifted frequencies for both the ions and electrons
-    # Matmul is simultaneously conducting dot product over all wavelengths
-    # and ion components
-    w_e = w - np.matmul(electron_vel, np.outer(k, k_vec).T)
-    w_i = w - np.matmul(ion_vel, np.outer(k, k_vec).T)
+@validate_quantities(
+    wavelengths={"can_be_negative": False},
+    probe_wavelength={"can_be_negative": False},
+    n={"can_be_negative": False},
+    Te={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+    Ti={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+)
+def spectral_density_batch(
+    wavelengths: u.nm,
+    probe_wavelength: u.nm,
+    n: u.m ** -3,
+    Te: u.K,
+    Ti: u.K,
+    efract: np.ndarray = None,
+    ifract: np.ndarray = None,
+    ion_species: Union[str, List[str], Particle, List[Particle]] = "H+",
+    electron_vel: u.m / u.s = None,
+    ion_vel: u.m / u.s = None,
+    probe_vec=np.array([1, 0, 0]),
+    scatter_vec=np.array([0, 1, 0]),
+) -> Tuple[u.Quantity, u.Quantity]:
+    r"""
+    Calculate the spectral density function for Thomson scattering of a
+    probe laser beam by a batch of multi-species Maxwellian plasmas at
+    once.
+
+    This function computes the same spectral density as
+    `spectral_density` for B sets of plasma parameters, such as the
+    trial parameters of a fit or the plasmas of spatially resolved
+    measurements, sharing the wavelengths, scattering geometry and ion
+    species.  All spectra are computed together, with arrays of shape
+    (B, species, wavelengths), instead of one call per set.
 
-    # Compute the scattering parameter alpha
-    # expressed here using the fact that v_th/w_p = root(2) * Debye length
-    alpha = np.sqrt(2) * wpe / np.outer(k, vTe)
+    Parameters
+    ----------
 
-    # Calculate the normalized phase velocities (Sec. 3.4.2 in Sheffield)
-    xe = (np.outer(1 / vTe, 1 / k) * w_e).to(u.dimensionless_unscaled)
-    xi = (np.outer(1 / vTi, 1 / k) * w_i).to(u.dimensionless_unscaled)
+    wavelengths : `~astropy.units.Quantity`
+        Array of wavelengths over which the spectral density function
+        will be calculated. (convertible to nm)
 
-    # Calculate the susceptibilities
+    probe_wavelength : `~astropy.units.Quantity`
+        Wavelength of the probe laser. (convertible to nm)
 
-    chiE = np.zeros([efract.size, w.size], dtype=np.complex128)
-    for i, fract in enumerate(efract):
-        chiE[i, :] = permittivity_1D_Maxwellian(w_e[i, :], k, Te[i], ne[i], "e-")
+    n : `~astropy.units.Quantity`, shape (B, )
+        Mean (0th order) density of all plasma components combined, for
+        each plasma of the batch. (convertible to cm^-3.)
 
-    # Treatment of multiple species is an extension of the discussion in
-    # Sheffield Sec. 5.1
-    chiI = np.zeros([ifract.size, w.size], dtype=np.complex128)
-    for i, ion in enumerate(ion_species):
-        chiI[i, :] = permittivity_1D_Maxwellian(
-            w_i[i, :], k, Ti[i], ni[i], ion, z_mean=ion_z[i]
-        )
+    Te : `~astropy.units.Quantity`
+        Temperature of each electron component, broadcastable to the shape
+        (B, Ne). (in K or convertible to eV)
 
-    # Calculate the longitudinal dielectric function
-    epsilon = 1 + np.sum(chiE, axis=0) + np.sum(chiI, axis=0)
-
-    econtr = np.zeros([efract.size, w.size], dtype=np.complex128) * u.s / u.rad
-    for m in range(efract.size):
-        econtr[m, :] = efract[m] * (
-            2
-            * np.sqrt(np.pi)
-            / k
-            / vTe[m]
-            * np.power(np.abs(1 - np.sum(chiE, axis=0) / epsilon), 2)
-            * np.exp(-xe[m, :] ** 2)
-        )
+    Ti : `~astropy.units.Quantity`
+        Temperature of each ion component, broadcastable to the shape
+        (B, Ni). (in K or convertible to eV)
 
-    icontr = np.zeros([ifract.size, w.size], dtype=np.complex128) * u.s / u.rad
-    for m in range(ifract.size):
-        icontr[m, :] = ifract[m] * (
-            2
-            * np.sqrt(np.pi)
-            * ion_z[m]
-            / k
-            / vTi[m]
-            * np.power(np.abs(np.sum(chiE, axis=0) / epsilon), 2)
-            * np.exp(-xi[m, :] ** 2)
-        )
+    efract : array_like, optional
+        The fraction of each electron component of the total electron
+        number density, broadcastable to the shape (B, Ne), the length of
+        its last axis setting the number of electron components Ne.
+        Default is a single electron component.
+
+    ifract : array_like, optional
+        The fraction of each ion component of the total ion number
+        density, broadcastable to the shape (B, Ni).  Default is a single
+        ion species.
+
+    ion_species : str or `~plasmapy.particles.Particle`, shape (Ni, ), optional
+        A list or single instance of `~plasmapy.particles.Particle`, or strings
+        convertible to `~plasmapy.particles.Particle`, shared by the whole
+        batch. Default is `'H+'` corresponding to a single species of
+        hydrogen ions.
+
+    electron_vel : `~astropy.units.Quantity`, optional
+        Velocity of each electron component in the rest frame,
+        broadcastable to the shape (B, Ne, 3). (convertible to m/s)
+        Defaults to a stationary plasma [0, 0, 0] m/s.
+
+    ion_vel : `~astropy.units.Quantity`, optional
+        Velocity of each ion component in the rest frame, broadcastable
+        to the shape (B, Ni, 3). (convertible to m/s) Defaults to zero
+        drift for all specified ion species.
+
+    probe_vec : float `~numpy.ndarray`, shape (3, )
+        Unit vector in the direction of the probe laser. Defaults to
+        [1, 0, 0].
+
+    scatter_vec : float `~numpy.ndarray`, shape (3, )
+        Unit vector pointing from the scattering volume to the detector.
+        Defaults to [0, 1, 0] which, along with the default `probe_vec`,
+        corresponds to a 90 degree scattering angle geometry.
+
+    Returns
+    -------
+    alpha : `~astropy.units.Quantity`, shape (B, )
+        Mean scattering parameter of each plasma of the batch.
+
+    Skw : `~astropy.units.Quantity`, shape (B, W)
+        Computed spectral density function of each plasma of the batch
+        over the input `wavelengths` array, of length W, with units of
+        s/rad.
+
+    Raises
+    ------
+    ValueError
+        If ``n`` is not one-dimensional or the other parameters cannot be
+        broadcast to their shapes.
 
-    # Recast as real: imaginary part is already zero
-    Skw = np.real(np.sum(econtr, axis=0) + np.sum(icontr, axis=0))
+    Notes
+    -----
+    The parameters follow the broadcasting rules of NumPy against their
+    full shapes, so that a parameter shared by the whole batch is given
+    with the shape accepted by `spectral_density`, and a parameter
+    varying over the batch with a leading batch axis, such as ``Te`` of
+    shape (B, 1) for a single electron component.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> wavelengths = np.linspace(520, 545, 5) * u.nm
+    >>> Te = [[5], [10], [20]] * u.eV
+    >>> alpha, Skw = spectral_density_batch(
+    ...     wavelengths, 532 * u.nm, np.full(3, 5e17) * u.cm ** -3, Te, 10 * u.eV
+    ... )
+    >>> alpha.shape, Skw.shape
+    ((3,), (3, 5))
+    """
+    n = n.si.value
+    if n.ndim != 1:
+        raise ValueError(f"n must have the shape (B, ), not {n.shape}.")
+    ion_species = _ion_particles(ion_species)
+    parameters = _batch_parameters(
+        n,
+        Te.si.value,
+        Ti.si.value,
+        efract,
+        ifract,
+        None if electron_vel is None else electron_vel.to_value(u.m / u.s),
+        None if ion_vel is None else ion_vel.to_value(u.m / u.s),
+        len(ion_species),
+    )
+
+    geometry = _geometry(wavelengths, probe_wavelength, probe_vec, scatter_vec)
+    alpha, Skw = _spectral_density(
+        geometry,
+        *parameters,
+        np.array([ion.integer_charge for ion in ion_species], dtype=float),
+        np.array([ion.mass.si.value for ion in ion_species]),
+    )
+    return alpha * u.dimensionless_unscaled, Skw * u.s / u.rad
+
+
+def _si_value(value, unit):
+    """
+    Return ``value`` in ``unit`` if it is a `~astropy.units.Quantity`,
+    and as a float array otherwise, assumed to be in ``unit``.
+    """
+    if isinstance(value, u.Quantity):
+        return value.to_value(unit, equivalencies=u.temperature_energy())
+    return np.asarray(value, dtype=float)
+
+
+class ThomsonModel:
+    r"""
+    The Thomson scattering spectral density of `spectral_density` for
+    fixed wavelengths, scattering geometry and ion species, for repeated
+    evaluations with varying plasma parameters, as in fits.
+
+    Parameters
+    ----------
 
-    return np.mean(alpha), Skw
+    wavelengths : `~astropy.units.Quantity`
+        Array of wavelengths over which the spectral density function
+        will be calculated. (convertible to nm)
+
+    probe_wavelength : `~astropy.units.Quantity`
+        Wavelength of the probe laser. (convertible to nm)
+
+    ion_species : str or `~plasmapy.particles.Particle`, shape (Ni, ), optional
+        A list or single instance of `~plasmapy.particles.Particle`, or strings
+        convertible to `~plasmapy.particles.Particle`. Default is `'H+'`
+        corresponding to a single species of hydrogen ions.
+
+    probe_vec : float `~numpy.ndarray`, shape (3, )
+        Unit vector in the direction of the probe laser. Defaults to
+        [1, 0, 0].
+
+    scatter_vec : float `~numpy.ndarray`, shape (3, )
+        Unit vector pointing from the scattering volume to the detector.
+        Defaults to [0, 1, 0] which, along with the default `probe_vec`,
+        corresponds to a 90 degree scattering angle geometry.
+
+    Notes
+    -----
+    The ion species are converted to `~plasmapy.particles.Particle`, and
+    their charges and masses, the frequencies of the scattered and probe
+    waves and the direction of the scattering wavevector are computed
+    once at creation.  Each call then only validates the shapes of the
+    plasma parameters before computing the spectrum, in NumPy.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> wavelengths = np.linspace(520, 545, 5) * u.nm
+    >>> model = ThomsonModel(wavelengths, 532 * u.nm, ion_species="C-12 5+")
+    >>> alpha, Skw = model(5e17 * u.cm ** -3, 10 * u.eV, 10 * u.eV)
+    >>> alpha
+    <Quantity 1.80...>
+    >>> Skw.shape
+    (5,)
+    """
+
+    @validate_quantities(
+        wavelengths={"can_be_negative": False},
+        probe_wavelength={"can_be_negative": False},
+    )
+    def __init__(
+        self,
+        wavelengths: u.nm,
+        probe_wavelength: u.nm,
+        ion_species: Union[str, List[str], Particle, List[Particle]] = "H+",
+        probe_vec=np.array([1, 0, 0]),
+        scatter_vec=np.array([0, 1, 0]),
+    ):
+        self.wavelengths = wavelengths
+        self.probe_wavelength = probe_wavelength
+        self.ion_species = _ion_particles(ion_species)
+        self.probe_vec = probe_vec
+        self.scatter_vec = scatter_vec
+        self._geometry = _geometry(
+            wavelengths, probe_wavelength, probe_vec, scatter_vec
+        )
+        self._ion_z = np.array(
+            [ion.integer_charge for ion in self.ion_species], dtype=float
+        )
+        self._ion_mass = np.array([ion.mass.si.value for ion in self.ion_species])
+
+    def __call__(
+        self, n, Te, Ti, efract=None, ifract=None, electron_vel=None, ion_vel=None
+    ):
+        """
+        Return the mean scattering parameter and the spectral density
+        function in s/rad for the plasma parameters of `spectral_density`.
+
+        The parameters are either `~astropy.units.Quantity`, in which case
+        the results are also `~astropy.units.Quantity`, or floats in SI
+        units, with the temperatures in K, which are not validated.  If
+        ``n`` is an array of shape (B, ), the parameters describe a batch
+        of plasmas, as in `spectral_density_batch`, and the results have
+        a leading batch axis.
+        """
+        quantity = isinstance(n, u.Quantity)
+        n = _si_value(n, u.m ** -3)
+        if n.ndim > 1:
+            raise ValueError(f"n must be a scalar or of shape (B, ), not {n.shape}.")
+        single = n.ndim == 0
+        parameters = _batch_parameters(
+            n.reshape(-1),
+            _si_value(Te, u.K),
+            _si_value(Ti, u.K),
+            efract,
+            ifract,
+            None if electron_vel is None else _si_value(electron_vel, u.m / u.s),
+            None if ion_vel is None else _si_value(ion_vel, u.m / u.s),
+            self._ion_z.size,
+        )
+        alpha, Skw = _spectral_density(
+            self._geometry, *parameters, self._ion_z, self._ion_mass
+        )
+        if single:
+            alpha, Skw = alpha[0], Skw[0]
+        if quantity:
+            return alpha * u.dimensionless_unscaled, Skw * u.s / u.rad
+        return alpha, Skw
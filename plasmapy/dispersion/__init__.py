@@ -3,11 +3,16 @@ The `~plasmapy.dispersion` subpackage contains functionality associated with
 plasma dispersion relations, solvers and analytical solutions.
 """
 __all__ = [
+    "cold_plasma_n_squared",
+    "cold_plasma_omega",
+    "kinetic_electrostatic_roots",
     "plasma_dispersion_func",
     "plasma_dispersion_func_deriv",
 ]
 
+from plasmapy.dispersion.cold_plasma import cold_plasma_n_squared, cold_plasma_omega
 from plasmapy.dispersion.dispersionfunction import (
     plasma_dispersion_func,
     plasma_dispersion_func_deriv,
 )
+from plasmapy.dispersion.kinetic import kinetic_electrostatic_roots
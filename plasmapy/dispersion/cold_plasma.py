@@ -0,0 +1,325 @@
+"""
+Dispersion relation of a magnetized cold plasma with any number of
+species.
+"""
+__all__ = ["cold_plasma_n_squared", "cold_plasma_omega"]
+
+import astropy.units as u
+import numpy as np
+import numpy.polynomial.polynomial as poly
+
+from astropy.constants.si import c
+from collections import namedtuple
+
+from plasmapy.formulary import dielectric
+from plasmapy.utils.decorators import validate_quantities
+
+#: Named tuple for the two refractive-index branches returned by
+#: :func:`cold_plasma_n_squared`.
+ColdPlasmaRefractiveIndex = namedtuple("ColdPlasmaRefractiveIndex", ["fast", "slow"])
+
+# number of (k, theta) points whose companion matrices are built and
+# diagonalized at once by cold_plasma_omega
+_CHUNK_SIZE = 16384
+
+
+@validate_quantities(
+    B={"can_be_negative": False},
+    omega={"can_be_negative": False},
+)
+def cold_plasma_n_squared(B: u.T, species, n, omega: u.rad / u.s, theta: u.rad):
+    r"""
+    Squared refractive indices of the two cold-plasma wave branches at
+    given frequencies and angles of propagation.
+
+    Parameters
+    ----------
+    B : ~astropy.units.Quantity
+        Magnetic field magnitude in units convertible to tesla.
+
+    species : list of str
+        List of the plasma particle species
+        e.g.: ['e', 'D+'] or ['e', 'D+', 'He+'].
+
+    n : list of ~astropy.units.Quantity
+        `list` of species density in units convertible to per cubic meter
+        The order of the species densities should follow species.
+
+    omega : ~astropy.units.Quantity
+        Wave frequency in rad/s.
+
+    theta : ~astropy.units.Quantity
+        Angle between the wave vector and the magnetic field.
+
+    Returns
+    -------
+    fast : ~astropy.units.Quantity
+        The smaller of the two values of :math:`n^2`.
+
+    slow : ~astropy.units.Quantity
+        The larger of the two values of :math:`n^2`.
+
+    Notes
+    -----
+    The refractive index :math:`n = c k / \omega` of a cold plasma
+    satisfies [1]_
+
+    .. math::
+        A n^4 - B n^2 + C = 0,
+
+    with
+
+    .. math::
+        A = S \sin^2 \theta + P \cos^2 \theta, \qquad
+        B = R L \sin^2 \theta + P S (1 + \cos^2 \theta), \qquad
+        C = P R L,
+
+    where :math:`S`, :math:`D`, :math:`P` are the elements of
+    `~plasmapy.formulary.dielectric.cold_plasma_permittivity_SDP`,
+    :math:`R = S + D`, and :math:`L = S - D`.  The two roots are
+    computed with the numerically stable form of the quadratic
+    formula, so the root that stays finite at a resonance
+    (:math:`A = 0`) is accurate there.  ``omega``, ``theta``, ``B``
+    and the densities are broadcast against each other, so whole
+    :math:`(\omega, \theta)` grids are evaluated in one call.  Negative
+    values of :math:`n^2` correspond to evanescent waves.
+
+    References
+    ----------
+    .. [1] T.H. Stix, Waves in Plasma, 1992.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> omega = np.array([[1e10], [1e11]]) * u.rad / u.s
+    >>> theta = np.array([0, 45, 90]) * u.deg
+    >>> n2 = cold_plasma_n_squared(
+    ...     1 * u.T, ["e", "p"], [1e19, 1e19] * u.m ** -3, omega, theta
+    ... )
+    >>> n2.fast.shape
+    (2, 3)
+    >>> n2.slow[1]
+    <Quantity [ 5.19242..., -0.20437..., -0.32027...]>
+    """
+    S, D, P = dielectric.cold_plasma_permittivity_SDP(B, species, n, omega)
+    S, D, P = (element.to_value(u.dimensionless_unscaled) for element in (S, D, P))
+    R = S + D
+    L = S - D
+
+    sin2 = np.sin(theta.value) ** 2
+    cos2 = np.cos(theta.value) ** 2
+    A = S * sin2 + P * cos2
+    B = R * L * sin2 + P * S * (1 + cos2)
+    C = P * R * L
+    F = np.sqrt((R * L - P * S) ** 2 * sin2 ** 2 + 4 * P ** 2 * D ** 2 * cos2)
+
+    q = B + np.copysign(F, B)
+    n2_outer = q / (2 * A)
+    n2_inner = 2 * C / q
+
+    return ColdPlasmaRefractiveIndex(
+        np.minimum(n2_outer, n2_inner) * u.dimensionless_unscaled,
+        np.maximum(n2_outer, n2_inner) * u.dimensionless_unscaled,
+    )
+
+
+def _even_part(coefficients, size):
+    """
+    Return the coefficients of the polynomial in :math:`\\omega^2` of an
+    even polynomial in :math:`\\omega`, padded to ``size``.
+    """
+    even = np.zeros(size)
+    even[: (coefficients.size + 1) // 2] = coefficients[::2]
+    return even
+
+
+def _dispersion_polynomials(omega_c, omega_p2):
+    r"""
+    Return the polynomials in :math:`x = \omega^2` that make up the
+    cold-plasma dispersion relation after multiplication by its
+    denominators.
+
+    With :math:`\kappa = c k` and all frequencies in the same units,
+    the dispersion relation is
+
+    .. math::
+        \kappa^4 (a_1 \sin^2 \theta + a_2 \cos^2 \theta)
+        - \kappa^2 [b_1 \sin^2 \theta + b_2 (1 + \cos^2 \theta)]
+        + c_0 = 0,
+
+    and the five coefficient arrays are returned stacked in that order.
+    """
+    omega = np.array([0.0, 1.0])
+    Pi_plus = poly.polyfromroots(-omega_c)
+    Pi_minus = poly.polyfromroots(omega_c)
+    Pi = poly.polymul(Pi_plus, Pi_minus)
+
+    # R = R_hat / (omega Pi_plus), L = L_hat / (omega Pi_minus),
+    # S = S_tilde / Pi and P = P_tilde / omega**2
+    R_hat = poly.polymul(omega, Pi_plus)
+    L_hat = poly.polymul(omega, Pi_minus)
+    S_tilde = Pi
+    for s, omega_p2_s in enumerate(omega_p2):
+        others = np.delete(omega_c, s)
+        R_hat = poly.polysub(R_hat, omega_p2_s * poly.polyfromroots(-others))
+        L_hat = poly.polysub(L_hat, omega_p2_s * poly.polyfromroots(others))
+        S_tilde = poly.polysub(
+            S_tilde,
+            omega_p2_s
+            * poly.polymul(poly.polyfromroots(others), poly.polyfromroots(-others)),
+        )
+    P_tilde = np.array([-np.sum(omega_p2), 0.0, 1.0])
+    RL_hat = poly.polymul(R_hat, L_hat)
+    omega2 = np.array([0.0, 0.0, 1.0])
+
+    size = omega_c.size + 4
+    return np.stack(
+        [
+            _even_part(poly.polymul(omega2, S_tilde), size),
+            _even_part(poly.polymul(P_tilde, Pi), size),
+            _even_part(poly.polymul(omega2, RL_hat), size),
+            _even_part(poly.polymul(omega2, poly.polymul(P_tilde, S_tilde)), size),
+            _even_part(poly.polymul(omega2, poly.polymul(P_tilde, RL_hat)), size),
+        ]
+    )
+
+
+def _polish_roots(x, coefficients, iterations=2):
+    """
+    Refine the real roots ``x[i, :]`` of the polynomials with
+    coefficients ``coefficients[i, :]`` (lowest degree first) with
+    Newton's method, keeping only the steps that reduce the residual.
+    """
+
+    def evaluate(x):
+        p = np.zeros_like(x)
+        dp = np.zeros_like(x)
+        for j in range(coefficients.shape[-1] - 1, -1, -1):
+            dp = dp * x + p
+            p = p * x + coefficients[:, j, np.newaxis]
+        return p, dp
+
+    p, dp = evaluate(x)
+    for _ in range(iterations):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            candidate = x - p / dp
+        p_candidate, dp_candidate = evaluate(candidate)
+        better = np.abs(p_candidate) < np.abs(p)
+        x = np.where(better, candidate, x)
+        p = np.where(better, p_candidate, p)
+        dp = np.where(better, dp_candidate, dp)
+    return x
+
+
+@validate_quantities(
+    B={"can_be_negative": False},
+    k={"can_be_negative": False},
+)
+def cold_plasma_omega(B: u.T, species, n, k: u.rad / u.m, theta: u.rad):
+    r"""
+    Frequencies of all the cold-plasma wave branches at given
+    wavenumbers and angles of propagation.
+
+    Parameters
+    ----------
+    B : ~astropy.units.Quantity
+        Magnetic field magnitude in units convertible to tesla.  Must
+        be a scalar.
+
+    species : list of str
+        List of the plasma particle species
+        e.g.: ['e', 'D+'] or ['e', 'D+', 'He+'].
+
+    n : list of ~astropy.units.Quantity
+        `list` of species density in units convertible to per cubic
+        meter, one scalar per species.  The order of the species
+        densities should follow species.
+
+    k : ~astropy.units.Quantity
+        Wavenumber in units convertible to rad/m.
+
+    theta : ~astropy.units.Quantity
+        Angle between the wave vector and the magnetic field.
+
+    Returns
+    -------
+    omega : ~astropy.units.Quantity
+        The non-negative frequencies of the branches in rad/s, in
+        increasing order along the last axis.  The shape is the
+        broadcast shape of ``k`` and ``theta`` followed by the number
+        of branches, which is the number of species plus three.
+
+    Raises
+    ------
+    ValueError
+        If ``B`` or an element of ``n`` is not a scalar.
+
+    Notes
+    -----
+    Multiplying the dispersion relation of `cold_plasma_n_squared`
+    by its denominators gives a monic polynomial in :math:`\omega^2` of
+    degree :math:`N_s + 3` for :math:`N_s` species, whose coefficients
+    are quadratic in :math:`c^2 k^2` and linear in :math:`\cos^2
+    \theta`.  The polynomial is built once from the species, in units
+    of the largest plasma or cyclotron frequency, and its roots at all
+    :math:`(k, \theta)` points are the eigenvalues of a stack of
+    companion matrices.  The roots are then refined with two Newton
+    steps, so that the low-frequency branches are accurate relative to
+    their own size.  At perpendicular propagation one branch is
+    :math:`\omega = 0`.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> k = np.array([[100], [1000]]) * u.rad / u.m
+    >>> theta = np.array([0, 45]) * u.deg
+    >>> n = [1e19, 1e19] * u.m ** -3
+    >>> omega = cold_plasma_omega(1 * u.T, ["e", "p"], n, k, theta)
+    >>> omega.shape
+    (2, 2, 5)
+    >>> omega[0, 0]
+    <Quantity [9.40089...e+07, 4.79887...e+09, 1.16649...e+11, 1.78447...e+11,
+               2.87730...e+11] rad / s>
+    """
+    if np.ndim(B) != 0 or any(np.ndim(n_s) != 0 for n_s in n):
+        raise ValueError("B and the densities n must be scalars.")
+
+    omega_c, omega_p2 = dielectric._cold_plasma_species_frequencies(B, species, n)
+    omega_c = omega_c.to_value(u.rad / u.s)
+    omega_p2 = omega_p2.to_value(u.rad ** 2 / u.s ** 2)
+
+    omega_ref = max(np.max(np.abs(omega_c)), np.sqrt(np.max(omega_p2)))
+    a1, a2, b1, b2, c0 = _dispersion_polynomials(
+        omega_c / omega_ref, omega_p2 / omega_ref ** 2
+    )
+    degree = omega_c.size + 3
+
+    kappa2, theta = np.broadcast_arrays(
+        (c.value * k.value / omega_ref) ** 2, theta.to_value(u.rad)
+    )
+    shape = kappa2.shape
+    kappa2 = kappa2.reshape(-1)
+    cos2 = np.cos(theta.reshape(-1)) ** 2
+    sin2 = 1 - cos2
+
+    x = np.empty((kappa2.size, degree))
+    companion = np.zeros((min(kappa2.size, _CHUNK_SIZE), degree, degree))
+    companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1
+    for start in range(0, kappa2.size, _CHUNK_SIZE):
+        chunk = slice(start, start + _CHUNK_SIZE)
+        K2 = kappa2[chunk, np.newaxis]
+        s2 = sin2[chunk, np.newaxis]
+        c2 = cos2[chunk, np.newaxis]
+        coefficients = (
+            K2 ** 2 * (s2 * a1 + c2 * a2) - K2 * (s2 * b1 + (1 + c2) * b2) + c0
+        )
+
+        size = coefficients.shape[0]
+        companion[:size, :, -1] = -coefficients[:, :-1]
+        roots = np.linalg.eigvals(companion[:size]).real
+        x[chunk] = _polish_roots(np.sort(roots, axis=-1), coefficients)
+
+    omega = np.sqrt(np.clip(np.sort(x, axis=-1), 0, None)) * omega_ref
+    return omega.reshape(shape + (degree,)) * u.rad / u.s
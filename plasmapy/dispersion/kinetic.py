@@ -0,0 +1,276 @@
+"""
+Roots of the kinetic dispersion relation of unmagnetized Maxwellian
+plasmas.
+"""
+__all__ = ["kinetic_electrostatic_roots"]
+
+import astropy.units as u
+import numpy as np
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from plasmapy.dispersion.dispersionfunction import _plasma_dispersion_func
+from plasmapy.formulary import parameters
+from plasmapy.utils.decorators import validate_quantities
+
+#: Named tuple for the per-wavenumber convergence diagnostics returned by
+#: :func:`kinetic_electrostatic_roots`.
+KineticRootsDiagnostics = namedtuple(
+    "KineticRootsDiagnostics", ["converged", "iterations", "residual"]
+)
+
+# number of continuation steps used to carry the root from the start of
+# one chunk of wavenumbers to the start of the next before the chunks
+# are refined in parallel
+_SEED_STEPS = 8
+
+
+def _dielectric(omega, k, wp2, vth):
+    r"""
+    Evaluate :math:`\varepsilon(\omega, k)` and
+    :math:`\partial \varepsilon / \partial \omega` for one wavenumber,
+    with the species stacked along the arrays ``wp2`` and ``vth``.
+    """
+    kv = k * vth
+    zeta = omega / kv
+    Z = _plasma_dispersion_func(zeta, "wofz", np.dtype(np.complex128))
+    Z_prime = -2 * (1 + zeta * Z)
+    Z_double_prime = -2 * (Z + zeta * Z_prime)
+    weight = wp2 / kv ** 2
+    epsilon = 1 - np.sum(weight * Z_prime)
+    epsilon_prime = -np.sum(weight * Z_double_prime / kv)
+    return epsilon, epsilon_prime
+
+
+def _newton(omega, k, wp2, vth, rtol, max_iter):
+    """
+    Find a root of the dielectric function at wavenumber ``k`` with
+    Newton's method, starting from ``omega``.
+    """
+    residual = np.inf
+    for iteration in range(1, max_iter + 1):
+        epsilon, epsilon_prime = _dielectric(omega, k, wp2, vth)
+        residual = abs(epsilon)
+        step = epsilon / epsilon_prime
+        omega -= step
+        if abs(step) <= rtol * abs(omega):
+            return omega, True, iteration, residual
+    return omega, False, max_iter, residual
+
+
+def _follow_roots(k, omega_start, omega_before, wp2, vth, rtol, max_iter):
+    """
+    Follow a root of the dielectric function along the wavenumbers
+    ``k`` by continuation.
+
+    ``omega_start`` is an approximate root at ``k[0]``.  If
+    ``omega_before`` is not `None`, it is the pair ``(k, omega)`` of
+    the previous root on the branch, which is used to extrapolate the
+    first guess.
+    """
+    omega = np.empty(k.size, dtype=np.complex128)
+    converged = np.zeros(k.size, dtype=bool)
+    iterations = np.zeros(k.size, dtype=int)
+    residual = np.empty(k.size)
+
+    before = omega_before
+    guess = omega_start
+    for i, k_i in enumerate(k):
+        if i > 0:
+            guess = omega[i - 1]
+            if before is not None:
+                # linear extrapolation from the last two roots on the branch
+                k_before, omega_before = before
+                guess += (omega[i - 1] - omega_before) * (
+                    (k_i - k[i - 1]) / (k[i - 1] - k_before)
+                )
+            before = (k[i - 1], omega[i - 1])
+
+        omega[i], converged[i], iterations[i], residual[i] = _newton(
+            guess, k_i, wp2, vth, rtol, max_iter
+        )
+
+    return omega, converged, iterations, residual
+
+
+@validate_quantities(
+    k={"can_be_negative": False, "can_be_zero": False},
+    T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+    n={"can_be_negative": False},
+    omega_guess={"can_be_complex": True},
+)
+def kinetic_electrostatic_roots(
+    k: u.rad / u.m,
+    species,
+    T: u.K,
+    n: u.m ** -3,
+    omega_guess: u.rad / u.s,
+    rtol: float = 1e-12,
+    max_iter: int = 50,
+    processes: int = None,
+    return_diagnostics: bool = False,
+):
+    r"""
+    Find a branch of complex roots :math:`\omega(k)` of the kinetic
+    electrostatic dispersion relation of an unmagnetized plasma of
+    Maxwellian species.
+
+    Parameters
+    ----------
+    k : ~astropy.units.Quantity
+        One-dimensional array of positive wavenumbers in units
+        convertible to rad/m.  The branch is followed in the order
+        given, so ``k`` should be monotonic and finely enough spaced
+        for the root to change little between neighbouring values.
+
+    species : list of str
+        The plasma particle species, e.g. ``['e', 'p']``.
+
+    T : ~astropy.units.Quantity
+        The temperature of each species, in the order of ``species``,
+        as an array or a scalar for a single species.
+
+    n : ~astropy.units.Quantity
+        The number density of each species, in the order of
+        ``species``, as an array or a scalar for a single species.
+
+    omega_guess : ~astropy.units.Quantity
+        An approximate complex root at ``k[0]`` in units convertible to
+        rad/s, which selects the branch.
+
+    rtol : float, optional
+        Relative tolerance on the Newton update of :math:`\omega`.
+        Defaults to ``1e-12``.
+
+    max_iter : int, optional
+        Maximum number of Newton iterations per wavenumber.  Defaults
+        to ``50``.
+
+    processes : int, optional
+        If given, ``k`` is split into this many contiguous chunks that
+        are solved in parallel by a pool of worker processes.  Defaults
+        to `None`, which solves the whole branch in this process.
+
+    return_diagnostics : bool, optional
+        If `True`, also return the convergence diagnostics of each
+        root.  Defaults to `False`.
+
+    Returns
+    -------
+    omega : ~astropy.units.Quantity
+        The complex frequencies of the roots in rad/s, with the shape of
+        ``k``.
+
+    diagnostics : `KineticRootsDiagnostics`
+        Only returned if ``return_diagnostics`` is `True`.  A named
+        tuple of arrays with the shape of ``k``:
+
+        * ``converged``: whether the Newton iteration met ``rtol``
+        * ``iterations``: the number of Newton iterations taken
+        * ``residual``: :math:`|\varepsilon|` at the last iterate
+          before its final Newton update
+
+    Raises
+    ------
+    ValueError
+        If ``k`` is not one-dimensional, or if ``species``, ``T`` and
+        ``n`` do not have the same length.
+
+    Notes
+    -----
+    The dielectric function is the one of
+    `~plasmapy.formulary.dielectric.permittivity_1D_Maxwellian`, summed
+    over the species,
+
+    .. math::
+        \varepsilon(\omega, k) = 1 - \sum_s
+        \frac{\omega_{p,s}^2}{k^2 v_{Th,s}^2} Z'(\zeta_s),
+        \qquad \zeta_s = \frac{\omega}{k v_{Th,s}},
+
+    where :math:`v_{Th,s}` is the most probable thermal speed.  Its
+    roots are found with Newton's method, using
+    :math:`Z''(\zeta) = -2 \left[ Z(\zeta) + \zeta Z'(\zeta)
+    \right]` for the derivative.  The root at each wavenumber is
+    started from a linear extrapolation of the roots at the two
+    previous wavenumbers, which keeps the iteration on the branch
+    selected by ``omega_guess``.
+
+    With ``processes``, the root at the first wavenumber of each chunk
+    is first obtained by continuation along a subsample of ``k`` with
+    a few steps per chunk, after which the chunks are independent.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> from plasmapy.formulary import parameters
+    >>> n = 1e19 * u.m ** -3
+    >>> T = 1e4 * u.K
+    >>> omega_pe = parameters.plasma_frequency(n, "e")
+    >>> lambda_De = parameters.Debye_length(T, n)
+    >>> k = np.linspace(0.2, 0.5, 31) / lambda_De * u.rad
+    >>> omega = kinetic_electrostatic_roots(k, ["e"], T, n, 1.1 * omega_pe)
+    >>> omega[-1] / omega_pe
+    <Quantity 1.41566...-0.15335...j>
+    """
+    k = k.value
+    species = list(species)
+    T = np.atleast_1d(T.value)
+    n = np.atleast_1d(n.value)
+
+    if k.ndim != 1:
+        raise ValueError("The wavenumbers k must be a one-dimensional array.")
+    if not len(species) == T.size == n.size:
+        raise ValueError("species, T and n must have the same length.")
+
+    vth = np.array(
+        [
+            parameters.thermal_speed(T_s * u.K, s, method="most_probable").value
+            for s, T_s in zip(species, T)
+        ]
+    )
+    wp2 = (
+        np.array(
+            [
+                parameters.plasma_frequency(n_s * u.m ** -3, s).value
+                for s, n_s in zip(species, n)
+            ]
+        )
+        ** 2
+    )
+    omega_start = complex(omega_guess.value)
+
+    if processes is None or processes < 2 or k.size < 2 * processes:
+        results = [_follow_roots(k, omega_start, None, wp2, vth, rtol, max_iter)]
+    else:
+        starts = np.linspace(0, k.size, processes + 1).astype(int)[:-1]
+
+        # seed each chunk by continuation along a subsample of k
+        stride = max(1, (starts[1] - starts[0]) // _SEED_STEPS)
+        coarse = np.union1d(np.arange(0, starts[-1] + 1, stride), starts)
+        seeds = _follow_roots(k[coarse], omega_start, None, wp2, vth, rtol, max_iter)[0]
+
+        chunks = []
+        for start, stop in zip(starts, np.append(starts[1:], k.size)):
+            j = np.searchsorted(coarse, start)
+            before = (k[coarse[j - 1]], seeds[j - 1]) if j > 0 else None
+            chunks.append((k[start:stop], seeds[j], before))
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(
+                    _follow_roots, k_chunk, seed, before, wp2, vth, rtol, max_iter
+                )
+                for k_chunk, seed, before in chunks
+            ]
+            results = [future.result() for future in futures]
+
+    omega, converged, iterations, residual = (
+        np.concatenate(arrays) for arrays in zip(*results)
+    )
+    omega = omega * u.rad / u.s
+
+    if return_diagnostics:
+        return omega, KineticRootsDiagnostics(converged, iterations, residual)
+    return omega
@@ -0,0 +1,98 @@
+"""Tests for the cold-plasma dispersion relation solvers"""
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+from astropy.constants.si import c
+
+from plasmapy.dispersion.cold_plasma import (
+    cold_plasma_n_squared,
+    cold_plasma_omega,
+    ColdPlasmaRefractiveIndex,
+)
+from plasmapy.formulary.dielectric import (
+    cold_plasma_permittivity_LRP,
+    cold_plasma_permittivity_SDP,
+    cold_plasma_permittivity_tensor,
+)
+
+B = 1 * u.T
+species = ["e", "D+", "H+"]
+n = np.array([1, 0.95, 0.05]) * 1e19 * u.m ** -3
+
+
+def wave_determinant(omega, n2, theta):
+    r"""
+    Determinant of the cold-plasma wave equation
+    :math:`\varepsilon - n^2 (I - \hat{k} \hat{k})`, normalized by the
+    size of its terms.
+    """
+    epsilon = cold_plasma_permittivity_tensor(B, species, n, omega).value
+    k_hat = np.stack([np.sin(theta), np.zeros_like(theta), np.cos(theta)], axis=-1)
+    projection = np.eye(3) - k_hat[..., :, np.newaxis] * k_hat[..., np.newaxis, :]
+    M = epsilon - n2[..., np.newaxis, np.newaxis] * projection
+    return np.linalg.det(M) / np.prod(np.abs(M).max(axis=-1), axis=-1)
+
+
+def test_n_squared_limits():
+    """Test parallel and perpendicular propagation against the L, R, P
+    elements."""
+    omega = np.logspace(6, 12, 50) * u.rad / u.s
+    L, R, P = (x.value for x in cold_plasma_permittivity_LRP(B, species, n, omega))
+    S = (R + L) / 2
+
+    parallel = cold_plasma_n_squared(B, species, n, omega, 0 * u.rad)
+    assert isinstance(parallel, ColdPlasmaRefractiveIndex)
+    assert np.allclose(parallel.fast.value, np.minimum(R, L), rtol=1e-10)
+    assert np.allclose(parallel.slow.value, np.maximum(R, L), rtol=1e-10)
+
+    perpendicular = cold_plasma_n_squared(B, species, n, omega, 90 * u.deg)
+    assert np.allclose(perpendicular.fast.value, np.minimum(P, R * L / S), rtol=1e-8)
+    assert np.allclose(perpendicular.slow.value, np.maximum(P, R * L / S), rtol=1e-8)
+
+
+def test_n_squared_grid():
+    """Test that both branches on a (omega, theta) grid solve the wave
+    equation."""
+    omega = np.logspace(6, 12, 200)[:, np.newaxis] * u.rad / u.s
+    theta = np.linspace(0.1, 1.5, 30) * u.rad
+
+    n2 = cold_plasma_n_squared(B, species, n, omega, theta)
+
+    assert n2.fast.shape == n2.slow.shape == (200, 30)
+    assert np.all(n2.fast <= n2.slow)
+    for branch in n2:
+        determinant = wave_determinant(omega, branch.value, theta.value)
+        assert np.all(np.abs(determinant) < 1e-9)
+
+
+def test_omega_roots():
+    """Test that every branch returned by cold_plasma_omega solves the
+    dispersion relation."""
+    k = np.logspace(0, 4, 40)[:, np.newaxis] * u.rad / u.m
+    theta = np.linspace(0.05, 1.5, 20) * u.rad
+
+    omega = cold_plasma_omega(B, species, n, k, theta)
+
+    assert omega.shape == (40, 20, len(species) + 3)
+    assert omega.unit == u.rad / u.s
+    assert np.all(np.diff(omega, axis=-1) >= 0)
+
+    n2 = ((c * k[..., np.newaxis] / omega) ** 2).to_value(u.dimensionless_unscaled)
+    determinant = wave_determinant(omega, n2, theta.value[:, np.newaxis])
+    assert np.all(np.abs(determinant) < 1e-8)
+
+
+def test_omega_parallel():
+    """Test the plasma oscillation branch at parallel propagation."""
+    omega = cold_plasma_omega(B, species, n, [10, 1000] * u.rad / u.m, 0 * u.rad)
+    _, _, P = cold_plasma_permittivity_SDP(B, species, n, omega)
+
+    assert np.all(np.min(np.abs(P), axis=-1) < 1e-8)
+
+
+def test_omega_scalar_parameters():
+    """Test that arrays of B or densities are rejected."""
+    with pytest.raises(ValueError):
+        cold_plasma_omega([1, 2] * u.T, species, n, 1 * u.rad / u.m, 0 * u.rad)
@@ -224,3 +224,106 @@ def test_plasma_dispersion_deriv_errors(w, expected_error):
             f"plasma_dispersion_func_deriv({w}) did not raise "
             f"{expected_error.__name__} as expected."
         )
+
+
+_rng = np.random.default_rng(4242)
+_real_args = np.concatenate(
+    (np.linspace(-30, 30, 6001), _rng.uniform(-1e4, 1e4, 1000), [-20, 20])
+)
+_complex_args = _rng.uniform(-10, 10, 10000) + 1j * _rng.uniform(-3, 10, 10000)
+
+# method, dtype, maximum relative error documented for the backend
+plasma_disp_func_backends_table = [
+    ("weideman", np.complex128, 5e-10),
+    ("weideman", np.complex64, 2e-5),
+    ("table", np.complex128, 1e-11),
+    ("table", np.complex64, 2e-6),
+    ("wofz", np.complex64, 1e-7),
+]
+
+
+@pytest.mark.parametrize("method, dtype, rtol", plasma_disp_func_backends_table)
+def test_plasma_dispersion_func_backends(method, dtype, rtol):
+    """Test that each backend of plasma_dispersion_func agrees with
+    scipy.special.wofz to within its documented accuracy."""
+
+    arguments = [_real_args]
+    if method != "table":
+        arguments.append(_complex_args)
+
+    for w in arguments:
+        expected = plasma_dispersion_func(w)
+        Z = plasma_dispersion_func(w, method=method, dtype=dtype)
+
+        assert Z.dtype == dtype
+        assert Z.shape == w.shape
+        error = np.max(np.abs(Z - expected) / np.abs(expected))
+        assert error < rtol, (
+            f"The maximum relative error of plasma_dispersion_func with "
+            f"method={method!r} and dtype={dtype.__name__} is {error}, "
+            f"which exceeds the documented {rtol}."
+        )
+
+
+@pytest.mark.parametrize("method", ["weideman", "table"])
+def test_plasma_dispersion_func_deriv_backends(method):
+    """Test plasma_dispersion_func_deriv with the fast backends."""
+
+    w = np.linspace(-5, 5, 101).reshape(101, 1) * np.ones((1, 3))
+    Z_deriv = plasma_dispersion_func_deriv(w, method=method)
+    expected = plasma_dispersion_func_deriv(w)
+
+    assert Z_deriv.shape == w.shape
+    assert np.allclose(Z_deriv, expected, atol=1e-9, rtol=5e-9)
+
+
+@pytest.mark.parametrize("method", ["wofz", "weideman", "table"])
+def test_plasma_dispersion_func_scalar(method):
+    """Test that scalar arguments return scalars for every backend."""
+
+    Z = plasma_dispersion_func(1.2 * u.dimensionless_unscaled, method=method)
+
+    assert np.ndim(Z) == 0
+    assert np.isclose(Z, plasma_dispersion_func(1.2), rtol=1e-9)
+
+
+def test_plasma_dispersion_func_table_real_complex():
+    """Test that the table backend accepts complex arrays with zero
+    imaginary part."""
+
+    w = np.array([-1.5, 0, 2.5], dtype=np.complex128)
+
+    assert np.allclose(
+        plasma_dispersion_func(w, method="table"),
+        plasma_dispersion_func(w),
+        rtol=1e-11,
+    )
+
+
+# kwargs
+plasma_disp_func_backend_errors_table = [
+    {"method": "Faddeeva"},
+    {"dtype": np.float64},
+    {"dtype": np.float32},
+]
+
+
+@pytest.mark.parametrize("kwargs", plasma_disp_func_backend_errors_table)
+@pytest.mark.parametrize(
+    "function", [plasma_dispersion_func, plasma_dispersion_func_deriv]
+)
+def test_plasma_dispersion_func_backend_errors(function, kwargs):
+    """Test errors for unrecognized methods and dtypes."""
+
+    with pytest.raises(ValueError):
+        function(0.5, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "function", [plasma_dispersion_func, plasma_dispersion_func_deriv]
+)
+def test_plasma_dispersion_func_table_complex_error(function):
+    """Test that the table backend rejects complex arguments."""
+
+    with pytest.raises(ValueError):
+        function(np.array([0.5, 1 + 1e-3j]), method="table")
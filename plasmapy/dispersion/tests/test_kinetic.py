@@ -0,0 +1,126 @@
+"""Tests for the kinetic electrostatic dispersion relation solver"""
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+from plasmapy.dispersion.dispersionfunction import plasma_dispersion_func_deriv
+from plasmapy.dispersion.kinetic import (
+    _dielectric,
+    kinetic_electrostatic_roots,
+    KineticRootsDiagnostics,
+)
+from plasmapy.formulary import parameters
+from plasmapy.formulary.dielectric import permittivity_1D_Maxwellian
+
+n = 1e19 * u.m ** -3
+T_e = 1e4 * u.K
+T_i = 1e3 * u.K
+omega_pe = parameters.plasma_frequency(n, "e")
+lambda_De = parameters.Debye_length(T_e, n)
+
+
+@pytest.mark.parametrize(
+    "k_lambda_De, expected",
+    [(0.3, 1.1598 - 0.0126j), (0.4, 1.2850 - 0.0661j), (0.5, 1.4157 - 0.1534j)],
+)
+def test_Langmuir_wave_Landau_damping(k_lambda_De, expected):
+    """Test the roots of the Langmuir wave branch against the
+    tabulated Landau damping of an electron plasma."""
+    k = np.linspace(0.2, k_lambda_De, 51) / lambda_De * u.rad
+
+    omega, diagnostics = kinetic_electrostatic_roots(
+        k, ["e"], T_e, n, 1.1 * omega_pe, return_diagnostics=True
+    )
+
+    assert isinstance(diagnostics, KineticRootsDiagnostics)
+    assert np.all(diagnostics.converged)
+    assert omega.unit == u.rad / u.s
+    assert omega.shape == k.shape
+    assert np.isclose((omega[-1] / omega_pe).value, expected, atol=1e-4)
+
+
+def test_roots_are_zeros_of_dielectric():
+    """Test that the roots zero the multi-species dielectric function."""
+    k = np.linspace(0.1, 0.6, 200) / lambda_De * u.rad
+    species = ["e", "He-4 1+"]
+
+    omega = kinetic_electrostatic_roots(
+        k, species, u.Quantity([T_e, T_i]), u.Quantity([n, n]), omega_pe
+    )
+
+    epsilon = 1 + 0j
+    for s, T_s in zip(species, [T_e, T_i]):
+        vth = parameters.thermal_speed(T_s, s, method="most_probable")
+        omega_p = parameters.plasma_frequency(n, s)
+        zeta = (omega / (k * vth)).to(u.dimensionless_unscaled).value
+        alpha2 = (omega_p / (k * vth)).to(u.dimensionless_unscaled).value ** 2
+        epsilon -= alpha2 * plasma_dispersion_func_deriv(zeta)
+
+    assert np.all(np.abs(epsilon) < 1e-10)
+
+
+def test_dielectric_matches_permittivity_1D_Maxwellian():
+    """Test that the dielectric function agrees with
+    permittivity_1D_Maxwellian for real frequencies."""
+    species = ["e", "p"]
+    T = [T_e, T_i]
+    k = 0.3 / lambda_De * u.rad
+    omega = np.linspace(0.01, 2, 7) * omega_pe
+
+    vth = np.array(
+        [
+            parameters.thermal_speed(T_s, s, method="most_probable").value
+            for s, T_s in zip(species, T)
+        ]
+    )
+    wp2 = np.array([parameters.plasma_frequency(n, s).value for s in species]) ** 2
+
+    expected = (
+        1
+        + permittivity_1D_Maxwellian(omega, k, T_e, n, "e")
+        + permittivity_1D_Maxwellian(
+            omega, k, T_i, n, "p", 1 * u.dimensionless_unscaled
+        )
+    )
+    epsilon = [_dielectric(w, k.value, wp2, vth)[0] for w in omega.value]
+
+    assert np.allclose(epsilon, expected.value, rtol=1e-12)
+
+
+def test_processes():
+    """Test that solving chunks of k in worker processes gives the same
+    branch as solving it serially."""
+    k = np.linspace(0.1, 0.6, 400) / lambda_De * u.rad
+    args = (k, ["e", "p"], u.Quantity([T_e, T_i]), u.Quantity([n, n]), omega_pe)
+
+    serial = kinetic_electrostatic_roots(*args)
+    parallel = kinetic_electrostatic_roots(*args, processes=2)
+
+    assert np.allclose(parallel, serial, rtol=1e-10)
+
+
+def test_max_iter():
+    """Test that unconverged roots are reported in the diagnostics."""
+    k = np.linspace(0.2, 0.5, 5) / lambda_De * u.rad
+
+    _, diagnostics = kinetic_electrostatic_roots(
+        k, ["e"], T_e, n, 1.1 * omega_pe, max_iter=1, return_diagnostics=True
+    )
+
+    assert not np.any(diagnostics.converged)
+    assert np.all(diagnostics.iterations == 1)
+
+
+@pytest.mark.parametrize(
+    "k, species, T, n_s",
+    [
+        (np.ones((2, 2)) / lambda_De * u.rad, ["e"], T_e, n),
+        (np.ones(3) / lambda_De * u.rad, ["e", "p"], T_e, u.Quantity([n, n])),
+        (np.ones(3) / lambda_De * u.rad, ["e"], T_e, u.Quantity([n, n])),
+    ],
+)
+def test_errors(k, species, T, n_s):
+    """Test errors for invalid arguments."""
+    with pytest.raises(ValueError):
+        kinetic_electrostatic_roots(k, species, T, n_s, omega_pe)
@@ -2,6 +2,7 @@
 __all__ = [
     "cold_plasma_permittivity_SDP",
     "cold_plasma_permittivity_LRP",
+    "cold_plasma_permittivity_tensor",
     "permittivity_1D_Maxwellian",
 ]
 
@@ -24,6 +25,21 @@ RotatingTensorElements = namedtuple(
 )
 
 
+def _cold_plasma_species_frequencies(B, species, n):
+    """
+    Return the signed gyrofrequencies and the squared plasma frequencies
+    of the species, stacked along the last axis so that they broadcast
+    against ``omega[..., np.newaxis]``.
+    """
+    omega_c = [parameters.gyrofrequency(B=B, particle=s, signed=True) for s in species]
+    omega_p = [
+        parameters.plasma_frequency(n=n_s, particle=s) for s, n_s in zip(species, n)
+    ]
+    omega_c = np.stack(np.broadcast_arrays(*omega_c, subok=True), axis=-1)
+    omega_p = np.stack(np.broadcast_arrays(*omega_p, subok=True), axis=-1)
+    return omega_c, omega_p ** 2
+
+
 @validate_quantities(B={"can_be_negative": False}, omega={"can_be_negative": False})
 def cold_plasma_permittivity_SDP(B: u.T, species, n, omega: u.rad / u.s):
     r"""
@@ -108,15 +124,12 @@ def cold_plasma_permittivity_SDP(B: u.T, species, n, omega: u.rad / u.s):
     >>> P
     <Quantity -4.8903...>
     """
-    S, D, P = 1, 0, 1
+    omega_c, omega_p2 = _cold_plasma_species_frequencies(B, species, n)
+    omega = omega[..., np.newaxis]
 
-    for s, n_s in zip(species, n):
-        omega_c = parameters.gyrofrequency(B=B, particle=s, signed=True)
-        omega_p = parameters.plasma_frequency(n=n_s, particle=s)
-
-        S += -(omega_p ** 2) / (omega ** 2 - omega_c ** 2)
-        D += omega_c / omega * omega_p ** 2 / (omega ** 2 - omega_c ** 2)
-        P += -(omega_p ** 2) / omega ** 2
+    S = 1 - np.sum(omega_p2 / (omega ** 2 - omega_c ** 2), axis=-1)
+    D = np.sum(omega_c / omega * omega_p2 / (omega ** 2 - omega_c ** 2), axis=-1)
+    P = 1 - np.sum(omega_p2 / omega ** 2, axis=-1)
     return StixTensorElements(S, D, P)
 
 
@@ -200,18 +213,107 @@ def cold_plasma_permittivity_LRP(B: u.T, species, n, omega: u.rad / u.s):
     >>> P
     <Quantity -4.8903...>
     """
-    L, R, P = 1, 1, 1
-
-    for s, n_s in zip(species, n):
-        omega_c = parameters.gyrofrequency(B=B, particle=s, signed=True)
-        omega_p = parameters.plasma_frequency(n=n_s, particle=s)
+    omega_c, omega_p2 = _cold_plasma_species_frequencies(B, species, n)
+    omega = omega[..., np.newaxis]
 
-        L += -(omega_p ** 2) / (omega * (omega - omega_c))
-        R += -(omega_p ** 2) / (omega * (omega + omega_c))
-        P += -(omega_p ** 2) / omega ** 2
+    L = 1 - np.sum(omega_p2 / (omega * (omega - omega_c)), axis=-1)
+    R = 1 - np.sum(omega_p2 / (omega * (omega + omega_c)), axis=-1)
+    P = 1 - np.sum(omega_p2 / omega ** 2, axis=-1)
     return RotatingTensorElements(L, R, P)
 
 
+@validate_quantities(
+    B={"can_be_negative": False},
+    omega={"can_be_negative": False},
+    validations_on_return={"can_be_complex": True},
+)
+def cold_plasma_permittivity_tensor(
+    B: u.T, species, n, omega: u.rad / u.s
+) -> u.dimensionless_unscaled:
+    r"""
+    Magnetized Cold Plasma Dielectric Permittivity Tensor.
+
+    The full relative permittivity tensor in the "Stix" frame, ie. with
+    B // z, for any number of species at once.
+
+    The :math:`\exp(-i \omega t)` time-harmonic convention is assumed.
+
+    Parameters
+    ----------
+    B : ~astropy.units.Quantity
+        Magnetic field magnitude in units convertible to tesla.
+
+    species : list of str
+        List of the plasma particle species
+        e.g.: ['e', 'D+'] or ['e', 'D+', 'He+'].
+
+    n : list of ~astropy.units.Quantity
+        `list` of species density in units convertible to per cubic meter
+        The order of the species densities should follow species.
+
+    omega : ~astropy.units.Quantity
+        Electromagnetic wave frequency in rad/s.
+
+    Returns
+    -------
+    epsilon : ~astropy.units.Quantity
+        The complex relative permittivity tensor, with shape
+        ``(..., 3, 3)`` where ``...`` is the broadcast shape of ``B``,
+        ``n`` and ``omega``.
+
+    Notes
+    -----
+    The tensor is
+
+    .. math::
+
+        \frac{\varepsilon}{\varepsilon_0} = \left(\begin{matrix}
+                              S & -i D & 0 \\
+                              +i D & S & 0 \\
+                              0 & 0 & P \end{matrix}\right)
+
+    with the elements of `cold_plasma_permittivity_SDP`.  The species
+    are stacked along an array axis, so the elements of all species
+    and all frequencies are evaluated together.
+
+    References
+    ----------
+    - T.H. Stix, Waves in Plasma, 1992.
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> import numpy as np
+    >>> B = 2*u.T
+    >>> species = ['e', 'D+']
+    >>> n = [1e18*u.m**-3, 1e18*u.m**-3]
+    >>> omega = np.array([3.7e9, 4.6e9])*(2*np.pi)*(u.rad/u.s)
+    >>> epsilon = cold_plasma_permittivity_tensor(B, species, n, omega)
+    >>> epsilon.shape
+    (2, 3, 3)
+    >>> epsilon[0]
+    <Quantity [[ 1.02422...+0.j     ,  0.      -0.39089...j,
+                 0.      +0.j     ],
+               [ 0.      +0.39089...j,  1.02422...+0.j     ,
+                 0.      +0.j     ],
+               [ 0.      +0.j     ,  0.      +0.j     ,
+                -4.8903...+0.j     ]]>
+    """
+    S, D, P = cold_plasma_permittivity_SDP(B, species, n, omega)
+    S, D, P = (
+        element.to_value(u.dimensionless_unscaled)
+        for element in np.broadcast_arrays(S, D, P, subok=True)
+    )
+
+    epsilon = np.zeros(S.shape + (3, 3), dtype=np.complex128)
+    epsilon[..., 0, 0] = S
+    epsilon[..., 1, 1] = S
+    epsilon[..., 0, 1] = -1j * D
+    epsilon[..., 1, 0] = 1j * D
+    epsilon[..., 2, 2] = P
+    return epsilon * u.dimensionless_unscaled
+
+
 @validate_quantities(
     kWave={"none_shall_pass": True}, validations_on_return={"can_be_complex": True}
 )
@@ -12,15 +12,27 @@ __all__ = [
     "Maxwellian_speed_3D",
     "kappa_velocity_1D",
     "kappa_velocity_3D",
+    "KappaDistribution",
+    "MaxwellianDistribution",
+    "VelocityGridDistribution",
+    "sample_Maxwellian_velocity_3D",
+    "sample_kappa_velocity_3D",
 ]
 
 import astropy as astropy
 import numpy as np
 
 from astropy import units as u
-from scipy.special import gamma
+from astropy.constants.si import k_B
+from collections import namedtuple
+from scipy.special import betaincinv, gamma, gammaincinv, gammaln
 
+from plasmapy import particles
 from plasmapy.formulary import parameters
+from plasmapy.utils.decorators import validate_quantities
+
+MaxwellianFit = namedtuple("MaxwellianFit", ["density", "v_drift", "T"])
+KappaFit = namedtuple("KappaFit", ["density", "v_drift", "T", "kappa"])
 
 
 def _v_drift_units(v_drift):
@@ -1060,3 +1072,768 @@ def kappa_velocity_3D(
         return distFunc.to((u.s / u.m) ** 3)
     elif units == "unitless":
         return distFunc
+
+
+def _sample(n, scale, v_drift, seed, mixing=None):
+    """
+    Return ``n`` velocities, shape (n, 3), of normal components of
+    standard deviations ``scale`` times ``mixing`` plus ``v_drift``, all
+    in m/s.  ``mixing`` is a function of the generator returning a
+    factor per velocity, shape (n,).
+
+    The samples are drawn into the returned array and scaled in place,
+    so that no temporary of the size of the output is allocated.
+    """
+    rng = np.random.default_rng(seed)
+    v = np.empty((int(n), 3))
+    rng.standard_normal(out=v)
+    if mixing is not None:
+        v *= mixing(rng)[:, np.newaxis]
+    v *= np.broadcast_to(scale, 3)
+    v += np.broadcast_to(v_drift, 3)
+    return u.Quantity(v, u.m / u.s, copy=False)
+
+
+@validate_quantities(
+    T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+)
+def sample_Maxwellian_velocity_3D(
+    n, T: u.K, particle="e", v_drift: u.m / u.s = 0 * u.m / u.s, seed=None
+):
+    r"""
+    Draw velocities of particles from a drifting, possibly anisotropic,
+    3D Maxwellian distribution.
+
+    Parameters
+    ----------
+    n: int
+        The number of velocities.
+
+    T: ~astropy.units.Quantity
+        The temperature, preferably in Kelvin, or the temperatures along
+        the x, y and z axes, shape (3,).
+
+    particle: str, optional
+        Representation of the particle species (e.g., ``'p'`` for protons,
+        ``'D+'`` for deuterium, or ``'He-4 +1'`` for :math:`He_4^{+1}`
+        (singly ionized helium-4)), which defaults to electrons.
+
+    v_drift: ~astropy.units.Quantity, optional
+        The drift velocity, a scalar or of shape (3,), in units
+        convertible to m/s.
+
+    seed: int or `numpy.random.Generator`, optional
+        Seed of the random number generator, or the generator itself,
+        passed to `numpy.random.default_rng`.
+
+    Returns
+    -------
+    v : ~astropy.units.Quantity
+        The velocities in m/s, shape (n, 3), for example to set the
+        velocities of a `~plasmapy.simulation.particletracker.ParticleTracker`.
+
+    Notes
+    -----
+    The components of the velocity are independent and normally
+    distributed, with means :math:`V_{drift,i}` and variances
+    :math:`k_B T_i / m`, so that they are drawn directly, without
+    rejection.  With a single temperature, the distribution is
+    `Maxwellian_velocity_3D`.
+
+    See also
+    --------
+    Maxwellian_velocity_3D
+    sample_kappa_velocity_3D
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> v = sample_Maxwellian_velocity_3D(
+    ...     1000, [1, 1, 4] * u.eV, particle='p', v_drift=[0, 0, 1e4] * u.m / u.s,
+    ...     seed=0)
+    >>> v.shape
+    (1000, 3)
+    """
+    scale = parameters.thermal_speed(T, particle=particle, method="rms", ndim=1)
+    return _sample(n, scale.si.value, v_drift.si.value, seed)
+
+
+@validate_quantities(
+    T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+)
+def sample_kappa_velocity_3D(
+    n, T: u.K, kappa, particle="e", v_drift: u.m / u.s = 0 * u.m / u.s, seed=None
+):
+    r"""
+    Draw velocities of particles from a drifting, possibly anisotropic,
+    3D Kappa distribution.
+
+    Parameters
+    ----------
+    n: int
+        The number of velocities.
+
+    T: ~astropy.units.Quantity
+        The temperature, preferably in Kelvin, or the temperatures along
+        the x, y and z axes, shape (3,).
+
+    kappa: float
+        The kappa parameter, which must be greater than :math:`3/2`.
+
+    particle: str, optional
+        Representation of the particle species (e.g., ``'p'`` for protons,
+        ``'D+'`` for deuterium, or ``'He-4 +1'`` for :math:`He_4^{+1}`
+        (singly ionized helium-4)), which defaults to electrons.
+
+    v_drift: ~astropy.units.Quantity, optional
+        The drift velocity, a scalar or of shape (3,), in units
+        convertible to m/s.
+
+    seed: int or `numpy.random.Generator`, optional
+        Seed of the random number generator, or the generator itself,
+        passed to `numpy.random.default_rng`.
+
+    Returns
+    -------
+    v : ~astropy.units.Quantity
+        The velocities in m/s, shape (n, 3).
+
+    Raises
+    ------
+    ValueError
+        If kappa is not greater than :math:`3/2`.
+
+    Notes
+    -----
+    The Kappa distribution of `kappa_velocity_3D` is a Gaussian scale
+    mixture: a velocity is a normal vector of standard deviation
+    :math:`v_{Th,\kappa} \sqrt{\kappa / 2 g}` along each axis, where
+    :math:`g` is drawn from the gamma distribution of shape
+    :math:`\kappa - 1/2` and :math:`v_{Th,\kappa}` is the
+    `~plasmapy.formulary.parameters.kappa_thermal_speed`.  It is thus
+    sampled directly, without rejection, and the variance of each
+    component is :math:`k_B T_i / m`, as for a Maxwellian.  The
+    anisotropic distribution is :math:`f \propto (1 + \sum_i v_i^2 /
+    \kappa v_{Th,\kappa,i}^2)^{-(\kappa + 1)}`.
+
+    Each component alone does not follow `kappa_velocity_1D`, whose
+    exponent is :math:`-\kappa`.
+
+    See also
+    --------
+    kappa_velocity_3D
+    sample_Maxwellian_velocity_3D
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> v = sample_kappa_velocity_3D(1000, 1 * u.eV, kappa=4, seed=0)
+    >>> v.shape
+    (1000, 3)
+    """
+    if kappa <= 3 / 2:
+        raise ValueError(f"Must have kappa > 3/2, instead of {kappa}.")
+    n = int(n)
+    scale = parameters.kappa_thermal_speed(T, kappa, particle=particle)
+
+    def mixing(rng):
+        g = rng.standard_gamma(kappa - 1 / 2, size=n)
+        return np.sqrt(kappa / (2 * g), out=g)
+
+    return _sample(n, scale.si.value, v_drift.si.value, seed, mixing)
+
+
+# probabilities at which the speed distribution tables are computed,
+# refined towards 1 to follow the tails
+_TABLE_PROBABILITIES = np.concatenate(
+    [np.linspace(0, 1, 2049)[:-1], 1 - np.geomspace(1 / 2048, 1e-12, 256)[1:]]
+)
+
+
+class _VelocityDistribution:
+    """
+    A velocity distribution depending on the speed relative to its
+    drift velocity, with constants computed once at creation.
+
+    Subclasses set ``_norm``, the normalization constant, and implement
+    ``_profile``, the unnormalized distribution as a function of the
+    squared relative speed, ``_log_moment``, the logarithm of the
+    moments of the relative speed, and ``_ppf``, its exact inverse
+    cumulative distribution.
+    """
+
+    def __init__(self, T, particle, v_drift, ndim, vTh):
+        ndim = int(ndim)
+        if ndim not in self._ndims:
+            raise ValueError(
+                f"{type(self).__name__} is defined in {self._ndims} dimensions, "
+                f"not {ndim}."
+            )
+        self.T = T
+        self.particle = particle
+        self.ndim = ndim
+        self.v_drift = np.broadcast_to(v_drift, (ndim,), subok=True).copy()
+        self.vTh = vTh
+        self._drift = self.v_drift.si.value
+        self._vTh = vTh.si.value
+        self._table = None
+
+    def __call__(self, *v):
+        """
+        Return the probability density at the velocity components ``v``,
+        one per dimension, in m/s.
+
+        The components may be arrays of any broadcastable shapes, of
+        floats or of `~astropy.units.Quantity`, in which case the
+        density is also a `~astropy.units.Quantity`.
+        """
+        if len(v) != self.ndim:
+            raise ValueError(f"Expected {self.ndim} velocity components.")
+        quantity = isinstance(v[0], u.Quantity)
+        w2 = 0
+        for component, drift in zip(v, self._drift):
+            if quantity:
+                component = component.to_value(u.m / u.s)
+            w2 = w2 + (component - drift) ** 2
+        f = self._norm * self._profile(w2)
+        if quantity:
+            return u.Quantity(f, (u.s / u.m) ** self.ndim, copy=False)
+        return f
+
+    def speed_moment(self, k):
+        r"""
+        Return the moment :math:`\langle |\vec{v} - \vec{V}_{drift}|^k
+        \rangle` of the speed relative to the drift velocity.
+
+        Parameters
+        ----------
+        k: float
+            The order of the moment, greater than ``-ndim``.
+
+        Returns
+        -------
+        moment : ~astropy.units.Quantity
+            The moment in units of (m/s)\ :sup:`k`.
+
+        Raises
+        ------
+        ValueError
+            If the moment diverges.
+        """
+        if k <= -self.ndim:
+            raise ValueError(f"The moment of order {k} diverges.")
+        return np.exp(self._log_moment(k)) * (u.m / u.s) ** k
+
+    @property
+    def variance(self):
+        """
+        The variance :math:`k_B T / m` of each velocity component.
+        """
+        return self.speed_moment(2) / self.ndim
+
+    def cdf(self, w):
+        """
+        Return the probability that the speed relative to the drift
+        velocity is below ``w``, in m/s, interpolated in a table computed
+        at the first call.
+        """
+        w2d, q = self._tables()
+        w = w.to_value(u.m / u.s) if isinstance(w, u.Quantity) else np.asarray(w)
+        return np.interp(np.abs(w) ** self.ndim, w2d, q)
+
+    def ppf(self, q):
+        """
+        Return the speed relative to the drift velocity, in m/s, below
+        which the probability is ``q``, the inverse of `cdf`.  The table
+        extends to the probability :math:`1 - 10^{-12}`.
+        """
+        w2d, table = self._tables()
+        return np.interp(q, table, w2d) ** (1 / self.ndim) * u.m / u.s
+
+    def _tables(self):
+        """
+        Return the speeds to the power ``ndim``, in which the cumulative
+        distribution is nearly linear at low speeds, and the probabilities
+        of the tables of `cdf` and `ppf`.
+        """
+        if self._table is None:
+            q = _TABLE_PROBABILITIES
+            self._table = (self._ppf(q) ** self.ndim, q)
+        return self._table
+
+
+class MaxwellianDistribution(_VelocityDistribution):
+    r"""
+    A drifting Maxwellian velocity distribution in 1, 2 or 3 dimensions,
+    with its constants computed once, for repeated evaluations.
+
+    Parameters
+    ----------
+    T: ~astropy.units.Quantity
+        The temperature, preferably in Kelvin.
+
+    particle: str, optional
+        Representation of the particle species (e.g., ``'p'`` for protons,
+        ``'D+'`` for deuterium, or ``'He-4 +1'`` for :math:`He_4^{+1}`
+        (singly ionized helium-4)), which defaults to electrons.
+
+    v_drift: ~astropy.units.Quantity, optional
+        The drift velocity, a scalar or one component per dimension, in
+        units convertible to m/s.
+
+    ndim: int, optional
+        The number of velocity dimensions, ``3`` by default.
+
+    Attributes
+    ----------
+    vTh: ~astropy.units.Quantity
+        The most probable thermal speed.
+
+    Notes
+    -----
+    The distribution is that of `Maxwellian_1D`,
+    `Maxwellian_velocity_2D` and `Maxwellian_velocity_3D`,
+
+    .. math::
+        f = (\pi v_{Th}^2)^{-d/2} e^{-w^2 / v_{Th}^2},
+
+    where :math:`w` is the speed relative to the drift velocity, so that
+    :math:`w^2 / v_{Th}^2` follows the gamma distribution of shape
+    :math:`d/2`, giving the moments
+
+    .. math::
+        \langle w^k \rangle = v_{Th}^k
+        \frac{\Gamma((k + d) / 2)}{\Gamma(d / 2)}.
+
+    Calls with arrays of floats in m/s evaluate the distribution in
+    NumPy only, without validating units.
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> f = MaxwellianDistribution(30000 * u.K, particle='e')
+    >>> f(1 * u.m / u.s, 1 * u.m / u.s, 1 * u.m / u.s)
+    <Quantity 2.0708...e-19 s3 / m3>
+    >>> f.variance
+    <Quantity 4.5469...e+11 m2 / s2>
+    """
+
+    _ndims = (1, 2, 3)
+
+    @validate_quantities(
+        T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+    )
+    def __init__(
+        self, T: u.K, particle="e", v_drift: u.m / u.s = 0 * u.m / u.s, ndim=3
+    ):
+        vTh = parameters.thermal_speed(T, particle=particle, method="most_probable")
+        super().__init__(T, particle, v_drift, ndim, vTh)
+        self._norm = (np.pi * self._vTh ** 2) ** (-ndim / 2)
+        self._inverse_vTh2 = 1 / self._vTh ** 2
+
+    def _profile(self, w2):
+        return np.exp(-w2 * self._inverse_vTh2)
+
+    def _log_moment(self, k):
+        d = self.ndim
+        return k * np.log(self._vTh) + gammaln((k + d) / 2) - gammaln(d / 2)
+
+    def _ppf(self, q):
+        return self._vTh * np.sqrt(gammaincinv(self.ndim / 2, q))
+
+
+class KappaDistribution(_VelocityDistribution):
+    r"""
+    A drifting Kappa velocity distribution in 1 or 3 dimensions, with
+    its constants computed once, for repeated evaluations.
+
+    Parameters
+    ----------
+    T: ~astropy.units.Quantity
+        The temperature, preferably in Kelvin.
+
+    kappa: float
+        The kappa parameter, which must be greater than :math:`3/2`.
+
+    particle: str, optional
+        Representation of the particle species (e.g., ``'p'`` for protons,
+        ``'D+'`` for deuterium, or ``'He-4 +1'`` for :math:`He_4^{+1}`
+        (singly ionized helium-4)), which defaults to electrons.
+
+    v_drift: ~astropy.units.Quantity, optional
+        The drift velocity, a scalar or one component per dimension, in
+        units convertible to m/s.
+
+    ndim: int, optional
+        The number of velocity dimensions, ``3`` by default.
+
+    Attributes
+    ----------
+    vTh: ~astropy.units.Quantity
+        The kappa thermal speed of
+        `~plasmapy.formulary.parameters.kappa_thermal_speed`.
+
+    Raises
+    ------
+    ValueError
+        If kappa is not greater than :math:`3/2`.
+
+    Notes
+    -----
+    The distribution is that of `kappa_velocity_1D` and
+    `kappa_velocity_3D`,
+
+    .. math::
+        f = \frac{\Gamma(p)}{\Gamma(p - d/2) (\pi \kappa
+        v_{Th,\kappa}^2)^{d/2}} \left(1 + \frac{w^2}{\kappa
+        v_{Th,\kappa}^2} \right)^{-p},
+
+    where :math:`w` is the speed relative to the drift velocity and the
+    exponent :math:`p` is :math:`\kappa` in 1D and :math:`\kappa + 1`
+    in 3D.  The gamma functions of the normalization are only evaluated
+    once.  Since :math:`s = w^2 / \kappa v_{Th,\kappa}^2` follows the
+    beta prime distribution of parameters :math:`d/2` and :math:`p -
+    d/2`, the moments are
+
+    .. math::
+        \langle w^k \rangle = (\kappa v_{Th,\kappa}^2)^{k/2}
+        \frac{\Gamma((k + d) / 2) \Gamma(p - (k + d) / 2)}
+        {\Gamma(d / 2) \Gamma(p - d / 2)},
+
+    which diverge for :math:`k \geq 2p - d`.
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> f = KappaDistribution(30000 * u.K, kappa=4, particle='e')
+    >>> f(1 * u.m / u.s, 1 * u.m / u.s, 1 * u.m / u.s)
+    <Quantity 3.7833...e-19 s3 / m3>
+    """
+
+    _ndims = (1, 3)
+
+    @validate_quantities(
+        T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+    )
+    def __init__(
+        self, T: u.K, kappa, particle="e", v_drift: u.m / u.s = 0 * u.m / u.s, ndim=3
+    ):
+        if kappa <= 3 / 2:
+            raise ValueError(f"Must have kappa > 3/2, instead of {kappa}.")
+        vTh = parameters.kappa_thermal_speed(T, kappa, particle=particle)
+        super().__init__(T, particle, v_drift, ndim, vTh)
+        self.kappa = kappa
+        d = self.ndim
+        self._exponent = kappa if d == 1 else kappa + 1
+        self._a = kappa * self._vTh ** 2
+        self._norm = np.exp(
+            gammaln(self._exponent)
+            - gammaln(self._exponent - d / 2)
+            - d / 2 * np.log(np.pi * self._a)
+        )
+
+    def _profile(self, w2):
+        return (1 + w2 / self._a) ** -self._exponent
+
+    def _log_moment(self, k):
+        d = self.ndim
+        if k >= 2 * self._exponent - d:
+            raise ValueError(f"The moment of order {k} diverges.")
+        return (
+            k / 2 * np.log(self._a)
+            + gammaln((k + d) / 2)
+            + gammaln(self._exponent - (k + d) / 2)
+            - gammaln(d / 2)
+            - gammaln(self._exponent - d / 2)
+        )
+
+    def _ppf(self, q):
+        t = betaincinv(self.ndim / 2, self._exponent - self.ndim / 2, q)
+        return np.sqrt(self._a * t / (1 - t))
+
+
+def _quadrature_weights(axis):
+    """Return the trapezoidal quadrature weights of the points of ``axis``."""
+    steps = np.diff(axis)
+    weights = np.zeros(axis.size)
+    weights[:-1] += steps / 2
+    weights[1:] += steps / 2
+    return weights
+
+
+class VelocityGridDistribution:
+    r"""
+    A distribution function sampled on a grid of velocities in 1, 2 or
+    3 dimensions, at any number of spatial points, with its fluid
+    moments computed by quadrature at all points at once.
+
+    Parameters
+    ----------
+    f: ~astropy.units.Quantity or array_like
+        The distribution function, of shape ``(..., n_1, ..., n_d)``,
+        where the last ``d`` axes run along the velocity axes ``v`` and
+        the leading axes over the spatial points.  Typically a phase
+        space density, in s\ :sup:`d` / m\ :sup:`d + 3`.
+
+    *v: ~astropy.units.Quantity
+        The increasing velocities of the grid along each of the ``d``
+        dimensions, in units convertible to m/s.
+
+    particle: str, optional
+        Representation of the particle species (e.g., ``'p'`` for protons,
+        ``'D+'`` for deuterium, or ``'He-4 +1'`` for :math:`He_4^{+1}`
+        (singly ionized helium-4)), which defaults to electrons.
+
+    Raises
+    ------
+    ValueError
+        If there are not 1 to 3 velocity axes, an axis is not increasing,
+        or the shape of ``f`` does not end with the lengths of the axes.
+
+    Notes
+    -----
+    The moments of :math:`f` are integrated with the trapezoidal rule
+    along each axis, so that ``f`` should be negligible at the edges of
+    the grid.  All the moments are the product of the distribution at
+    each spatial point, flattened, with a single matrix of weighted
+    powers of the velocities, one column per moment up to the fourth
+    order, so that all points are integrated in one matrix product.  The
+    powers are taken relative to the center of the grid, limiting the
+    loss of precision when converting them to central moments, with
+    :math:`\vec{w} = \vec{v} - \vec{u}` the velocity relative to the
+    flow :math:`\vec{u}`.
+
+    The temperature tensor and heat flux are
+
+    .. math::
+        T_{ij} = \frac{m}{n k_B} \int w_i w_j f d^d v, \qquad
+        q_i = \frac{m}{2} \int w^2 w_i f d^d v.
+
+    The Maxwellian and kappa fits of `fit_maxwellian` and `fit_kappa`
+    match these moments in closed form instead of fitting the
+    distribution point by point.  Both share the density, flow and
+    temperature :math:`T = T_{ii} / d`, and the kappa parameter matches
+    the normalized fourth moment :math:`R = \langle w^4 \rangle /
+    \langle w^2 \rangle^2` of the kappa distribution of
+    `KappaDistribution`, of exponent :math:`\kappa + (d - 1) / 2` in
+    :math:`d` dimensions,
+
+    .. math::
+        \kappa = \frac{3}{2} + \frac{R d}{R d - d - 2},
+
+    which is infinite, the Maxwellian limit, if :math:`R` does not
+    exceed its Maxwellian value :math:`(d + 2) / d`.  Since the fourth
+    moment of the kappa distribution only converges for :math:`\kappa >
+    5/2`, the estimate is always above :math:`5/2`.
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> v = np.linspace(-5e7, 5e7, 101) * u.m / u.s
+    >>> maxwellian = MaxwellianDistribution(1e5 * u.K, ndim=1)
+    >>> f = 1e19 / u.m ** 3 * maxwellian(v - 1e6 * u.m / u.s)
+    >>> grid = VelocityGridDistribution(f, v)
+    >>> grid.density
+    <Quantity 1.e+19 1 / m3>
+    >>> grid.fit_maxwellian().T
+    <Quantity 100000.0... K>
+    """
+
+    def __init__(self, f, *v, particle="e"):
+        ndim = len(v)
+        if ndim not in (1, 2, 3):
+            raise ValueError(f"Expected 1, 2 or 3 velocity axes, not {ndim}.")
+        self.f = u.Quantity(f)
+        self.v = tuple(u.Quantity(axis).to(u.m / u.s) for axis in v)
+        axes = [np.asarray(axis.value, dtype=float) for axis in self.v]
+        for axis in axes:
+            if axis.ndim != 1 or axis.size < 2 or np.any(np.diff(axis) <= 0):
+                raise ValueError("The velocity axes must be increasing 1D arrays.")
+        grid_shape = tuple(axis.size for axis in axes)
+        if self.f.ndim < ndim or self.f.shape[self.f.ndim - ndim :] != grid_shape:
+            raise ValueError(
+                f"The shape {self.f.shape} of f does not end with the shape "
+                f"{grid_shape} of the velocity grid."
+            )
+        self.ndim = ndim
+        self.particle = particle
+        self.mass = particles.particle_mass(particle)
+        self._axes = axes
+        self._moments = None
+
+    @property
+    def shape(self):
+        """The shape of the spatial points."""
+        return self.f.shape[: self.f.ndim - self.ndim]
+
+    @property
+    def density(self):
+        r"""
+        The density :math:`n = \int f d^d v` at each spatial point, in
+        the units of ``f`` times (m/s)\ :sup:`d`.
+        """
+        return self._get_moments()["density"] * self.f.unit * (u.m / u.s) ** self.ndim
+
+    @property
+    def flow(self):
+        """
+        The mean velocity at each spatial point, of shape ``(..., d)``,
+        `~numpy.nan` where the density vanishes.
+        """
+        return self._get_moments()["flow"] * u.m / u.s
+
+    @property
+    def temperature_tensor(self):
+        """The temperature tensor at each spatial point, of shape ``(..., d, d)``."""
+        mass = self.mass.si.value
+        return mass * self._get_moments()["covariance"] / k_B.value * u.K
+
+    @property
+    def temperature(self):
+        """
+        The temperature at each spatial point, the mean of the diagonal
+        of the temperature tensor.
+        """
+        return np.trace(self.temperature_tensor, axis1=-2, axis2=-1) / self.ndim
+
+    @property
+    def heat_flux(self):
+        r"""
+        The heat flux at each spatial point, of shape ``(..., d)``, in
+        W/m\ :sup:`2` if ``f`` is a phase space density.
+        """
+        moments = self._get_moments()
+        unit = self.f.unit * (u.m / u.s) ** self.ndim * u.kg * (u.m / u.s) ** 3
+        heat_flux = u.Quantity(
+            self.mass.si.value
+            / 2
+            * moments["density"][..., np.newaxis]
+            * moments["heat"],
+            unit,
+        )
+        if unit.is_equivalent(u.W / u.m ** 2):
+            return heat_flux.to(u.W / u.m ** 2)
+        return heat_flux
+
+    def fit_maxwellian(self):
+        """
+        Return the density, flow and temperature of the Maxwellian
+        distribution with the moments of the distribution at each spatial
+        point.
+
+        Returns
+        -------
+        MaxwellianFit
+            The ``density``, ``v_drift``, of shape ``(..., d)``, and
+            ``T`` of the Maxwellian at each spatial point.
+        """
+        return MaxwellianFit(self.density, self.flow, self.temperature)
+
+    def fit_kappa(self):
+        """
+        Return the density, flow, temperature and kappa parameter of the
+        kappa distribution with the moments of the distribution at each
+        spatial point, up to the fourth.
+
+        Returns
+        -------
+        KappaFit
+            The ``density``, ``v_drift``, of shape ``(..., d)``, ``T`` and
+            ``kappa`` of the kappa distribution at each spatial point, with
+            ``kappa`` infinite where the distribution is not more peaked
+            than a Maxwellian.
+        """
+        moments = self._get_moments()
+        d = self.ndim
+        ratio = (
+            moments["fourth"] / np.trace(moments["covariance"], axis1=-2, axis2=-1) ** 2
+        )
+        excess = ratio * d - d - 2
+        kappa = np.divide(
+            ratio * d, excess, out=np.full_like(ratio, np.inf), where=excess > 0
+        )
+        kappa = np.where(np.isnan(ratio), np.nan, kappa + 3 / 2)
+        return KappaFit(self.density, self.flow, self.temperature, kappa)
+
+    def _basis(self):
+        """
+        Return the center of the grid and the matrix of the quadrature
+        weights times the powers of the velocities relative to it, of
+        shape (grid points, moments): the zeroth order, the first order
+        along each axis, the second order for each pair of axes, the
+        squared speed times each axis and the fourth power of the speed.
+        """
+        center = np.array([(axis[0] + axis[-1]) / 2 for axis in self._axes])
+        grids = np.meshgrid(
+            *[axis - c for axis, c in zip(self._axes, center)], indexing="ij"
+        )
+        x = [grid.ravel() for grid in grids]
+        weights = 1
+        for axis in self._axes:
+            weights = np.multiply.outer(weights, _quadrature_weights(axis))
+        weights = weights.ravel()
+        square = sum(component ** 2 for component in x)
+        columns = [weights]
+        columns += [weights * component for component in x]
+        columns += [
+            weights * x[i] * x[j] for i in range(self.ndim) for j in range(i, self.ndim)
+        ]
+        columns += [weights * square * component for component in x]
+        columns.append(weights * square ** 2)
+        return center, np.stack(columns, axis=1)
+
+    def _get_moments(self):
+        """
+        Return the density and the central moments of the velocity at all
+        spatial points, computed at the first call.
+        """
+        if self._moments is not None:
+            return self._moments
+        d = self.ndim
+        center, basis = self._basis()
+        f = np.asarray(self.f.value, dtype=float).reshape(-1, basis.shape[0])
+        raw = f @ basis
+        density = raw[:, 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            raw = raw[:, 1:] / density[:, np.newaxis]
+
+        # the moments relative to the center of the grid, per unit density
+        delta = raw[:, :d]
+        second = np.empty((f.shape[0], d, d))
+        k = d
+        for i in range(d):
+            for j in range(i, d):
+                second[:, i, j] = second[:, j, i] = raw[:, k]
+                k += 1
+        third = raw[:, k : k + d]
+        fourth = raw[:, k + d]
+
+        # the central moments, relative to the flow
+        trace = np.trace(second, axis1=1, axis2=2)
+        delta2 = np.sum(delta ** 2, axis=1)
+        second_delta = np.einsum("pij,pj->pi", second, delta)
+        third_delta = np.sum(third * delta, axis=1)
+        covariance = second - delta[:, :, np.newaxis] * delta[:, np.newaxis, :]
+        heat = (
+            third
+            - 2 * second_delta
+            - delta * trace[:, np.newaxis]
+            + 2 * delta2[:, np.newaxis] * delta
+        )
+        fourth = (
+            fourth
+            + 4 * np.sum(second_delta * delta, axis=1)
+            - 4 * third_delta
+            + 2 * delta2 * trace
+            - 3 * delta2 ** 2
+        )
+
+        shape = self.shape
+        self._moments = {
+            "density": density.reshape(shape),
+            "flow": (delta + center).reshape(shape + (d,)),
+            "covariance": covariance.reshape(shape + (d, d)),
+            "heat": heat.reshape(shape + (d,)),
+            "fourth": fourth.reshape(shape),
+        }
+        return self._moments
@@ -34,12 +34,13 @@ class MagnetoStatics(abc.ABC):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of shape
+            (..., 3) of position vectors
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the shape of `p`
 
         """
 
@@ -80,24 +81,24 @@ class MagneticDipole(MagnetoStatics):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of shape
+            (..., 3) of position vectors
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the shape of `p`
 
         """
         r = p - self.p0
         m = self.moment
+        r_norm = np.linalg.norm(r, axis=-1, keepdims=True)
+        m_dot_r = np.dot(r, m)[..., np.newaxis]
         B = (
             constants.mu0.value
             / 4
             / np.pi
-            * (
-                3 * r * np.dot(m, r) / np.linalg.norm(r) ** 5
-                - m / np.linalg.norm(r) ** 3
-            )
+            * (3 * r * m_dot_r / r_norm ** 5 - m / r_norm ** 3)
         )
         return B * u.T
 
@@ -158,7 +159,8 @@ class GeneralWire(Wire):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of shape
+            (..., 3) of position vectors
         n : int, optional
             Number of segments for Wire calculation
             (defaults to 1000)
@@ -166,7 +168,7 @@ class GeneralWire(Wire):
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the shape of `p`
 
         Notes
         -----
@@ -194,7 +196,7 @@ class GeneralWire(Wire):
             dl = p2 - p1
             p1 = p2
             R = p - (p2 + p1) / 2
-            B += np.cross(dl, R) / np.linalg.norm(R) ** 3
+            B += np.cross(dl, R) / np.linalg.norm(R, axis=-1, keepdims=True) ** 3
         B = B * constants.mu0.value / 4 / np.pi * self.current
         return B * u.T
 
@@ -244,12 +246,13 @@ class FiniteStraightWire(Wire):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of shape
+            (..., 3) of position vectors
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the shape of `p`
 
         Notes
         -----
@@ -266,23 +269,26 @@ class FiniteStraightWire(Wire):
         # foot of perpendicular
         p1, p2 = self.p1, self.p2
         p2_p1 = p2 - p1
-        ratio = np.dot(p - p1, p2_p1) / np.dot(p2_p1, p2_p1)
+        ratio = np.dot(p - p1, p2_p1)[..., np.newaxis] / np.dot(p2_p1, p2_p1)
         pf = p1 + p2_p1 * ratio
 
+        def norm(vector):
+            return np.linalg.norm(vector, axis=-1, keepdims=True)
+
         # angles: theta_1 = <p - p1, p2 - p1>, theta_2 = <p - p2, p2 - p1>
         cos_theta_1 = (
-            np.dot(p - p1, p2_p1) / np.linalg.norm(p - p1) / np.linalg.norm(p2_p1)
+            np.dot(p - p1, p2_p1)[..., np.newaxis] / norm(p - p1) / norm(p2_p1)
         )
         cos_theta_2 = (
-            np.dot(p - p2, p2_p1) / np.linalg.norm(p - p2) / np.linalg.norm(p2_p1)
+            np.dot(p - p2, p2_p1)[..., np.newaxis] / norm(p - p2) / norm(p2_p1)
         )
 
         B_unit = np.cross(p2_p1, p - pf)
-        B_unit = B_unit / np.linalg.norm(B_unit)
+        B_unit = B_unit / norm(B_unit)
 
         B = (
             B_unit
-            / np.linalg.norm(p - pf)
+            / norm(p - pf)
             * (cos_theta_1 - cos_theta_2)
             * constants.mu0.value
             / 4
@@ -338,12 +344,13 @@ class InfiniteStraightWire(Wire):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of shape
+            (..., 3) of position vectors
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the shape of `p`
 
         Notes
         -----
@@ -354,8 +361,8 @@ class InfiniteStraightWire(Wire):
 
         """
         r = np.cross(self.direction, p - self.p0)
-        B_unit = r / np.linalg.norm(r)
-        r = np.linalg.norm(r)
+        B_unit = r / np.linalg.norm(r, axis=-1, keepdims=True)
+        r = np.linalg.norm(r, axis=-1, keepdims=True)
 
         return B_unit / r * constants.mu0.value / 2 / np.pi * self.current * u.T
 
@@ -447,12 +454,13 @@ class CircularWire(Wire):
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            three-dimensional position vector
+            three-dimensional position vector, or an array of shape
+            (..., 3) of position vectors
 
         Returns
         -------
         B : `astropy.units.Quantity`
-            magnetic field at the specified positon
+            magnetic field at the specified positon, with the shape of `p`
 
         Notes
         -----
@@ -475,13 +483,13 @@ class CircularWire(Wire):
             + np.matmul(np.expand_dims(self.axis_y, 1), np.expand_dims(np.cos(t), 0))
         )  # (3, n)
 
-        r = np.expand_dims(p, 1) - pt  # (3, n)
-        r_norm_3 = np.linalg.norm(r, axis=0) ** 3
-        ft = np.cross(dl, r, axisa=0, axisb=0) / np.expand_dims(r_norm_3, 1)  # (n, 3)
+        r = np.expand_dims(p, -2) - pt.T  # (..., n, 3)
+        r_norm_3 = np.linalg.norm(r, axis=-1) ** 3
+        ft = np.cross(dl, r, axisa=0) / np.expand_dims(r_norm_3, -1)  # (..., n, 3)
 
         return (
             np.pi
-            * np.matmul(np.expand_dims(w, 0), ft).squeeze(0)
+            * np.einsum("n,...ni->...i", w, ft)
             * constants.mu0.value
             / 4
             / np.pi
@@ -6,11 +6,240 @@ to be abstracted from the main function interface.
 """
 __all__ = ["Fermi_integral"]
 
+import functools
 import numbers
 import numpy as np
 
+from astropy import units as u
+from scipy.special import gamma, rgamma, zeta
 from typing import Union
 
+# Below _FD_X_LOW the exponential series converges in a few terms and
+# above _FD_X_HIGH the Sommerfeld expansion is accurate to double
+# precision; the trapezoidal rule covers the region in between.
+_FD_X_LOW = -2.0
+_FD_X_HIGH = 40.0
+
+# Step size and number of corrected poles for the trapezoidal rule.
+# With these values the neglected pole contributions are below
+# machine epsilon for all arguments in [_FD_X_LOW, _FD_X_HIGH).
+_FD_STEP = 0.25
+_FD_NPOLES = 4
+
+# The trapezoidal rule makes a few hundred passes over its input, so it
+# is applied in chunks small enough for the temporaries to stay in cache.
+_FD_CHUNK_SIZE = 8192
+
+
+def _eta(s):
+    """Dirichlet eta function for real arguments."""
+    s = np.asarray(s, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta = (1 - 2.0 ** (1 - s)) * zeta(s)
+    return np.where(s == 1, np.log(2), eta)
+
+
+def _horner(coeffs: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Evaluate the polynomial ``sum(coeffs[k] * y**k)``."""
+    result = np.full_like(y, coeffs[-1])
+    for c in coeffs[-2::-1]:
+        result *= y
+        result += c
+    return result
+
+
+@functools.lru_cache()
+def _series_coeffs(j: float, nterms: int) -> np.ndarray:
+    k = np.arange(1, nterms + 1)
+    return (-1.0) ** (k + 1) / k ** (j + 1)
+
+
+@functools.lru_cache()
+def _sommerfeld_coeffs(j: float, nterms: int = 16) -> np.ndarray:
+    k = np.arange(nterms)
+    return 2 * _eta(2 * k) * rgamma(j + 2 - 2 * k)
+
+
+@functools.lru_cache()
+def _taylor_coeffs(j: float, nterms: int = 40) -> np.ndarray:
+    n = np.arange(nterms)
+    return _eta(j + 1 - n) * rgamma(n + 1)
+
+
+@functools.lru_cache()
+def _trapezoid_nodes(orders: tuple):
+    u_max = np.sqrt(_FD_X_HIGH + 45 + 2 * max(orders))
+    u = _FD_STEP * np.arange(np.ceil(u_max / _FD_STEP) + 1)
+    weights = []
+    for j in orders:
+        w = 2 * _FD_STEP * u ** (2 * j + 1) / gamma(j + 1)
+        w[0] /= 2
+        weights.append(w)
+    return np.exp(u ** 2), np.array(weights)
+
+
+def _complex_power(re: np.ndarray, im: np.ndarray, k: int):
+    """Integer power of the complex number ``re + 1j * im``."""
+    if k < 0:
+        abs2 = re ** 2 + im ** 2
+        re, im, k = re / abs2, -im / abs2, -k
+    p_re, p_im = np.ones_like(re), np.zeros_like(im)
+    for _ in range(k):
+        p_re, p_im = p_re * re - p_im * im, p_re * im + p_im * re
+    return p_re, p_im
+
+
+def _Fermi_integral_series(x: np.ndarray, j: float, nterms: int) -> np.ndarray:
+    r"""
+    Exponential series :math:`\sum_k (-1)^{k+1} e^{kx} / k^{j+1}`,
+    which converges rapidly for :math:`x \lesssim -1`.
+    """
+    z = np.exp(x)
+    return z * _horner(_series_coeffs(j, nterms), z)
+
+
+def _Fermi_integral_sommerfeld(x: np.ndarray, j: float) -> np.ndarray:
+    r"""
+    Sommerfeld expansion in powers of :math:`x^{-2}`.  It terminates
+    for integer orders, in which case it is exact once the reflected
+    term :math:`\cos(\pi j) F_j(-x)` is added.
+    """
+    return x ** (j + 1) * _horner(_sommerfeld_coeffs(j), x ** -2)
+
+
+def _Fermi_integral_taylor(x: np.ndarray, j: float) -> np.ndarray:
+    r"""
+    Taylor series about :math:`x = 0`, whose coefficients are
+    :math:`\eta(j + 1 - n) / n!`.  The radius of convergence is
+    :math:`\pi`.
+    """
+    return _horner(_taylor_coeffs(j), x)
+
+
+def _Fermi_integral_trapezoid(x: np.ndarray, orders: tuple) -> list:
+    r"""
+    Pole-corrected trapezoidal rule for half-integer orders.
+
+    With :math:`t = u^2` the integrand becomes
+    :math:`u^{2j+1} / (e^{u^2 - x} + 1)`, which is even and analytic
+    apart from simple poles at :math:`u^2 = x \pm i \pi (2m + 1)`.  The
+    trapezoidal rule over the whole real line is then exact up to the
+    contributions of those poles, which are added back explicitly.
+
+    All ``orders`` share the same nodes and poles, so evaluating several
+    orders at once costs little more than evaluating one.
+    """
+    x = np.ravel(x)
+    integrals = [np.empty_like(x) for _ in orders]
+    for start in range(0, x.size, _FD_CHUNK_SIZE):
+        chunk = slice(start, start + _FD_CHUNK_SIZE)
+        for integral, value in zip(
+            integrals, _Fermi_integral_trapezoid_chunk(x[chunk], orders)
+        ):
+            integral[chunk] = value
+    return integrals
+
+
+def _Fermi_integral_trapezoid_chunk(x: np.ndarray, orders: tuple) -> list:
+    """Apply the trapezoidal rule of `_Fermi_integral_trapezoid` to ``x``."""
+    exp_u2, weights = _trapezoid_nodes(orders)
+    exp_mx = np.exp(-x)
+    integrals = [np.zeros_like(x) for _ in orders]
+    tmp = np.empty_like(x)
+    for i, c in enumerate(exp_u2):
+        np.multiply(exp_mx, c, out=tmp)
+        tmp += 1
+        np.reciprocal(tmp, out=tmp)
+        for integral, w in zip(integrals, weights[:, i]):
+            integral += w * tmp
+
+    # Each pole z in the first quadrant contributes
+    # Re[-4 pi i Res(z) q / (1 - q)] with q = exp(2 pi i z / step) and
+    # Res(z) = -z**(2j) / 2; the remaining poles are its reflections.
+    # Everything is written in real arithmetic, which is much faster
+    # than numpy's complex transcendental functions.
+    corrections = [np.zeros_like(x) for _ in orders]
+    for m in range(_FD_NPOLES):
+        y = np.pi * (2 * m + 1)
+        z_re = np.sqrt(0.5 * (np.hypot(x, y) + x))
+        z_im = 0.5 * y / z_re
+        q_abs = np.exp(-2 * np.pi / _FD_STEP * z_im)
+        q_arg = 2 * np.pi / _FD_STEP * z_re
+        cos_q, sin_q = np.cos(q_arg), np.sin(q_arg)
+        denom = 1 - 2 * q_abs * cos_q + q_abs ** 2
+        ratio_re = q_abs * (cos_q - q_abs) / denom
+        ratio_im = q_abs * sin_q / denom
+        for correction, j in zip(corrections, orders):
+            p_re, p_im = _complex_power(z_re, z_im, int(2 * j))
+            correction -= p_re * ratio_im + p_im * ratio_re
+
+    return [
+        integral + 4 * np.pi / gamma(j + 1) * correction
+        for integral, correction, j in zip(integrals, corrections, orders)
+    ]
+
+
+def _Fermi_integrals(x: np.ndarray, orders: tuple) -> list:
+    """
+    Vectorized Fermi-Dirac integrals of several integer or half-integer
+    orders ``j >= -1/2`` for the same real arguments.
+    """
+    x = np.asarray(x, dtype=float)
+    integrals = [np.empty_like(x) for _ in orders]
+    half_orders = tuple(j for j in orders if not float(j).is_integer())
+
+    if half_orders:
+        low = x < _FD_X_LOW
+        high = x >= _FD_X_HIGH
+        mid = ~(low | high)
+        trapezoid = dict(
+            zip(half_orders, _Fermi_integral_trapezoid(x[mid], half_orders))
+        )
+
+    for integral, j in zip(integrals, orders):
+        if float(j).is_integer():
+            low = x <= -1
+            high = x >= 1
+            mid = ~(low | high)
+            integral[low] = _Fermi_integral_series(x[low], j, 40)
+            integral[high] = _Fermi_integral_sommerfeld(x[high], j) + (-1) ** int(
+                j
+            ) * _Fermi_integral_series(-x[high], j, 40)
+            integral[mid] = _Fermi_integral_taylor(x[mid], j)
+        else:
+            integral[low] = _Fermi_integral_series(x[low], j, 20)
+            integral[high] = _Fermi_integral_sommerfeld(x[high], j)
+            integral[mid] = trapezoid[j]
+
+    return integrals
+
+
+def _Fermi_integral_native(x: np.ndarray, j: float) -> np.ndarray:
+    """
+    Vectorized Fermi-Dirac integral for real arguments and integer or
+    half-integer orders ``j >= -1/2``.
+    """
+    return _Fermi_integrals(x, (j,))[0]
+
+
+def _Fermi_integral_mpmath(x, j):
+    """Fermi-Dirac integral of arbitrary order using `mpmath.polylog`."""
+    try:
+        from mpmath import polylog
+    except (ImportError, ModuleNotFoundError) as e:
+        from plasmapy.optional_deps import mpmath_import_error
+
+        raise mpmath_import_error from e
+
+    def _integral(val, order):
+        return -1 * complex(polylog(order + 1, -np.exp(val)))
+
+    return np.asarray(np.frompyfunc(_integral, 2, 1)(x, j), dtype=complex)
+
+
+def _is_native_order(j) -> bool:
+    return isinstance(j, numbers.Real) and j >= -0.5 and float(2 * j).is_integer()
+
 
 def Fermi_integral(
     x: Union[float, int, complex, np.ndarray], j: Union[float, int, complex, np.ndarray]
@@ -21,7 +250,8 @@ def Fermi_integral(
     Parameters
     ----------
     x : float, int, complex, or ~numpy.ndarray
-        Argument of the Fermi-Dirac integral function.
+        Argument of the Fermi-Dirac integral function.  Arrays may have
+        any shape.
 
     j : float, int, complex, or ~numpy.ndarray
         Order/index of the Fermi-Dirac integral function.
@@ -30,6 +260,8 @@ def Fermi_integral(
     -------
     integral : float, complex, or ~numpy.ndarray
         Complete Fermi-Dirac integral for given argument and order.
+        The result is real for real ``x`` and integer or half-integer
+        ``j >= -1/2``, and complex otherwise.
 
     Raises
     ------
@@ -40,9 +272,6 @@ def Fermi_integral(
         If the argument is a `~astropy.units.Quantity` but is not
         dimensionless.
 
-    ValueError
-        If the argument is not entirely finite.
-
     Notes
     -----
     The `complete Fermi-Dirac integral
@@ -60,35 +289,54 @@ def Fermi_integral(
     .. math::
         F_j (x) = -Li_{j+1}\left(-e^{x}\right)
 
-    Warning: at present this function is limited to relatively small
-    arguments due to limitations in the `~mpmath` package's
-    implementation of `~mpmath.polylog`.
+    For real arguments and the orders that commonly appear in plasma
+    physics (:math:`j = -1/2, 1/2, 3/2, \ldots` and non-negative
+    integers) the integral is evaluated natively with numpy to double
+    precision over the whole real line.  The exponential series
+    :math:`F_j(x) = \sum_{k=1}^\infty (-1)^{k+1} e^{kx} / k^{j+1}` is
+    used for large negative :math:`x` and the Sommerfeld expansion for
+    large positive :math:`x`.  In between, half-integer orders use a
+    trapezoidal rule with explicit pole corrections [1]_, while integer
+    orders use a Taylor series about :math:`x = 0` together with the
+    exact reflection formula.
+
+    On the native path, :math:`x = -\infty` gives 0, :math:`x = \infty`
+    gives :math:`\infty` and NaN gives NaN.  Other orders and complex
+    arguments fall back on `mpmath.polylog`, which is limited to
+    relatively small arguments.
+
+    References
+    ----------
+    .. [1] K. Mohankumar and A. Natarajan, "On the very accurate
+       evaluation of the generalized Fermi-Dirac integrals",
+       Computer Physics Communications 207, 193 (2016).
 
     Examples
     --------
     >>> Fermi_integral(0, 0)
-    (0.6931471805599453-0j)
+    0.6931471805599453
     >>> Fermi_integral(1, 0)
-    (1.3132616875182228-0j)
+    1.313261687518223
     >>> Fermi_integral(1, 1)
-    (1.8062860704447743-0j)
+    1.8062860704447745
+    >>> Fermi_integral(np.array([[-50.0, 0.0], [10.0, 1e3]]), 0.5)
+    array([[1.92874985e-22, 7.65147025e-01],
+           [2.40846570e+01, 2.37883509e+04]])
 
     """
-    try:
-        from mpmath import polylog
-    except (ImportError, ModuleNotFoundError) as e:
-        from plasmapy.optional_deps import mpmath_import_error
-
-        raise mpmath_import_error from e
+    if not isinstance(x, (np.ndarray, numbers.Complex)):
+        raise TypeError(f"Improper type {type(x)} given for argument x.")
+    if isinstance(x, u.Quantity):
+        if x.unit != u.dimensionless_unscaled:
+            raise u.UnitsError(
+                "The argument x of Fermi_integral must be dimensionless if it "
+                "is a Quantity."
+            )
+        x = x.value
 
-    if isinstance(x, (numbers.Integral, numbers.Real, numbers.Complex)):
-        arg = -np.exp(x)
-        integral = -1 * complex(polylog(j + 1, arg))
-        return integral
-    elif isinstance(x, np.ndarray):
-        integral_arr = np.zeros_like(x, dtype="complex")
-        for idx, val in enumerate(x):
-            integral_arr[idx] = -1 * complex(polylog(j + 1, -np.exp(val)))
-        return integral_arr
+    if _is_native_order(j) and not np.iscomplexobj(x):
+        integral = _Fermi_integral_native(x, j)
     else:
-        raise TypeError(f"Improper type {type(x)} given for argument x.")
+        integral = _Fermi_integral_mpmath(x, j)
+
+    return integral[()] if np.ndim(integral) == 0 else integral
@@ -19,6 +19,7 @@ import astropy.units as u
 import numpy as np
 
 from astropy.constants.si import c, e, eps0, h, hbar, k_B, m_e
+from collections import namedtuple
 
 from plasmapy import particles
 from plasmapy.formulary import mathematics
@@ -398,14 +399,24 @@ def Wigner_Seitz_radius(n: u.m ** -3) -> u.m:
     return radius
 
 
-# TODO: remove NotImplementedError and 'doctest: +SKIP' when the following issues are addressed...
-#       https://github.com/PlasmaPy/PlasmaPy/issues/726
-#       https://github.com/astropy/astropy/issues/9721
+#: Named tuple for the per-element convergence diagnostics returned by
+#: :func:`chemical_potential`.
+ChemicalPotentialDiagnostics = namedtuple(
+    "ChemicalPotentialDiagnostics", ["converged", "iterations", "residual"]
+)
+
+
 @validate_quantities(
     n_e={"can_be_negative": False},
     T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
 )
-def chemical_potential(n_e: u.m ** -3, T: u.K) -> u.dimensionless_unscaled:
+def chemical_potential(
+    n_e: u.m ** -3,
+    T: u.K,
+    rtol: float = 1e-14,
+    max_iter: int = 20,
+    return_diagnostics: bool = False,
+):
     r"""
     Calculate the ideal chemical potential.
 
@@ -417,12 +428,33 @@ def chemical_potential(n_e: u.m ** -3, T: u.K) -> u.dimensionless_unscaled:
     T : ~astropy.units.Quantity
         The temperature.
 
+    rtol : float, optional
+        Relative tolerance on :math:`\beta \mu^{ideal}`.  Defaults to
+        ``1e-14``.
+
+    max_iter : int, optional
+        Maximum number of Newton iterations.  Defaults to ``20``.
+
+    return_diagnostics : bool, optional
+        If `True`, also return the convergence diagnostics of each
+        element.  Defaults to `False`.
+
     Returns
     -------
     beta_mu: ~astropy.units.Quantity
         The dimensionless ideal chemical potential. That is the ratio of
         the ideal chemical potential to the thermal energy.
 
+    diagnostics : `ChemicalPotentialDiagnostics`
+        Only returned if ``return_diagnostics`` is `True`.  A named
+        tuple of arrays with the shape of ``beta_mu``:
+
+        * ``converged``: whether the iteration met ``rtol``
+        * ``iterations``: the number of Newton iterations taken
+        * ``residual``: the relative residual
+          :math:`I_{1/2}(\beta \mu) / \chi - 1` of the last iterate
+          before its final Newton update
+
     Raises
     ------
     TypeError
@@ -451,22 +483,20 @@ def chemical_potential(n_e: u.m ** -3, T: u.K) -> u.dimensionless_unscaled:
     energy :math:`\beta = 1/(k_B T)`, and :math:`\mu_a^{ideal}`
     is the ideal chemical potential.
 
-    The definition for the ideal chemical potential is implicit, so it must
-    be obtained numerically by solving for the Fermi integral for values
-    of chemical potential approaching the degeneracy parameter. Since values
-    returned from the Fermi_integral are complex, a nonlinear
-    Levenberg-Marquardt least squares method is used to iteratively approach
-    a value of :math:`\mu` which minimizes
-    :math:`I_{1/2}(\beta \mu_a^{ideal}) - \chi_a`
+    The definition for the ideal chemical potential is implicit, so it
+    is obtained by solving for :math:`\eta = \beta \mu_a^{ideal}` with
+    Newton's method applied to :math:`\ln I_{1/2}(\eta) - \ln \chi_a`,
+    using :math:`d I_{1/2} / d\eta = I_{-1/2}`.  All elements are
+    iterated together as arrays, starting from the fitting formula of
+    `_chemical_potential_interp`, and only elements that have not yet
+    converged are updated.  Since Newton's method converges
+    quadratically, an element is converged once its update falls below
+    :math:`\sqrt{\mathrm{rtol}} \max(1, |\eta|)`; this typically
+    takes two or three iterations.
 
     This function returns :math:`\beta \mu^{ideal}` the dimensionless
     ideal chemical potential.
 
-    Warning: at present this function is limited to relatively small
-    arguments due to limitations in the `~mpmath` package's implementation
-    of `~mpmath.polylog`, which PlasmaPy uses in calculating the Fermi
-    integral.
-
     References
     ----------
     .. [1] Bonitz, Michael. Quantum kinetic theory. Stuttgart: Teubner, 1998.
@@ -474,54 +504,85 @@ def chemical_potential(n_e: u.m ** -3, T: u.K) -> u.dimensionless_unscaled:
     Example
     -------
     >>> from astropy import units as u
-    >>> chemical_potential(n_e=1e21*u.cm**-3,T=11000*u.K)  # doctest: +SKIP
-    <Quantity 2.00039985e-12>
+    >>> chemical_potential(n_e=1e21*u.cm**-3,T=11000*u.K)
+    <Quantity -0.89825143>
+    >>> beta_mu, diagnostics = chemical_potential(
+    ...     [1e19, 1e23] * u.cm ** -3, 11000 * u.K, return_diagnostics=True
+    ... )
+    >>> diagnostics.converged
+    array([ True,  True])
 
     """
-
-    raise NotImplementedError(
-        "This function has been temporarily disabled due to a bug.\n"
-        "Please refer to https://github.com/PlasmaPy/PlasmaPy/issues/726 \n"
-        "and https://github.com/astropy/astropy/issues/9721 "
-        "for progress in fixing it."
-    )
     # deBroglie wavelength
     lambdaDB = thermal_deBroglie_wavelength(T)
     # degeneracy parameter
-    degen = (n_e * lambdaDB ** 3).to(u.dimensionless_unscaled)
-
-    def residual(params, data, eps_data):
-        """Residual function for fitting parameters to Fermi_integral."""
-        alpha = params["alpha"].value
-        # note that alpha = mu / (k_B * T)
-        model = mathematics.Fermi_integral(alpha, 0.5)
-        complexResidue = (data - model) / eps_data
-        return complexResidue.view(np.float)
-
-    # setting parameters for fitting along with bounds
-    alphaGuess = 1 * u.dimensionless_unscaled
-    try:
-        from lmfit import minimize, Parameters
-    except (ImportError, ModuleNotFoundError) as e:
-        from plasmapy.optional_deps import lmfit_import_error
-
-        raise lmfit_import_error from e
-
-    params = Parameters()
-    params.add("alpha", value=alphaGuess, min=0.0)
-    # calling minimize function from lmfit to fit by minimizing the residual
-    data = np.array([degen])  # result of Fermi_integral - degen should be zero
-    eps_data = np.array([1e-15])  # numerical error
-    minFit = minimize(residual, params, args=(data, eps_data))
-    beta_mu = minFit.params["alpha"].value * u.dimensionless_unscaled
+    degen = (n_e * lambdaDB ** 3).to(u.dimensionless_unscaled).value
+
+    # _chemical_potential_interp includes the electron spin degeneracy,
+    # i.e. it solves 2 * I_{1/2} = chi, so doubling the density gives
+    # the matching initial guess for I_{1/2} = chi
+    guess = _chemical_potential_interp(2 * n_e, T).value
+
+    beta_mu, diagnostics = _invert_Fermi_integral_half(degen, guess, rtol, max_iter)
+
+    beta_mu = beta_mu * u.dimensionless_unscaled
+    if return_diagnostics:
+        return beta_mu, diagnostics
     return beta_mu
 
 
-# TODO: decorate with validate_quantities
-# TODO: remove NotImplementedError and 'doctest: +SKIP' when the following issues are addressed...
-#       https://github.com/PlasmaPy/PlasmaPy/issues/726
-#       https://github.com/astropy/astropy/issues/9721
-def _chemical_potential_interp(n_e, T):
+def _invert_Fermi_integral_half(chi, guess, rtol, max_iter):
+    """
+    Solve ``I_{1/2}(eta) = chi`` element-wise by Newton's method on
+    ``ln I_{1/2}``, returning ``eta`` and `ChemicalPotentialDiagnostics`.
+    """
+    chi, guess = np.broadcast_arrays(
+        np.asarray(chi, dtype=float), np.asarray(guess, dtype=float)
+    )
+    shape = chi.shape
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_chi = np.log(chi.ravel())
+
+    eta = np.where(np.isfinite(guess.ravel()), guess.ravel(), log_chi)
+    converged = np.zeros(eta.shape, dtype=bool)
+    iterations = np.zeros(eta.shape, dtype=int)
+    residual = np.full(eta.shape, np.nan)
+
+    # chi = 0 and chi = inf are solved exactly by eta = -inf and +inf
+    exact = np.isinf(log_chi)
+    eta[exact] = log_chi[exact]
+    converged[exact] = True
+    residual[exact] = 0.0
+
+    active = np.flatnonzero(np.isfinite(log_chi))
+    tol = np.sqrt(rtol)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        eta_active = eta[active]
+        integral, derivative = mathematics._Fermi_integrals(eta_active, (0.5, -0.5))
+        log_residual = np.log(integral) - log_chi[active]
+        step = log_residual * integral / derivative
+
+        eta[active] = eta_active - step
+        iterations[active] += 1
+        residual[active] = np.expm1(log_residual)
+
+        done = np.abs(step) <= tol * np.maximum(1, np.abs(eta_active))
+        converged[active[done]] = True
+        active = active[~done]
+
+    diagnostics = ChemicalPotentialDiagnostics(
+        converged.reshape(shape), iterations.reshape(shape), residual.reshape(shape)
+    )
+    return eta.reshape(shape), diagnostics
+
+
+@validate_quantities(
+    n_e={"can_be_negative": False},
+    T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+)
+def _chemical_potential_interp(n_e: u.m ** -3, T: u.K) -> u.dimensionless_unscaled:
     r"""
     Fitting formula for interpolating chemical potential between classical
     and quantum regimes.
@@ -587,24 +648,18 @@ def _chemical_potential_interp(n_e, T):
     Example
     -------
     >>> from astropy import units as u
-    >>> _chemical_potential_interp(n_e=1e23*u.cm**-3, T=11000*u.K)  # doctest: +SKIP
+    >>> _chemical_potential_interp(n_e=1e23*u.cm**-3, T=11000*u.K)
     <Quantity 8.17649>
 
     """
-    raise NotImplementedError(
-        "This function has been temporarily disabled due to a bug.\n"
-        "Please refer to https://github.com/PlasmaPy/PlasmaPy/issues/726 \n"
-        "and https://github.com/astropy/astropy/issues/9721 "
-        "for progress in fixing it."
-    )
     A = 0.25945
     B = 0.072
     b = 0.858
-    theta = k_B * T / Fermi_energy(n_e)
+    theta = (k_B * T / Fermi_energy(n_e)).to(u.dimensionless_unscaled).value
     term1 = -3 / 2 * np.log(theta)
     term2 = np.log(4 / (3 * np.sqrt(np.pi)))
     term3num = A * theta ** (-b - 1) + B * theta ** (-(b + 1) / 2)
     term3den = 1 + A * theta ** (-b)
     term3 = term3num / term3den
     beta_mu = term1 + term2 + term3
-    return beta_mu.to(u.dimensionless_unscaled)
+    return beta_mu * u.dimensionless_unscaled
@@ -64,29 +64,23 @@ def Lorentz_factor(V: u.m / u.s):
     inf
     """
 
-    if not np.all(np.abs(V) <= c):
+    return _Lorentz_factor(V.value)
+
+
+def _Lorentz_factor(V):
+    """
+    Return the Lorentz factor of the speeds or velocity magnitudes ``V``
+    given as a float or an array in m/s, without units.
+    """
+    c_si = c.si.value
+    if not np.all(np.abs(V) <= c_si):
         raise utils.RelativityError(
             "The Lorentz factor cannot be calculated for "
             "speeds faster than the speed of light. "
         )
 
-    if V.size > 1:
-
-        gamma = np.zeros_like(V.value)
-
-        equals_c = np.abs(V) == c
-        is_slow = ~equals_c
-
-        gamma[is_slow] = ((1 - (V[is_slow] / c) ** 2) ** -0.5).value
-        gamma[equals_c] = np.inf
-
-    else:
-        if np.abs(V) == c:
-            gamma = np.inf
-        else:
-            gamma = ((1 - (V / c) ** 2) ** -0.5).value
-
-    return gamma
+    with np.errstate(divide="ignore"):
+        return 1 / np.sqrt(1 - (np.asanyarray(V) / c_si) ** 2)
 
 
 @validate_quantities(
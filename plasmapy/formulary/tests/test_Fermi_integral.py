@@ -2,6 +2,7 @@
 
 # This file contains experimental usage of unicode characters.
 
+import astropy.units as u
 import numpy as np
 import pytest
 
@@ -30,7 +31,7 @@ class Test_Fermi_integral:
         Test Fermi_integral for expected value.
         """
         methodVal = Fermi_integral(self.arg1, self.order1)
-        testTrue = np.isclose(methodVal, self.True1, rtol=1e-16, atol=0.0)
+        testTrue = np.isclose(methodVal, self.True1, rtol=1e-15, atol=0.0)
         errStr = f"Fermi integral value should be {self.True1} and not {methodVal}."
         assert testTrue, errStr
 
@@ -51,7 +52,7 @@ class Test_Fermi_integral:
     def test_array(self):
         """Test Fermi_integral where argument is an array of inputs."""
         methodVals = Fermi_integral(self.args, self.order1)
-        testTrue = np.allclose(methodVals, self.Trues, rtol=1e-16, atol=0.0)
+        testTrue = np.allclose(methodVals, self.Trues, rtol=1e-15, atol=0.0)
         errStr = f"Fermi integral value should be {self.Trues} and not {methodVals}."
         assert testTrue, errStr
 
@@ -62,3 +63,60 @@ class Test_Fermi_integral:
         """
         with pytest.raises(TypeError):
             Fermi_integral([1, 2, 3], self.order1)
+
+    def test_quantity(self):
+        """
+        Test that dimensionless quantities are accepted and that other
+        quantities raise a `~astropy.units.UnitsError`.
+        """
+        assert Fermi_integral(1 * u.dimensionless_unscaled, 0) == Fermi_integral(1, 0)
+        with pytest.raises(u.UnitsError):
+            Fermi_integral(1 * u.m, self.order1)
+
+    def test_real_output(self):
+        """
+        Test that native orders return real values, with scalars for
+        scalar input and the input shape for arrays.
+        """
+        assert np.isrealobj(Fermi_integral(self.arg1, self.order1))
+        assert np.ndim(Fermi_integral(self.arg1, self.order1)) == 0
+        methodVals = Fermi_integral(self.args.reshape(3, 1, 1), self.order1)
+        assert methodVals.shape == (3, 1, 1)
+        assert np.isrealobj(methodVals)
+
+    def test_complex_fallback(self):
+        """
+        Test that orders without a native implementation fall back on
+        `mpmath` and return complex values.
+        """
+        pytest.importorskip("mpmath")
+        methodVals = Fermi_integral(self.args, 0.25)
+        assert np.iscomplexobj(methodVals)
+        assert methodVals.shape == self.args.shape
+
+
+@pytest.mark.parametrize("j", [-0.5, 0.5, 1.5, 2.5, 5.5, 0, 1, 2, 4])
+def test_Fermi_integral_mpmath_reference(j):
+    """
+    Test the native implementation against `mpmath` over arguments
+    spanning the series, trapezoidal and asymptotic regimes.
+    """
+    mpmath = pytest.importorskip("mpmath")
+    x = np.concatenate(
+        (np.linspace(-60, 60, 41), [-2, -1, -1e-8, 0, 1e-8, 1, 39.999, 40, 300])
+    )
+    with mpmath.workdps(45):
+        expected = np.array(
+            [float(mpmath.re(-mpmath.polylog(j + 1, -mpmath.exp(val)))) for val in x]
+        )
+    methodVals = Fermi_integral(x.reshape(10, 5), j).ravel()
+    np.testing.assert_allclose(methodVals, expected, rtol=2e-15, atol=0.0)
+
+
+@pytest.mark.parametrize("j", [0.5, 2])
+def test_Fermi_integral_limits(j):
+    """Test that infinite and NaN arguments are handled gracefully."""
+    methodVals = Fermi_integral(np.array([-np.inf, np.nan, np.inf]), j)
+    assert methodVals[0] == 0
+    assert np.isnan(methodVals[1])
+    assert methodVals[2] == np.inf
@@ -8,6 +8,7 @@ from astropy import units as u
 from ..dielectric import (
     cold_plasma_permittivity_LRP,
     cold_plasma_permittivity_SDP,
+    cold_plasma_permittivity_tensor,
     permittivity_1D_Maxwellian,
     RotatingTensorElements,
     StixTensorElements,
@@ -110,6 +111,46 @@ class Test_ColdPlasmaPermittivity(object):
         )
         assert S.shape == D.shape == P.shape == (50,)
 
+    def test_broadcast_grid(self):
+        """
+        Test that the species are summed for a whole grid of frequencies
+        and densities at once, in agreement with the scalar results.
+        """
+        ns = np.logspace(17, 19, 4) / u.m ** 3
+        omegas = np.linspace(10e6, 100e6, 3)[:, np.newaxis] * u.rad / u.s
+
+        S, D, P = cold_plasma_permittivity_SDP(B, three_species, [ns, ns, ns], omegas)
+        assert S.shape == D.shape == P.shape == (3, 4)
+
+        S_00, D_00, P_00 = cold_plasma_permittivity_SDP(
+            B, three_species, [ns[2], ns[2], ns[2]], omegas[1, 0]
+        )
+        assert np.isclose(S[1, 2], S_00, rtol=1e-14)
+        assert np.isclose(D[1, 2], D_00, rtol=1e-14)
+        assert np.isclose(P[1, 2], P_00, rtol=1e-14)
+
+    def test_tensor(self):
+        """
+        Test the full permittivity tensor against its S, D, P elements.
+        """
+        n_3 = np.array([1, 1, 5 / 100]) * 1e19 / u.m ** 3
+        omegas = np.array([10e6, 55e6]) * u.rad / u.s
+
+        epsilon = cold_plasma_permittivity_tensor(B, three_species, n_3, omegas)
+        S, D, P = cold_plasma_permittivity_SDP(B, three_species, n_3, omegas)
+
+        assert epsilon.shape == (2, 3, 3)
+        assert epsilon.unit == u.dimensionless_unscaled
+        assert np.allclose(epsilon[:, 0, 0], S)
+        assert np.allclose(epsilon[:, 1, 1], S)
+        assert np.allclose(epsilon[:, 0, 1], -1j * D)
+        assert np.allclose(epsilon[:, 1, 0], 1j * D)
+        assert np.allclose(epsilon[:, 2, 2], P)
+        assert np.all(epsilon[:, [0, 1, 2, 2], [2, 2, 0, 1]] == 0)
+
+        # the cold plasma tensor is Hermitian
+        assert np.allclose(epsilon, np.conj(np.swapaxes(epsilon, -1, -2)))
+
 
 class Test_permittivity_1D_Maxwellian:
     @classmethod
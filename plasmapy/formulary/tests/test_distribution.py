@@ -10,12 +10,17 @@ from astropy.constants import c, e, eps0, k_B, m_e, m_p, mu0
 from ..distribution import (
     kappa_velocity_1D,
     kappa_velocity_3D,
+    KappaDistribution,
     Maxwellian_1D,
     Maxwellian_speed_1D,
     Maxwellian_speed_2D,
     Maxwellian_speed_3D,
     Maxwellian_velocity_2D,
     Maxwellian_velocity_3D,
+    MaxwellianDistribution,
+    sample_kappa_velocity_3D,
+    sample_Maxwellian_velocity_3D,
+    VelocityGridDistribution,
 )
 from ..parameters import kappa_thermal_speed, thermal_speed
 
@@ -1391,3 +1396,322 @@ class Test_kappa_velocity_3D(object):
         )
         errStr = f"Distribution function should be {testVal} and not {distFunc}."
         assert np.isclose(distFunc.value, testVal, rtol=1e-5, atol=0.0), errStr
+
+
+def _speed_histogram(v, bins):
+    """
+    Return the probability density of the speeds of ``v`` in ``bins``,
+    and the centers of the bins.
+    """
+    counts, edges = np.histogram(np.linalg.norm(v, axis=1), bins)
+    density = counts / (v.shape[0] * np.diff(edges))
+    return density, 0.5 * (edges[1:] + edges[:-1])
+
+
+# test class for sample_Maxwellian_velocity_3D function:
+
+
+class Test_sample_Maxwellian_velocity_3D(object):
+    @classmethod
+    def setup_class(self):
+        """initializing parameters for tests """
+        self.T = [1, 2, 4] * u.eV
+        self.particle = "p"
+        self.v_drift = [0, -1e4, 3e4] * u.m / u.s
+        self.n = 200000
+
+    def test_moments(self):
+        """
+        Checks the mean and standard deviation of the samples along each
+        axis.
+        """
+        v = sample_Maxwellian_velocity_3D(
+            self.n, self.T, self.particle, self.v_drift, seed=0
+        )
+        assert v.shape == (self.n, 3)
+        std = thermal_speed(self.T, self.particle, method="rms", ndim=1)
+        assert u.allclose(v.mean(axis=0), self.v_drift, atol=0.01 * std.max())
+        assert u.allclose(v.std(axis=0), std, rtol=0.01)
+
+    def test_distribution(self):
+        """
+        Checks the histogram of the speeds against Maxwellian_velocity_3D.
+        """
+        T = 30000 * u.K
+        v = sample_Maxwellian_velocity_3D(self.n, T, seed=1).si.value
+        vTh = thermal_speed(T, "e").si.value
+        density, speed = _speed_histogram(v, np.linspace(0, 2.5 * vTh, 26))
+        f = Maxwellian_velocity_3D(speed, 0, 0, T.value, units="unitless")
+        expected = 4 * np.pi * speed ** 2 * f
+        assert np.allclose(density, expected, rtol=0, atol=0.04 * expected.max())
+
+    def test_seed(self):
+        """Checks that the same seed gives the same samples."""
+        first = sample_Maxwellian_velocity_3D(10, self.T, seed=2)
+        second = sample_Maxwellian_velocity_3D(10, self.T, seed=2)
+        assert np.array_equal(first.value, second.value)
+
+
+# test class for sample_kappa_velocity_3D function:
+
+
+class Test_sample_kappa_velocity_3D(object):
+    @classmethod
+    def setup_class(self):
+        """initializing parameters for tests """
+        self.T = 30000 * u.K
+        self.kappa = 4
+        self.n = 200000
+
+    def test_invalid_kappa(self):
+        """
+        Checks if function raises error when kappa <= 3/2 is passed as an
+        argument.
+        """
+        with pytest.raises(ValueError):
+            sample_kappa_velocity_3D(10, self.T, 3 / 2)
+
+    def test_moments(self):
+        """
+        Checks the drift, and that the variance along each axis is that of
+        a Maxwellian of the same temperatures.
+        """
+        T = [1, 1, 3] * u.eV
+        v_drift = [1e5, 0, 0] * u.m / u.s
+        v = sample_kappa_velocity_3D(self.n, T, 6, v_drift=v_drift, seed=0)
+        std = thermal_speed(T, "e", method="rms", ndim=1)
+        assert u.allclose(v.mean(axis=0), v_drift, atol=0.01 * std.max())
+        assert u.allclose(v.std(axis=0), std, rtol=0.02)
+
+    def test_distribution(self):
+        """Checks the histogram of the speeds against kappa_velocity_3D."""
+        v = sample_kappa_velocity_3D(self.n, self.T, self.kappa, seed=1).si.value
+        vTh = kappa_thermal_speed(self.T, self.kappa, "e").si.value
+        density, speed = _speed_histogram(v, np.linspace(0, 2.5 * vTh, 26))
+        f = kappa_velocity_3D(speed, 0, 0, self.T.value, self.kappa, units="unitless")
+        expected = 4 * np.pi * speed ** 2 * f
+        assert np.allclose(density, expected, rtol=0, atol=0.04 * expected.max())
+
+
+# test class for MaxwellianDistribution:
+
+
+class Test_MaxwellianDistribution(object):
+    @classmethod
+    def setup_class(self):
+        """initializing parameters for tests """
+        self.T = 30000 * u.K
+        self.particle = "e"
+        self.v = np.linspace(-2e6, 2e6, 41)
+        self.v_drift = 1e5
+
+    @pytest.mark.parametrize(
+        "ndim, function",
+        [(1, Maxwellian_1D), (2, Maxwellian_velocity_2D), (3, Maxwellian_velocity_3D)],
+    )
+    def test_values(self, ndim, function):
+        """Checks the values against the distribution functions."""
+        f = MaxwellianDistribution(
+            self.T, self.particle, self.v_drift * u.m / u.s, ndim=ndim
+        )
+        v = [self.v] + [self.v[::-1]] * (ndim - 1)
+        drifts = [self.v_drift] * ndim
+        expected = function(*v, self.T.value, self.particle, *drifts, units="unitless")
+        assert np.allclose(f(*v), expected, rtol=1e-12, atol=0)
+        with_units = f(*(component * u.m / u.s for component in v))
+        assert with_units.unit == (u.s / u.m) ** ndim
+        assert np.allclose(with_units.value, expected, rtol=1e-12, atol=0)
+
+    def test_moments(self):
+        """Checks the analytic moments against the thermal speeds."""
+        f = MaxwellianDistribution(self.T, self.particle)
+        assert u.isclose(
+            f.speed_moment(1), thermal_speed(self.T, self.particle, "mean_magnitude")
+        )
+        assert u.isclose(f.speed_moment(2), thermal_speed(self.T, "e", "rms") ** 2)
+        assert u.isclose(f.variance, (k_B * self.T / m_e).si)
+        assert u.isclose(f.speed_moment(0), 1)
+        with pytest.raises(ValueError):
+            f.speed_moment(-3)
+
+    @pytest.mark.parametrize("ndim", [1, 2, 3])
+    def test_cdf(self, ndim):
+        """Checks the speed tables against numerical integrals."""
+        f = MaxwellianDistribution(self.T, self.particle, ndim=ndim)
+        shell = {1: 2, 2: 2 * np.pi, 3: 4 * np.pi}[ndim]
+        q = np.array([1e-4, 0.1, 0.5, 0.9, 0.999])
+        w = f.ppf(q).si.value
+        integrals = [
+            spint.quad(
+                lambda x: shell * x ** (ndim - 1) * f(x, *[0] * (ndim - 1)), 0, w_i
+            )[0]
+            for w_i in w
+        ]
+        assert np.allclose(integrals, q, rtol=0, atol=1e-5)
+        assert np.allclose(f.cdf(w), q, rtol=0, atol=1e-5)
+        assert f.ppf(0) == 0
+
+    def test_invalid_ndim(self):
+        """Checks if the number of dimensions is checked."""
+        with pytest.raises(ValueError):
+            MaxwellianDistribution(self.T, ndim=4)
+        with pytest.raises(ValueError):
+            MaxwellianDistribution(self.T)(self.v)
+
+
+# test class for KappaDistribution:
+
+
+class Test_KappaDistribution(object):
+    @classmethod
+    def setup_class(self):
+        """initializing parameters for tests """
+        self.T = 30000 * u.K
+        self.kappa = 4
+        self.particle = "e"
+        self.v = np.linspace(-2e6, 2e6, 41)
+        self.v_drift = 1e5
+
+    @pytest.mark.parametrize(
+        "ndim, function", [(1, kappa_velocity_1D), (3, kappa_velocity_3D)]
+    )
+    def test_values(self, ndim, function):
+        """Checks the values against the distribution functions."""
+        f = KappaDistribution(
+            self.T, self.kappa, self.particle, self.v_drift * u.m / u.s, ndim=ndim
+        )
+        v = [self.v] + [self.v[::-1]] * (ndim - 1)
+        drifts = [self.v_drift] * ndim
+        expected = function(
+            *v, self.T.value, self.kappa, self.particle, *drifts, units="unitless"
+        )
+        assert np.allclose(f(*v), expected, rtol=1e-12, atol=0)
+
+    def test_invalid_kappa(self):
+        """
+        Checks if the object cannot be created with kappa <= 3/2.
+        """
+        with pytest.raises(ValueError):
+            KappaDistribution(self.T, 3 / 2)
+        with pytest.raises(ValueError):
+            KappaDistribution(self.T, self.kappa, ndim=2)
+
+    @pytest.mark.parametrize("ndim", [1, 3])
+    def test_moments(self, ndim):
+        """
+        Checks the analytic moments against numerical integrals, and that
+        the variance is that of a Maxwellian of the same temperature.
+        """
+        f = KappaDistribution(self.T, self.kappa, self.particle, ndim=ndim)
+        assert u.isclose(f.variance, (k_B * self.T / m_e).si)
+        shell = {1: 2, 3: 4 * np.pi}[ndim]
+        vTh = f.vTh.si.value
+        for k in (0, 1, 3):
+            # integrated in units of the thermal speed
+            moment = spint.quad(
+                lambda y: shell * y ** (k + ndim - 1) * f(y * vTh, *[0] * (ndim - 1)),
+                0,
+                np.inf,
+            )[0]
+            moment *= vTh ** (k + ndim)
+            assert np.isclose(f.speed_moment(k).si.value, moment, rtol=1e-6)
+        # the moments of order 2 kappa - 1 and above diverge
+        with pytest.raises(ValueError):
+            f.speed_moment(2 * self.kappa - 1)
+        assert np.isfinite(f.speed_moment(2 * self.kappa - 1.1))
+
+    @pytest.mark.parametrize("ndim", [1, 3])
+    def test_cdf(self, ndim):
+        """Checks the speed tables against numerical integrals."""
+        f = KappaDistribution(self.T, self.kappa, self.particle, ndim=ndim)
+        shell = {1: 2, 3: 4 * np.pi}[ndim]
+        q = np.array([1e-4, 0.1, 0.5, 0.9, 0.999])
+        w = f.ppf(q).si.value
+        integrals = [
+            spint.quad(
+                lambda x: shell * x ** (ndim - 1) * f(x, *[0] * (ndim - 1)), 0, w_i
+            )[0]
+            for w_i in w
+        ]
+        assert np.allclose(integrals, q, rtol=0, atol=1e-5)
+        assert np.allclose(f.cdf(w), q, rtol=0, atol=1e-5)
+
+
+# test class for VelocityGridDistribution:
+
+
+class Test_VelocityGridDistribution(object):
+    @classmethod
+    def setup_class(self):
+        """initializing parameters for tests """
+        self.T = [1e5, 2e5] * u.K
+        self.n = [1e19, 3e19] / u.m ** 3
+        self.v_drift = [1e6, -2e6] * u.m / u.s
+        self.v = np.linspace(-1.6e7, 1.6e7, 65) * u.m / u.s
+
+    @pytest.mark.parametrize("ndim", [1, 2, 3])
+    def test_maxwellian_moments(self, ndim):
+        """
+        Checks the moments of drifting Maxwellians at two spatial points.
+        """
+        grids = np.meshgrid(*[self.v] * ndim, indexing="ij")
+        f = [
+            n * MaxwellianDistribution(T, v_drift=v_drift, ndim=ndim)(*grids)
+            for n, T, v_drift in zip(self.n, self.T, self.v_drift)
+        ]
+        grid = VelocityGridDistribution(u.Quantity(f), *[self.v] * ndim)
+        assert grid.shape == (2,)
+        assert u.allclose(grid.density, self.n, rtol=1e-10)
+        expected = np.repeat(self.v_drift[:, np.newaxis], ndim, axis=1)
+        assert u.allclose(grid.flow, expected, rtol=1e-10)
+        tensor = self.T[:, np.newaxis, np.newaxis] * np.eye(ndim)
+        assert u.allclose(grid.temperature_tensor, tensor, rtol=1e-8, atol=1e-3 * u.K)
+        assert grid.heat_flux.unit == u.W / u.m ** 2
+        scale = (self.n * k_B * self.T * np.sqrt(k_B * self.T / m_e)).si.value
+        assert np.allclose(grid.heat_flux.value / scale[:, np.newaxis], 0, atol=1e-8)
+        fit = grid.fit_maxwellian()
+        assert u.allclose(fit.T, self.T, rtol=1e-8)
+        assert np.all(grid.fit_kappa().kappa > 1e4)
+
+    @pytest.mark.parametrize("ndim", [1, 3])
+    def test_kappa_fit(self, ndim):
+        """Checks that the kappa parameter of kappa distributions is recovered."""
+        kappa = np.array([4, 6])
+        # a wider grid for the tails of the kappa distributions
+        v = np.linspace(-2.4e7, 2.4e7, 81) * u.m / u.s
+        grids = np.meshgrid(*[v] * ndim, indexing="ij")
+        f = [KappaDistribution(T, k, ndim=ndim)(*grids) for T, k in zip(self.T, kappa)]
+        fit = VelocityGridDistribution(f, *[v] * ndim).fit_kappa()
+        assert u.allclose(fit.density, 1, rtol=1e-6)
+        assert u.allclose(fit.T, self.T, rtol=1e-4)
+        assert np.allclose(fit.kappa, kappa, rtol=1e-2)
+
+    def test_heat_flux(self):
+        """Checks the heat flux of two beams against its analytic value."""
+        n, v_drift, T = self.n.si.value, self.v_drift.si.value, self.T[0]
+        f = sum(
+            n_s * MaxwellianDistribution(T, v_drift=drift, ndim=1)(self.v)
+            for n_s, drift in zip(self.n, self.v_drift)
+        )
+        grid = VelocityGridDistribution(f, self.v)
+        flow = np.sum(n * v_drift) / n.sum()
+        assert u.isclose(grid.flow[0], flow * u.m / u.s)
+        variance = (k_B * T / m_e).si.value
+        w = v_drift - flow
+        expected = m_e.value / 2 * np.sum(n * (w ** 3 + 3 * w * variance))
+        assert np.isclose(grid.heat_flux[0].value, expected, rtol=1e-8)
+        # the temperature includes the spread of the beams
+        variance += np.sum(n * w ** 2) / n.sum()
+        assert u.isclose(grid.temperature, m_e * variance * u.m ** 2 / u.s ** 2 / k_B)
+
+    def test_invalid_grids(self):
+        """Checks if the grids are checked."""
+        f = np.ones((2, 65))
+        with pytest.raises(ValueError):
+            VelocityGridDistribution(f)
+        with pytest.raises(ValueError):
+            VelocityGridDistribution(f, self.v, self.v)
+        with pytest.raises(ValueError):
+            VelocityGridDistribution(f, self.v[::-1])
+        with pytest.raises(u.UnitConversionError):
+            VelocityGridDistribution(f, self.v.value)
@@ -180,3 +180,27 @@ class Test_CircularWire:
             repr(cw)
             == r"CircularWire(normal=[0. 0. 1.], center=[0. 0. 0.]m, radius=1.0m, current=1.0A)"
         )
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        MagneticDipole(
+            np.array([0, 1, 1]) * u.A * u.m ** 2, np.array([0, 0, 0.2]) * u.m
+        ),
+        FiniteStraightWire(
+            np.array([0, 0, -1]) * u.m, np.array([0.1, 0, 1]) * u.m, 1 * u.A
+        ),
+        InfiniteStraightWire(np.array([0, 1, 0.3]), np.array([0, 0, 0]) * u.m, 1 * u.A),
+        CircularWire(
+            np.array([0, 0.2, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 1 * u.A
+        ),
+    ],
+)
+def test_vectorized_positions(source):
+    "Test that the magnetic field is evaluated at an array of positions"
+    p = np.random.default_rng(0).uniform(1, 2, (4, 5, 3))
+    B = source.magnetic_field(p)
+    expected = [[source.magnetic_field(point).value for point in row] for row in p]
+    assert B.shape == (4, 5, 3)
+    assert np.allclose(B.value, expected, rtol=1e-12, atol=0)
@@ -4,6 +4,7 @@ import pytest
 
 from astropy.constants import c, h
 
+from plasmapy.formulary.mathematics import Fermi_integral
 from plasmapy.utils.exceptions import RelativityError
 
 from ..quantum import (
@@ -156,23 +157,17 @@ class Test_chemical_potential:
         self.n_e = 1e20 * u.cm ** -3
         self.n_e_fail = 1e23 * u.cm ** -3
         self.T = 11604 * u.K
-        self.True1 = 1.234345958778249e-11
+        self.True1 = -3.395592304171268
 
-    @pytest.mark.xfail(
-        reason="see issue https://github.com/PlasmaPy/PlasmaPy/issues/726"
-    )
     def test_known1(self):
         """
         Tests Fermi_integral for expected value.
         """
         methodVal = chemical_potential(self.n_e, self.T)
-        testTrue = u.isclose(methodVal, self.True1, rtol=1e-16, atol=0.0)
+        testTrue = u.isclose(methodVal, self.True1, rtol=1e-14, atol=0.0)
         errStr = f"Chemical potential value should be {self.True1} and not {methodVal}."
         assert testTrue, errStr
 
-    @pytest.mark.xfail(
-        reason="see issue https://github.com/PlasmaPy/PlasmaPy/issues/726"
-    )
     def test_fail1(self):
         """
         Tests if test_known1() would fail if we slightly adjusted the
@@ -187,6 +182,41 @@ class Test_chemical_potential:
         )
         assert testTrue, errStr
 
+    def test_inversion(self):
+        """
+        Tests that the Fermi integral of the result reproduces the
+        degeneracy parameter from the classical to the degenerate regime.
+        """
+        n_e = np.logspace(14, 28, 8)[:, np.newaxis] * u.cm ** -3
+        T = np.logspace(2, 8, 5) * u.K
+        beta_mu, diagnostics = chemical_potential(n_e, T, return_diagnostics=True)
+        degen = (n_e * thermal_deBroglie_wavelength(T) ** 3).to(
+            u.dimensionless_unscaled
+        )
+        assert beta_mu.shape == diagnostics.converged.shape == (8, 5)
+        assert np.all(diagnostics.converged)
+        assert np.all(diagnostics.iterations <= 4)
+        np.testing.assert_allclose(
+            Fermi_integral(beta_mu.value, 0.5), degen.value, rtol=1e-13
+        )
+
+    def test_zero_density(self):
+        """Tests that a vanishing density gives an infinitely negative value."""
+        beta_mu, diagnostics = chemical_potential(
+            [0, 1e20] * u.cm ** -3, self.T, return_diagnostics=True
+        )
+        assert beta_mu[0] == -np.inf
+        assert u.isclose(beta_mu[1], self.True1, rtol=1e-14)
+        assert np.all(diagnostics.converged)
+
+    def test_max_iter(self):
+        """Tests that unconverged elements are reported."""
+        beta_mu, diagnostics = chemical_potential(
+            self.n_e_fail, self.T, max_iter=1, return_diagnostics=True
+        )
+        assert not diagnostics.converged
+        assert diagnostics.iterations == 1
+
 
 class Test__chemical_potential_interp:
     @classmethod
@@ -194,11 +224,8 @@ class Test__chemical_potential_interp:
         """initializing parameters for tests """
         self.n_e = 1e23 * u.cm ** -3
         self.T = 11604 * u.K
-        self.True1 = 7.741256653579105
+        self.True1 = 7.741254037813922
 
-    @pytest.mark.xfail(
-        reason="see issue https://github.com/PlasmaPy/PlasmaPy/issues/726"
-    )
     def test_known1(self):
         """
         Tests Fermi_integral for expected value.
@@ -208,9 +235,6 @@ class Test__chemical_potential_interp:
         errStr = f"Chemical potential value should be {self.True1} and not {methodVal}."
         assert testTrue, errStr
 
-    @pytest.mark.xfail(
-        reason="see issue https://github.com/PlasmaPy/PlasmaPy/issues/726"
-    )
     def test_fail1(self):
         """
         Tests if test_known1() would fail if we slightly adjusted the
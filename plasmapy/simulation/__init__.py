@@ -2,11 +2,30 @@
 __all__ = [
     "AbstractSimulation",
     "AbstractTimeDependentSimulation",
+    "AnalyticFields",
+    "BinaryCollisions",
+    "Checkpoint",
+    "deposit_moments",
+    "ElectrostaticFields",
+    "GriddedFields",
+    "HDF5History",
+    "MemoryHistory",
     "ParticleTracker",
+    "ScheduledSimulation",
 ]
 
 from plasmapy.simulation.abstractions import (
     AbstractSimulation,
     AbstractTimeDependentSimulation,
 )
+from plasmapy.simulation.checkpoint import Checkpoint
+from plasmapy.simulation.collisions import BinaryCollisions
+from plasmapy.simulation.deposition import deposit_moments
+from plasmapy.simulation.fields import (
+    AnalyticFields,
+    ElectrostaticFields,
+    GriddedFields,
+)
+from plasmapy.simulation.history import HDF5History, MemoryHistory
 from plasmapy.simulation.particletracker import ParticleTracker
+from plasmapy.simulation.scheduler import ScheduledSimulation
@@ -0,0 +1,147 @@
+"""
+Checkpoints of a `~plasmapy.simulation.particletracker.ParticleTracker`
+run, from which the run can be restarted.
+"""
+__all__ = ["Checkpoint"]
+
+import numpy as np
+import os
+import queue
+import threading
+
+# entries of a checkpoint holding the arrays of the history, the
+# collisions and the list of diagnostics, saved as "group/name" or
+# "diagnostics/index/name"
+_GROUPS = ("collisions", "history")
+
+
+class Checkpoint:
+    """
+    Periodically save the state of a
+    `~plasmapy.simulation.particletracker.ParticleTracker` run to a
+    file, from which
+    `~plasmapy.simulation.particletracker.ParticleTracker.restart`
+    continues the run.
+
+    Parameters
+    ----------
+    path : str
+        Path of the checkpoint file, which is overwritten by each
+        checkpoint.
+
+    every : int
+        Save a checkpoint every ``every``-th time step.
+
+    Notes
+    -----
+    A checkpoint holds the state of the live particles, the step
+    counter, the exit log, the accumulated values of the diagnostics,
+    the random state of the collisions and the saved history, as plain
+    arrays in the NumPy ``.npz`` format, which is read without
+    unpickling any object.  The state is copied at the end of the time
+    step and handed to a background thread, which writes it to a
+    temporary file and then renames it to ``path``, so that an
+    interrupted run always leaves a complete checkpoint behind.  With an
+    `~plasmapy.simulation.history.HDF5History`, the checkpoint is only
+    renamed once the history up to its time step is in the file.
+
+    Examples
+    --------
+    >>> checkpoint = Checkpoint("run.npz", every=1000)
+    """
+
+    def __init__(self, path, every):
+        every = int(every)
+        if every < 1:
+            raise ValueError("every must be a positive integer.")
+        self.path = os.fspath(path)
+        self.every = every
+        self._thread = None
+        self._error = None
+
+    def open(self, tracker):
+        """
+        Prepare to save checkpoints of a run of ``tracker``.  Called by
+        `~plasmapy.simulation.particletracker.ParticleTracker.run`.
+        """
+        self._error = None
+        # at most one checkpoint waits to be written
+        self._queue = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def update(self, step, tracker):
+        """Save a checkpoint at time step ``step``, if it is due."""
+        if step % self.every == 0:
+            self._check_error()
+            self._queue.put((tracker._checkpoint_state(step), tracker.history._flush()))
+
+    def _write(self):
+        """Write the queued checkpoints until `None`."""
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                state, flushed = item
+                if flushed is not None:
+                    flushed.wait()
+                _write_checkpoint(self.path, state)
+        except Exception as e:  # reported by the simulation thread
+            self._error = e
+            while self._queue.get() is not None:
+                pass
+
+    def _check_error(self):
+        if self._error is not None:
+            raise RuntimeError(
+                f"Writing the checkpoint {self.path} failed."
+            ) from self._error
+
+    def close(self):
+        """Finish writing the checkpoints of a run."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._check_error()
+
+
+def _write_checkpoint(path, state):
+    """Atomically replace the checkpoint file ``path`` with ``state``."""
+    arrays = {
+        name: value
+        for name, value in state.items()
+        if name not in _GROUPS + ("diagnostics",)
+    }
+    for group in _GROUPS:
+        for name, value in state[group].items():
+            arrays[f"{group}/{name}"] = value
+    for i, diagnostic in enumerate(state["diagnostics"]):
+        for name, value in diagnostic.items():
+            arrays[f"diagnostics/{i}/{name}"] = value
+    arrays["diagnostics"] = len(state["diagnostics"])
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        np.savez(file, **arrays)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def _read_checkpoint(path):
+    """Return the state saved in the checkpoint file ``path``."""
+    state = {group: {} for group in _GROUPS}
+    with np.load(path) as arrays:
+        diagnostics = [{} for _ in range(int(arrays["diagnostics"]))]
+        for key in arrays.files:
+            group, _, name = key.partition("/")
+            if group == "diagnostics" and name:
+                index, _, name = name.partition("/")
+                diagnostics[int(index)][name] = arrays[key]
+            elif name:
+                state[group][name] = arrays[key]
+            else:
+                state[key] = arrays[key]
+    state["diagnostics"] = diagnostics
+    return state
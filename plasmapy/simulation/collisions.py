@@ -0,0 +1,305 @@
+"""
+Monte Carlo binary Coulomb collisions between the particles of a
+`~plasmapy.simulation.particletracker.ParticleTracker`.
+"""
+__all__ = ["BinaryCollisions"]
+
+import astropy.units as u
+import json
+import numpy as np
+
+from astropy import constants
+
+from plasmapy.formulary.collisions import Coulomb_logarithm
+from plasmapy.particles import atomic, Particle
+from plasmapy.simulation.deposition import _uniform_steps
+
+
+class BinaryCollisions:
+    r"""
+    Binary Coulomb collisions of the particles of a
+    `~plasmapy.simulation.particletracker.ParticleTracker`, paired at
+    random within the cells of a grid with the Monte Carlo method of
+    Takizuka and Abe [1]_.
+
+    Parameters
+    ----------
+    plasma : `~plasmapy.plasma.sources.Plasma3D`
+        The plasma whose uniformly spaced grid points are the corners of
+        the collision cells.  Particles outside of the grid collide in
+        the nearest cell.
+
+    every : int, optional
+        Collide the particles every ``every``-th time step, over
+        ``every`` time steps at once.  Defaults to ``1``.
+
+    coulomb_log : float, optional
+        The Coulomb logarithm of all collisions.  Defaults to `None`, in
+        which case it is computed in each cell by
+        `~plasmapy.formulary.collisions.Coulomb_logarithm` from the local
+        density and temperature of the particles.
+
+    seed : int, optional
+        Seed of the random number generator.
+
+    Notes
+    -----
+    Each time the particles collide, the particles of each cell are
+    paired at random, whatever their species, and each pair collides
+    once over the time :math:`\Delta t`.  In a cell with an odd number
+    of particles, three of them collide with each other over
+    :math:`\Delta t / 2`.  The relative velocity :math:`\mathbf{u}` of a
+    pair of species :math:`a` and :math:`b` is rotated by the angle
+    :math:`\theta` about a random axis, with :math:`\delta = \tan(\theta
+    / 2)` drawn from a normal distribution of variance
+
+    .. math::
+        \langle \delta^2 \rangle = \frac{q_a^2 q_b^2 n \ln \Lambda}
+        {8 \pi \epsilon_0^2 \mu^2 u^3} \Delta t,
+
+    where :math:`\mu` is the reduced mass of the pair and :math:`n` the
+    density of the particles of all species in the cell, the rate at
+    which a particle meets a partner of each species.  The velocities
+    of the pair change by :math:`\pm \mu \Delta \mathbf{u} / m`, which
+    conserves their momentum and kinetic energy exactly, provided that
+    the macroparticles of all species represent the same number of
+    particles.  The Coulomb logarithm is computed for the temperature of
+    all particles in the cell, in the frame of the mean velocity of each
+    species, and the density of its electrons, or the charge density of
+    its ions if no electrons are tracked.
+
+    The scattering is valid for small angles, so that
+    ``every * dt`` must be short compared to the collision time.  The
+    particles are paired by sorting a random permutation of them by
+    cell, so that all cells are processed at once.  The nonrelativistic
+    collisions change the velocity of the relativistic pushers, whose
+    proper velocity is then recomputed, and particles advanced by the
+    guiding-center pusher cannot collide.
+
+    References
+    ----------
+    .. [1] T. Takizuka, H. Abe, "A binary collision model for plasma
+           simulation with a particle code", Journal of Computational
+           Physics 25, 205 (1977)
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> from plasmapy.plasma.sources import Plasma3D
+    >>> x = np.linspace(0, 1, 5) * u.m
+    >>> collisions = BinaryCollisions(Plasma3D(x, x, x), every=10, seed=0)
+    >>> collisions.shape
+    (4, 4, 4)
+    """
+
+    def __init__(self, plasma, every=1, coulomb_log=None, seed=None):
+        every = int(every)
+        if every < 1:
+            raise ValueError("every must be a positive integer.")
+        axes = (plasma.x.si.value, plasma.y.si.value, plasma.z.si.value)
+        self._step = np.array(_uniform_steps(axes))
+        self._lower = np.array([axis[0] for axis in axes])
+        #: The number of collision cells along each axis.
+        self.shape = tuple(axis.size - 1 for axis in axes)
+        self.every = every
+        self.coulomb_log = coulomb_log
+        self._rng = np.random.default_rng(seed)
+
+    def open(self, tracker):
+        """
+        Prepare to collide the particles of ``tracker``.  Called by
+        `~plasmapy.simulation.particletracker.ParticleTracker.run`.
+        """
+        if tracker.pusher == "guiding_center" or (
+            tracker.magnetization_threshold is not None
+        ):
+            raise ValueError("Particles advanced as guiding centers cannot collide.")
+        species = tracker.species
+        scaling = np.broadcast_to(tracker.scaling, len(species))
+        if np.any(scaling != scaling[0]):
+            raise ValueError("All colliding species must have the same scaling.")
+
+        charge = np.array([atomic.integer_charge(s) for s in species], dtype=float)
+        mass = u.Quantity([atomic.particle_mass(s) for s in species]).si.value
+        a, b = np.meshgrid(
+            np.arange(len(species)), np.arange(len(species)), indexing="ij"
+        )
+        reduced = mass[a] * mass[b] / (mass[a] + mass[b])
+        # the coefficient of the variance of tan(theta / 2), and the
+        # share of the change of the relative velocity of each particle,
+        # indexed by the species of the particle and of its partner
+        self._coefficient = (charge[a] * charge[b] * constants.e.si.value ** 2) ** 2 / (
+            8 * np.pi * constants.eps0.si.value ** 2 * reduced ** 2
+        )
+        self._share = reduced / mass[a]
+        self._species = list(species)
+        self._charge = charge
+        self._mass = mass
+        self._electrons = np.array([Particle(s) == "e-" for s in species])
+        self._weight = float(scaling[0])
+
+    def update(self, step, tracker):
+        """Collide the particles of ``tracker`` at time step ``step``."""
+        v = tracker._v
+        n = v.shape[0]
+        if n < 2:
+            return
+        counts = [
+            particles.stop - particles.start
+            for particles in tracker.species_slices.values()
+        ]
+        species = np.repeat(np.arange(len(counts)), counts)
+        cells = self._cells(tracker._x)
+        size = int(np.prod(self.shape))
+        number = np.bincount(cells, minlength=size)
+        density = number * self._weight / np.prod(self._step)
+        log = self._coulomb_log(v, species, cells, number)
+
+        # the particles grouped by cell, in a random order within each
+        # cell; the stable sort is a radix sort for up to 2 ** 16 cells
+        order = self._rng.permutation(n)
+        order = order[
+            np.argsort(cells[order].astype(np.min_scalar_type(size - 1)), kind="stable")
+        ]
+        cells = cells[order]
+        first = np.cumsum(number) - number
+        rank = np.arange(n) - first[cells]
+        # in cells with an odd number of particles, the first three
+        # collide with each other and the others in pairs
+        offset = 3 * (number[cells] % 2)
+        pairs = np.flatnonzero((rank >= offset) & ((rank - offset) % 2 == 0))
+        triangles = first[(number % 2 == 1) & (number >= 3)]
+
+        def collide(i, j, duration):
+            """Collide the particles ``i`` and ``j`` of the sorted order."""
+            a, b = order[i], order[j]
+            sa, sb = species[a], species[b]
+            cell = cells[i]
+            if np.ndim(log):
+                factor = log[sa, sb, cell] * density[cell] * duration
+            else:
+                factor = log * density[cell] * duration
+            self._collide(v, a, b, sa, sb, factor)
+
+        dt = self.every * tracker.dt.si.value
+        # the pairs and the first collision of the triangles, which are
+        # all distinct particles, then the other two triangle collisions
+        duration = np.full(pairs.size + triangles.size, dt)
+        duration[pairs.size :] = dt / 2
+        first_particles = np.concatenate([pairs, triangles])
+        collide(first_particles, first_particles + 1, duration)
+        collide(triangles + 1, triangles + 2, dt / 2)
+        collide(triangles + 2, triangles, dt / 2)
+
+        if tracker.pusher != "boris":
+            tracker._set_proper_velocity()
+
+    def _cells(self, x):
+        """Return the flat index of the cell of each particle at ``x``."""
+        index = np.floor((x - self._lower) / self._step).astype(np.intp)
+        np.clip(index, 0, np.array(self.shape) - 1, out=index)
+        return np.ravel_multi_index(index.T, self.shape)
+
+    def _coulomb_log(self, v, species, cells, number):
+        """
+        Return the Coulomb logarithm of the collisions in each cell, per
+        pair of species, shape (species, species, cells), or a float if
+        it is fixed.
+        """
+        if self.coulomb_log is not None:
+            return float(self.coulomb_log)
+        n_species = self._mass.size
+        size = number.size
+        key = species * size + cells
+        count = np.bincount(key, minlength=n_species * size).reshape(n_species, size)
+        total = np.array(
+            [
+                np.bincount(key, weights=v[:, i], minlength=n_species * size)
+                for i in range(3)
+            ]
+        ).reshape(3, n_species, size)
+        square = np.bincount(
+            key, weights=np.einsum("ij,ij->i", v, v), minlength=n_species * size
+        ).reshape(n_species, size)
+        # twice the thermal energy of each species in each cell
+        with np.errstate(invalid="ignore", divide="ignore"):
+            thermal = square - np.sum(total ** 2, axis=0) / count
+        thermal = np.where(count > 0, thermal, 0) * self._mass[:, np.newaxis]
+        temperature = thermal.sum(axis=0) / (
+            3 * constants.k_B.si.value * np.maximum(number, 1)
+        )
+
+        density = count * self._weight / np.prod(self._step)
+        if self._electrons.any():
+            electron_density = density[self._electrons].sum(axis=0)
+        else:
+            electron_density = np.abs(self._charge) @ density
+
+        log = np.zeros((n_species, n_species, size))
+        active = (number >= 2) & (temperature > 0) & (electron_density > 0)
+        if not active.any():
+            return log
+        for a in range(n_species):
+            for b in range(a, n_species):
+                log[a, b, active] = log[b, a, active] = Coulomb_logarithm(
+                    temperature[active] * u.K,
+                    electron_density[active] / u.m ** 3,
+                    (self._species[a], self._species[b]),
+                )
+        return log
+
+    def _collide(self, v, a, b, sa, sb, factor):
+        """
+        Collide the particles ``a`` of species ``sa`` with the distinct
+        particles ``b`` of species ``sb``, updating the velocities ``v``.
+        ``factor`` is the product of the Coulomb logarithm, the density
+        and the duration of each collision.
+        """
+        if not a.size:
+            return
+        relative = v[a] - v[b]
+        speed = np.sqrt(np.einsum("ij,ij->i", relative, relative))
+        variance = self._coefficient[sa, sb] * factor
+        variance = np.divide(
+            variance, speed ** 3, out=np.zeros_like(speed), where=speed > 0
+        )
+        delta = self._rng.standard_normal(a.size) * np.sqrt(variance)
+        phi = 2 * np.pi * self._rng.random(a.size)
+
+        sin_theta = 2 * delta / (1 + delta ** 2)
+        one_minus_cos = 2 * delta ** 2 / (1 + delta ** 2)
+        sin_cos = sin_theta * np.cos(phi)
+        sin_sin = sin_theta * np.sin(phi)
+        ux, uy, uz = relative.T
+        perpendicular = np.hypot(ux, uy)
+        # along z, the rotation axis is taken in the x-y plane
+        along_z = perpendicular == 0
+        p = np.where(along_z, 1, perpendicular)
+        change = np.empty_like(relative)
+        change[:, 0] = np.where(
+            along_z, speed * sin_cos, (ux * uz * sin_cos - uy * speed * sin_sin) / p
+        )
+        change[:, 1] = np.where(
+            along_z, speed * sin_sin, (uy * uz * sin_cos + ux * speed * sin_sin) / p
+        )
+        change[:, 2] = -perpendicular * sin_cos
+        change -= relative * one_minus_cos[:, np.newaxis]
+
+        v[a] += self._share[sa, sb][:, np.newaxis] * change
+        v[b] -= self._share[sb, sa][:, np.newaxis] * change
+
+    def _state(self):
+        """Return the state of the random number generator, to be checkpointed."""
+        return {"rng": np.array(json.dumps(self._rng.bit_generator.state))}
+
+    def _resume(self, tracker, state):
+        """
+        Prepare to continue colliding the particles of ``tracker`` from
+        the checkpointed ``state``.
+        """
+        self.open(tracker)
+        rng_state = json.loads(str(state["rng"]))
+        bit_generator = getattr(np.random, rng_state["bit_generator"])()
+        bit_generator.state = rng_state
+        self._rng = np.random.Generator(bit_generator)
@@ -0,0 +1,318 @@
+"""
+Deposition of particle quantities onto the grid of a
+`~plasmapy.plasma.sources.Plasma3D`, to compute the fluid moments of
+the particles.
+"""
+__all__ = ["deposit_moments", "Moments"]
+
+import astropy.units as u
+import itertools
+import numpy as np
+
+from collections import namedtuple
+
+from plasmapy.utils.decorators import validate_quantities
+
+# number of grid points along each axis to which a particle contributes
+_SHAPES = {"ngp": 1, "cic": 2, "tsc": 3}
+
+# upper triangle of the symmetric second moments
+_PAIRS = [(i, j) for i in range(3) for j in range(i, 3)]
+
+Moments = namedtuple(
+    "Moments", ["number_density", "mass_density", "momentum_density", "pressure"]
+)
+Moments.__doc__ = "Fluid moments of particles on the grid of a plasma."
+
+
+def _uniform_steps(axes):
+    """
+    Return the spacing of the grid points along each of the ``axes``,
+    raising a `ValueError` if they are not uniformly spaced.
+    """
+    steps = [(axis[-1] - axis[0]) / (axis.size - 1) for axis in axes]
+    for axis, step in zip(axes, steps):
+        if not (
+            axis.size >= 2
+            and step > 0
+            and np.allclose(np.diff(axis), step, rtol=1e-10, atol=0)
+        ):
+            raise ValueError("The grid must be uniformly spaced.")
+    return steps
+
+
+class _Deposit:
+    """
+    Deposition of per-particle quantities onto a grid with uniformly
+    spaced ``axes``, with the particle ``shape`` ``"ngp"`` (nearest grid
+    point), ``"cic"`` (cloud in cell) or ``"tsc"`` (triangular shaped
+    cloud).
+
+    If ``periodic``, the last points along each axis are the periodic
+    images of the first ones, so that the period is the extent of the
+    axis, and the deposited sums are returned on the other points only.
+    Otherwise, the parts of the particle shapes outside of the grid are
+    dropped.
+
+    The particles are processed in chunks of ``chunk_size`` with work
+    arrays and sums allocated once.  The grid points and weights of all
+    the points to which the particles of a chunk contribute are
+    concatenated, so that each quantity is accumulated with a single
+    `numpy.bincount` per chunk.
+    """
+
+    def __init__(self, axes, shape="cic", periodic=False, chunk_size=2 ** 17):
+        if shape not in _SHAPES:
+            raise ValueError(
+                f"Unknown particle shape {shape!r}, expected one of "
+                f"{', '.join(_SHAPES)}."
+            )
+        steps = _uniform_steps(axes)
+        if int(chunk_size) < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        self.periodic = periodic
+        self.shape = tuple(axis.size - 1 if periodic else axis.size for axis in axes)
+        self.chunk_size = int(chunk_size)
+        self._order = _SHAPES[shape]
+        self._lower = np.array([axis[0] for axis in axes])
+        self._step = np.array(steps)
+        self._strides = (self.shape[1] * self.shape[2], self.shape[2], 1)
+        self._size = int(np.prod(self.shape))
+        self._n = 0
+        self._totals = np.zeros((0, self._size))
+
+    def _allocate(self, n):
+        k = self._order
+        self._n = n
+        # flat index offsets and weights of the points along each axis
+        self._offsets = np.empty((3, k, n), dtype=np.intp)
+        self._weights = np.empty((3, k, n))
+        self._position = np.empty(n)
+        self._base = np.empty(n)
+        self._outside = np.empty(n, dtype=bool)
+        # flat index and weight of each contribution, point by point
+        self._corners = np.empty(k ** 3 * n, dtype=np.intp)
+        self._corner_weights = np.empty(k ** 3 * n)
+        # allocated for several quantities only
+        self._products = np.empty(0)
+
+    def _set_weights(self, x):
+        """Set the grid points and weights of the particles at ``x``."""
+        n = x.shape[0]
+        position = self._position[:n]
+        base = self._base[:n]
+        outside = self._outside[:n]
+        for axis in range(3):
+            offsets = self._offsets[axis, :, :n]
+            weights = self._weights[axis, :, :n]
+            np.subtract(x[:, axis], self._lower[axis], out=position)
+            np.divide(position, self._step[axis], out=position)
+            if self._order == 2:
+                np.floor(position, out=base)
+                np.subtract(position, base, out=weights[1])
+                np.subtract(1, weights[1], out=weights[0])
+                first = 0
+            else:
+                # offset from the nearest grid point
+                np.rint(position, out=base)
+                np.subtract(position, base, out=position)
+                if self._order == 1:
+                    weights[0] = 1
+                    first = 0
+                else:
+                    np.subtract(0.5, position, out=weights[0])
+                    np.square(weights[0], out=weights[0])
+                    weights[0] *= 0.5
+                    np.add(0.5, position, out=weights[2])
+                    np.square(weights[2], out=weights[2])
+                    weights[2] *= 0.5
+                    np.square(position, out=weights[1])
+                    np.subtract(0.75, weights[1], out=weights[1])
+                    first = -1
+
+            length = self.shape[axis]
+            for j in range(self._order):
+                point = offsets[j]
+                point[...] = base
+                point += first + j
+                if self.periodic:
+                    np.remainder(point, length, out=point)
+                else:
+                    np.less(point, 0, out=outside)
+                    outside |= point >= length
+                    weights[j][outside] = 0
+                    np.clip(point, 0, length - 1, out=point)
+                point *= self._strides[axis]
+
+    def __call__(self, x, quantities, count=1):
+        """
+        Return the sums of ``count`` quantities deposited by the
+        particles at the SI positions ``x``, shape (n, 3), each as an
+        array of shape ``shape``.  The sums are views of a work buffer
+        that is overwritten by the next call.
+
+        ``quantities`` is a function of a slice of the particles,
+        returning the ``count`` quantities of these particles as arrays
+        of shape (chunk,).
+        """
+        n = x.shape[0]
+        points = self._order ** 3
+        if min(n, self.chunk_size) > self._n:
+            self._allocate(min(n, self.chunk_size))
+        if count > 1 and self._products.size < points * self._n:
+            self._products = np.empty(points * self._n)
+        if self._totals.shape[0] != count:
+            self._totals = np.empty((count, self._size))
+        totals = self._totals
+        totals.fill(0)
+        for start in range(0, n, self.chunk_size):
+            chunk = slice(start, min(start + self.chunk_size, n))
+            size = chunk.stop - chunk.start
+            self._set_weights(x[chunk])
+            values = quantities(chunk)
+            offsets = self._offsets[..., :size]
+            weights = self._weights[..., :size]
+            corners = self._corners[: points * size]
+            corner_weights = self._corner_weights[: points * size]
+            if count == 1:
+                # a single quantity is folded into the weights along x
+                weights[0] *= values[0]
+            for point, (i, j, k) in enumerate(
+                itertools.product(range(self._order), repeat=3)
+            ):
+                part = slice(point * size, (point + 1) * size)
+                np.add(offsets[0, i], offsets[1, j], out=corners[part])
+                corners[part] += offsets[2, k]
+                np.multiply(weights[0, i], weights[1, j], out=corner_weights[part])
+                corner_weights[part] *= weights[2, k]
+            if count == 1:
+                totals[0] += np.bincount(
+                    corners, weights=corner_weights, minlength=self._size
+                )
+                continue
+            products = self._products[: points * size].reshape(points, size)
+            for total, value in zip(totals, values):
+                np.multiply(corner_weights.reshape(points, size), value, out=products)
+                total += np.bincount(
+                    corners, weights=products.ravel(), minlength=self._size
+                )
+        return [total.reshape(self.shape) for total in totals]
+
+
+@validate_quantities(x=u.m, v=u.m / u.s, mass=u.kg)
+def deposit_moments(
+    plasma, x, v, mass, weights=1, shape="cic", periodic=False, chunk_size=2 ** 17
+):
+    r"""
+    Compute the number density, mass density, momentum density and
+    pressure tensor of particles on the grid of a plasma.
+
+    Parameters
+    ----------
+    plasma : `~plasmapy.plasma.sources.Plasma3D`
+        The plasma defining the grid, which must be uniformly spaced.
+
+    x, v : ~astropy.units.Quantity
+        The positions and velocities of the particles, shape (n, 3).
+
+    mass : ~astropy.units.Quantity
+        The mass of each particle, a scalar or of shape (n,).
+
+    weights : float or array_like, optional
+        The number of particles represented by each macroparticle, a
+        scalar or of shape (n,).  Defaults to ``1``.
+
+    shape : str, optional
+        The shape of the particles: ``"ngp"`` (nearest grid point),
+        ``"cic"`` (cloud in cell, the default) or ``"tsc"`` (triangular
+        shaped cloud).
+
+    periodic : bool, optional
+        If `True`, the grid is periodic, with the last points along
+        each axis being the periodic images of the first ones.  Defaults
+        to `False`, in which case the parts of the particle shapes
+        outside of the grid are dropped.
+
+    chunk_size : int, optional
+        The number of particles processed at once, which bounds the
+        memory used.  Defaults to ``2 ** 17``.
+
+    Returns
+    -------
+    Moments
+        The ``number_density`` and ``mass_density``, shape (nx, ny, nz),
+        the ``momentum_density``, shape (3, nx, ny, nz), and the
+        ``pressure`` tensor, shape (3, 3, nx, ny, nz), at the grid
+        points of ``plasma``.
+
+    Notes
+    -----
+    Each grid point collects the quantities of the particles weighted
+    by their shape function, divided by the volume of a grid cell.  The
+    pressure tensor is taken in the frame moving with the local mean
+    velocity :math:`\mathbf{u}`,
+
+    .. math::
+        P_{ij} = \sum_p S_p m_p (v_{p,i} - u_i) (v_{p,j} - u_j)
+        = \sum_p S_p m_p v_{p,i} v_{p,j} - \rho u_i u_j,
+
+    where :math:`S_p` is the shape function times the weight of
+    particle :math:`p` and :math:`\rho` the mass density.  The moments
+    of the mass density, momentum and pressure are the
+    ``density``, ``momentum`` and ``pressure`` (a third of the trace of
+    the tensor) of `~plasmapy.plasma.sources.Plasma3D`.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> from plasmapy.plasma.sources import Plasma3D
+    >>> x = np.linspace(0, 1, 5) * u.m
+    >>> plasma = Plasma3D(x, x, x)
+    >>> moments = deposit_moments(
+    ...     plasma, [[0.5, 0.5, 0.5]] * u.m, [[1, 0, 0]] * u.m / u.s, 1 * u.kg
+    ... )
+    >>> moments.number_density[2, 2, 2]
+    <Quantity 64. 1 / m3>
+    """
+    axes = (plasma.x.si.value, plasma.y.si.value, plasma.z.si.value)
+    deposit = _Deposit(axes, shape, periodic, chunk_size)
+    x = np.asarray(x.value, dtype=float)
+    v = np.asarray(v.value, dtype=float)
+    n = x.shape[0]
+    mass = np.broadcast_to(mass.value, n)
+    weights = np.broadcast_to(weights, n)
+
+    def quantities(chunk):
+        number = weights[chunk]
+        particle_mass = number * mass[chunk]
+        velocity = v[chunk]
+        momentum = particle_mass[:, np.newaxis] * velocity
+        second = [momentum[:, i] * velocity[:, j] for i, j in _PAIRS]
+        return [number, particle_mass, *momentum.T, *second]
+
+    totals = deposit(x, quantities, count=5 + len(_PAIRS))
+    totals = np.array(totals) / np.prod(deposit._step)
+    if periodic:
+        totals = np.pad(totals, [(0, 0), (0, 1), (0, 1), (0, 1)], mode="wrap")
+    number_density, mass_density = totals[:2]
+    momentum_density = totals[2:5]
+
+    # the mean velocity, zero where there are no particles
+    velocity = np.divide(
+        momentum_density,
+        mass_density,
+        out=np.zeros_like(momentum_density),
+        where=mass_density > 0,
+    )
+    pressure = np.empty((3, 3) + mass_density.shape)
+    for (i, j), second in zip(_PAIRS, totals[5:]):
+        pressure[i, j] = pressure[j, i] = second - momentum_density[i] * velocity[j]
+
+    return Moments(
+        number_density / u.m ** 3,
+        mass_density * u.kg / u.m ** 3,
+        momentum_density * u.kg / (u.m ** 2 * u.s),
+        pressure * u.Pa,
+    )
@@ -0,0 +1,347 @@
+"""
+Diagnostics evaluated on the fly during a
+`~plasmapy.simulation.particletracker.ParticleTracker` run.
+
+Each diagnostic reduces the particle state of every ``every``-th time
+step to a compact value, so that long runs do not need to keep the
+trajectory history.
+"""
+__all__ = [
+    "Diagnostic",
+    "KineticEnergyConservation",
+    "MeanKineticEnergy",
+    "MeanVelocity",
+    "ParticleCount",
+    "TotalKineticEnergy",
+    "VelocityCovariance",
+]
+
+import astropy.units as u
+import numpy as np
+
+from abc import ABC, abstractmethod
+
+
+class Diagnostic:
+    """
+    A quantity evaluated every ``every``-th time step of a
+    `~plasmapy.simulation.particletracker.ParticleTracker` run.
+
+    Subclasses implement `compute`; otherwise ``function`` is called
+    with the tracker.  A `ValueError` is raised if there is neither.
+
+    Parameters
+    ----------
+    function : callable, optional
+        Function of the `~plasmapy.simulation.particletracker.ParticleTracker`
+        returning the value of the diagnostic, which may be a
+        `~astropy.units.Quantity`.
+
+    every : int, optional
+        Evaluate the diagnostic every ``every``-th time step, starting
+        with the first one.  Defaults to ``1``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> fastest = Diagnostic(lambda tracker: np.abs(tracker.v).max(), every=10)
+    """
+
+    #: Unit of the values returned by `compute`, or `None` if they carry
+    #: their own units.
+    unit = None
+
+    def __init__(self, function=None, every=1):
+        every = int(every)
+        if every < 1:
+            raise ValueError("every must be a positive integer.")
+        if function is None and type(self).compute is Diagnostic.compute:
+            raise ValueError("A diagnostic needs a function or a compute method.")
+        self.function = function
+        self.every = every
+        self._steps = []
+        self._values = []
+
+    def open(self, tracker):
+        """
+        Prepare for a run of ``tracker``, discarding earlier values.
+        Called by `~plasmapy.simulation.particletracker.ParticleTracker.run`.
+        """
+        self._steps = []
+        self._values = []
+
+    def update(self, step, tracker):
+        """Evaluate the diagnostic at time step ``step``, if it is due."""
+        if step % self.every == 0:
+            self._steps.append(step)
+            self._values.append(self.compute(tracker))
+
+    def _state(self):
+        """
+        Return the values accumulated during a run as arrays, to be
+        checkpointed.  Subclasses with more state extend it and
+        `_resume`.
+        """
+        state = {"steps": self.steps}
+        if self.unit is None:
+            values = u.Quantity(self._values)
+            state["values"] = values.value
+            state["unit"] = np.array(values.unit.to_string())
+        else:
+            state["values"] = np.array(self._values)
+        return state
+
+    def _resume(self, tracker, state):
+        """
+        Prepare to continue a run of ``tracker`` from the checkpointed
+        ``state``.
+        """
+        self.open(tracker)
+        values = state["values"]
+        if "unit" in state:
+            values = u.Quantity(values, str(state["unit"]))
+        self._steps = state["steps"].tolist()
+        self._values = list(values)
+
+    def compute(self, tracker):
+        """Return the value of the diagnostic for the current state."""
+        return self.function(tracker)
+
+    @property
+    def steps(self):
+        """The indices of the time steps at which the diagnostic was evaluated."""
+        return np.array(self._steps, dtype=int)
+
+    @property
+    def values(self):
+        """The values of the diagnostic at ``steps``."""
+        if self.unit is None:
+            return u.Quantity(self._values)
+        return u.Quantity(np.array(self._values), self.unit, copy=False)
+
+
+class _Reduction(Diagnostic, ABC):
+    """
+    A diagnostic reducing the state of all particles, or of the particles
+    of one ``species``.
+
+    Subclasses implement ``_partial``, returning sums over the particles
+    that can be added up over groups of particles, e.g. from several
+    processes, and ``_finish``, computing the value from the total.
+    """
+
+    def __init__(self, every=1, species=None):
+        super().__init__(every=every)
+        self.species = species
+
+    def _particles(self, tracker):
+        """Return the slice of the particle arrays that is reduced."""
+        if self.species is None:
+            return slice(None)
+        return tracker.species_slices[self.species]
+
+    def compute(self, tracker):
+        return self._finish(self._partial(tracker))
+
+    @abstractmethod
+    def _partial(self, tracker):
+        """Return the sums over the reduced particles of ``tracker``."""
+
+    def _finish(self, total):
+        return total
+
+
+def _total_kinetic_energy(tracker, particles):
+    """Total kinetic energy of the macroparticles ``particles`` in J."""
+    v = tracker._v[particles]
+    return 0.5 * np.einsum("i,ij,ij->", tracker._eff_m[particles], v, v)
+
+
+def _count(tracker, particles):
+    """Number of the particles ``particles``."""
+    return tracker._v[particles].shape[0]
+
+
+class TotalKineticEnergy(_Reduction):
+    """
+    Total kinetic energy of the macroparticles.
+
+    Parameters
+    ----------
+    every : int, optional
+        Evaluate the diagnostic every ``every``-th time step.  Defaults
+        to ``1``.
+
+    species : str, optional
+        If given, only the particles of this species are included.
+        Defaults to `None`, which includes all particles.
+    """
+
+    unit = u.J
+
+    def _partial(self, tracker):
+        return _total_kinetic_energy(tracker, self._particles(tracker))
+
+
+class MeanKineticEnergy(TotalKineticEnergy):
+    """
+    Mean kinetic energy per macroparticle.
+
+    Parameters
+    ----------
+    every : int, optional
+        Evaluate the diagnostic every ``every``-th time step.  Defaults
+        to ``1``.
+
+    species : str, optional
+        If given, only the particles of this species are included.
+        Defaults to `None`, which includes all particles.
+    """
+
+    def _partial(self, tracker):
+        particles = self._particles(tracker)
+        return np.array(
+            [_total_kinetic_energy(tracker, particles), _count(tracker, particles)]
+        )
+
+    def _finish(self, total):
+        energy, count = total
+        return energy / count
+
+
+class KineticEnergyConservation(_Reduction):
+    r"""
+    Relative change of the total kinetic energy since the first
+    evaluation,
+
+    .. math::
+        \frac{K(t) - K(t_0)}{K(t_0)},
+
+    which is the energy conservation error of runs in which the fields
+    do no work, e.g. in a static magnetic field.
+
+    Parameters
+    ----------
+    every : int, optional
+        Evaluate the diagnostic every ``every``-th time step.  Defaults
+        to ``1``.
+
+    species : str, optional
+        If given, only the particles of this species are included.
+        Defaults to `None`, which includes all particles.
+    """
+
+    unit = u.dimensionless_unscaled
+
+    def open(self, tracker):
+        super().open(tracker)
+        self._initial = None
+
+    def _partial(self, tracker):
+        return _total_kinetic_energy(tracker, self._particles(tracker))
+
+    def _state(self):
+        state = super()._state()
+        state["initial"] = np.array(np.nan if self._initial is None else self._initial)
+        return state
+
+    def _resume(self, tracker, state):
+        super()._resume(tracker, state)
+        if not np.isnan(state["initial"]):
+            self._initial = float(state["initial"])
+
+    def _finish(self, energy):
+        if self._initial is None:
+            self._initial = energy
+        return (energy - self._initial) / self._initial
+
+
+class MeanVelocity(_Reduction):
+    """
+    Mean velocity of the particles, shape (3,) per evaluation.
+
+    Parameters
+    ----------
+    every : int, optional
+        Evaluate the diagnostic every ``every``-th time step.  Defaults
+        to ``1``.
+
+    species : str, optional
+        If given, only the particles of this species are included.
+        Defaults to `None`, which includes all particles.
+    """
+
+    unit = u.m / u.s
+
+    def _partial(self, tracker):
+        v = tracker._v[self._particles(tracker)]
+        return np.append(v.sum(axis=0), v.shape[0])
+
+    def _finish(self, total):
+        return total[:3] / total[3]
+
+
+class VelocityCovariance(_Reduction):
+    r"""
+    Covariance matrix of the particle velocities,
+    :math:`\langle (v_i - \bar{v}_i)(v_j - \bar{v}_j) \rangle`,
+    shape (3, 3) per evaluation.
+
+    Parameters
+    ----------
+    every : int, optional
+        Evaluate the diagnostic every ``every``-th time step.  Defaults
+        to ``1``.
+
+    species : str, optional
+        If given, only the particles of this species are included.
+        Defaults to `None`, which includes all particles.
+    """
+
+    unit = u.m ** 2 / u.s ** 2
+
+    def _partial(self, tracker):
+        v = tracker._v[self._particles(tracker)]
+        return np.concatenate(([v.shape[0]], v.sum(axis=0), (v.T @ v).ravel()))
+
+    def _finish(self, total):
+        count = total[0]
+        mean = total[1:4] / count
+        return total[4:].reshape(3, 3) / count - np.outer(mean, mean)
+
+
+class ParticleCount(_Reduction):
+    """
+    Number of particles inside the box ``lower <= x < upper``.
+
+    Parameters
+    ----------
+    lower, upper : ~astropy.units.Quantity
+        Opposite corners of the box, each of shape (3,) in units
+        convertible to m.
+
+    every : int, optional
+        Evaluate the diagnostic every ``every``-th time step.  Defaults
+        to ``1``.
+
+    species : str, optional
+        If given, only the particles of this species are included.
+        Defaults to `None`, which includes all particles.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> upper_half = ParticleCount([-1, -1, 0] * u.m, [1, 1, 1] * u.m)
+    """
+
+    unit = u.dimensionless_unscaled
+
+    def __init__(self, lower, upper, every=1, species=None):
+        super().__init__(every=every, species=species)
+        self.lower = u.Quantity(lower, u.m).value
+        self.upper = u.Quantity(upper, u.m).value
+
+    def _partial(self, tracker):
+        x = tracker._x[self._particles(tracker)]
+        inside = np.all((x >= self.lower) & (x < self.upper), axis=1)
+        return np.count_nonzero(inside)
@@ -0,0 +1,636 @@
+"""
+Sources of the magnetic and electric fields acting on the particles of a
+`~plasmapy.simulation.particletracker.ParticleTracker`.
+
+A field source evaluates the fields directly at the particle positions.
+Field sources can be added to superpose their fields, e.g. to combine a
+gridded electric field with an analytic magnetic field.
+"""
+__all__ = ["AnalyticFields", "ElectrostaticFields", "FieldSource", "GriddedFields"]
+
+import astropy.units as u
+import copy
+import numpy as np
+import scipy.interpolate as interp
+
+from abc import ABC, abstractmethod
+from astropy import constants
+
+from plasmapy.formulary.magnetostatics import MagnetoStatics
+from plasmapy.simulation.deposition import _Deposit
+from plasmapy.simulation.parallel import _SharedArray
+from plasmapy.utils.decorators import validate_quantities
+
+
+def _is_uniform(axis, rtol=1e-10):
+    """Check whether the grid points of ``axis`` are equally spaced."""
+    if axis.size < 2:
+        return False
+    step = (axis[-1] - axis[0]) / (axis.size - 1)
+    return step > 0 and np.allclose(np.diff(axis), step, rtol=rtol, atol=0)
+
+
+def _make_interpolator(axes, values):
+    """
+    Return a linear interpolator of ``values`` of shape (nx, ny, nz, ncomp)
+    on the grid ``axes``, specialized for uniformly spaced axes.
+    """
+    if all(_is_uniform(axis) for axis in axes):
+        return _UniformGridInterpolator(axes, values)
+    return interp.RegularGridInterpolator(
+        axes, values, method="linear", bounds_error=True
+    )
+
+
+class _UniformGridInterpolator:
+    """
+    Trilinear interpolation of vector ``values`` of shape
+    (nx, ny, nz, ncomp) on a grid with uniformly spaced ``axes``.
+
+    All components are gathered together from the interleaved
+    ``values``, and the cell indices and weights are computed once per
+    call.  The returned array of shape (n, ncomp) is a work buffer that
+    is overwritten by the next call.
+    """
+
+    def __init__(self, axes, values):
+        shape = np.array([axis.size for axis in axes])
+        self._lower = np.array([axis[0] for axis in axes])
+        self._upper = np.array([axis[-1] for axis in axes])
+        self._origin = self._lower[:, np.newaxis]
+        self._step = ((self._upper - self._lower) / (shape - 1))[:, np.newaxis]
+        self._last_cell = (shape - 2)[:, np.newaxis]
+        self._strides = (shape[1] * shape[2], shape[2], 1)
+        self._values = np.ascontiguousarray(values).reshape(-1, values.shape[-1])
+        # flat index offset and (x, y, z) weight selectors of the cell corners
+        self._corners = [
+            (i * self._strides[0] + j * self._strides[1] + k, i, j, k)
+            for i in (0, 1)
+            for j in (0, 1)
+            for k in (0, 1)
+        ]
+        self._n = None
+
+    def _allocate(self, n):
+        ncomp = self._values.shape[-1]
+        self._n = n
+        self._position = np.empty((3, n))
+        self._weights = np.empty((2, 3, n))
+        self._index = np.empty(n, dtype=np.intp)
+        self._corner = np.empty(n, dtype=np.intp)
+        self._axis_index = np.empty(n, dtype=np.intp)
+        self._corner_weight = np.empty(n)
+        self._rows = np.empty((n, ncomp))
+        self._result = np.empty((n, ncomp))
+
+    def __call__(self, x):
+        if np.any(x < self._lower) or np.any(x > self._upper):
+            raise ValueError("Particle positions are outside of the grid.")
+        if x.shape[0] != self._n:
+            self._allocate(x.shape[0])
+
+        # fractional grid coordinates, with the components along the first axis
+        position = np.subtract(x.T, self._origin, out=self._position)
+        np.divide(position, self._step, out=position)
+
+        # lower cell corner, kept inside the grid at its upper edge
+        lower, upper = self._weights
+        np.floor(position, out=upper)
+        np.minimum(upper, self._last_cell, out=upper)
+        np.maximum(upper, 0, out=upper)
+
+        index = self._index
+        axis_index = self._axis_index
+        index[...] = 0
+        for axis in range(3):
+            axis_index[...] = upper[axis]
+            axis_index *= self._strides[axis]
+            index += axis_index
+
+        # weights of the lower and upper corner along each axis
+        np.subtract(position, upper, out=upper)
+        np.subtract(1, upper, out=lower)
+
+        result = self._result
+        rows = self._rows
+        corner = self._corner
+        weight = self._corner_weight
+        for n, (offset, i, j, k) in enumerate(self._corners):
+            np.add(index, offset, out=corner)
+            np.take(self._values, corner, axis=0, out=rows, mode="clip")
+            np.multiply(self._weights[i, 0], self._weights[j, 1], out=weight)
+            np.multiply(weight, self._weights[k, 2], out=weight)
+            if n == 0:
+                np.multiply(rows, weight[:, np.newaxis], out=result)
+            else:
+                np.multiply(rows, weight[:, np.newaxis], out=rows)
+                result += rows
+        return result
+
+
+class FieldSource(ABC):
+    """
+    Magnetic and electric fields that can be evaluated at many positions
+    at once.
+
+    Subclasses implement ``_evaluate``.  Adding two field sources returns
+    a field source of the superposed fields.
+    """
+
+    #: Step in m of the central differences approximating the gradient of
+    #: the magnetic field, which the guiding-center pusher needs.
+    gradient_step = 1e-6
+
+    #: Whether the fields depend on the particles, in which case they are
+    #: updated by ``_update`` after every time step.
+    _self_consistent = False
+
+    @property
+    def bounds(self):
+        """
+        The lower and upper corner in m of the box in which the fields are
+        defined, shape (2, 3), or `None` if they are defined everywhere.
+        """
+        return None
+
+    def __call__(self, x):
+        """
+        Evaluate the fields at the positions ``x``.
+
+        Parameters
+        ----------
+        x : ~astropy.units.Quantity
+            Positions of shape (n, 3) in units convertible to m.
+
+        Returns
+        -------
+        B, E : ~astropy.units.Quantity
+            The magnetic field in T and the electric field in V/m, each of
+            shape (n, 3).
+        """
+        x = np.array(u.Quantity(x, u.m).value, dtype=float, ndmin=2)
+        fields = np.array(self._evaluate(x))
+        return fields[:, :3] * u.T, fields[:, 3:] * u.V / u.m
+
+    @abstractmethod
+    def _evaluate(self, x):
+        """
+        Return B and E in SI units at the positions ``x``, an SI float
+        array of shape (n, 3), interleaved in an array of shape (n, 6).
+        The result may be a work buffer that is overwritten by the next
+        call.
+        """
+
+    def _evaluate_with_jacobian(self, x):
+        r"""
+        Return B, E and the Jacobian :math:`\partial B_i / \partial x_j`
+        (flattened row by row) in SI units at the positions ``x``,
+        interleaved in an array of shape (n, 15).
+        """
+        n = x.shape[0]
+        result = np.empty((n, 15))
+        result[:, :6] = self._evaluate(x)
+        jacobian = np.empty((n, 3, 3))
+        shifted = np.array(x, dtype=float)
+        h = self.gradient_step
+        for j in range(3):
+            shifted[:, j] = x[:, j] + h
+            jacobian[:, :, j] = self._evaluate(shifted)[:, :3]
+            shifted[:, j] = x[:, j] - h
+            jacobian[:, :, j] -= self._evaluate(shifted)[:, :3]
+            shifted[:, j] = x[:, j]
+        result[:, 6:] = jacobian.reshape(n, 9) / (2 * h)
+        return result
+
+    def _update(self, tracker):
+        """Update the fields from the particles of ``tracker``."""
+
+    def _shared(self, blocks):
+        """
+        Return a version of the source to be pickled for worker processes,
+        with large arrays moved to the shared memory ``blocks``.
+        """
+        return self
+
+    def _set_jacobian(self):
+        """Prepare `_evaluate_with_jacobian`, before the source is shared."""
+
+    def __add__(self, other):
+        if not isinstance(other, FieldSource):
+            return NotImplemented
+        return _SumOfFields(self, other)
+
+    def __radd__(self, other):
+        # allows sum() of field sources
+        if isinstance(other, int) and other == 0:
+            return self
+        return NotImplemented
+
+
+class _SumOfFields(FieldSource):
+    """The superposition of the fields of several ``sources``."""
+
+    def __init__(self, *sources):
+        self.sources = []
+        for source in sources:
+            if isinstance(source, _SumOfFields):
+                self.sources.extend(source.sources)
+            else:
+                self.sources.append(source)
+        self._result = np.empty((0, 6))
+
+    def __repr__(self):
+        return " + ".join(repr(source) for source in self.sources)
+
+    @property
+    def bounds(self):
+        bounds = [source.bounds for source in self.sources]
+        bounds = [bound for bound in bounds if bound is not None]
+        if not bounds:
+            return None
+        # the intersection of the boxes
+        return np.array(
+            [
+                np.max([bound[0] for bound in bounds], axis=0),
+                np.min([bound[1] for bound in bounds], axis=0),
+            ]
+        )
+
+    def _evaluate(self, x):
+        if self._result.shape[0] != x.shape[0]:
+            self._result = np.empty((x.shape[0], 6))
+        result = self._result
+        result[...] = self.sources[0]._evaluate(x)
+        for source in self.sources[1:]:
+            result += source._evaluate(x)
+        return result
+
+    @property
+    def _self_consistent(self):
+        return any(source._self_consistent for source in self.sources)
+
+    def _update(self, tracker):
+        for source in self.sources:
+            source._update(tracker)
+
+    def _shared(self, blocks):
+        shared = copy.copy(self)
+        shared.sources = [source._shared(blocks) for source in self.sources]
+        return shared
+
+    def _set_jacobian(self):
+        for source in self.sources:
+            source._set_jacobian()
+
+    def _evaluate_with_jacobian(self, x):
+        result = np.array(self.sources[0]._evaluate_with_jacobian(x))
+        for source in self.sources[1:]:
+            result += source._evaluate_with_jacobian(x)
+        return result
+
+
+class GriddedFields(FieldSource):
+    """
+    The magnetic and electric field on the grid of a
+    `~plasmapy.plasma.sources.Plasma3D`, gathered by trilinear
+    interpolation.
+
+    Parameters
+    ----------
+    plasma : `~plasmapy.plasma.sources.Plasma3D`
+        The plasma holding the fields.
+
+    magnetic, electric : bool, optional
+        Whether to use the magnetic and the electric field of ``plasma``,
+        respectively.  A field that is not used is zero and is not
+        interpolated.  Both default to `True`.
+
+    Notes
+    -----
+    Evaluating the fields outside of the grid raises a `ValueError`.
+    The gradient of the magnetic field is computed on the grid by second
+    order differences and interpolated like the fields.
+    """
+
+    def __init__(self, plasma, magnetic=True, electric=True):
+        if not (magnetic or electric):
+            raise ValueError("At least one of the fields must be used.")
+        self.plasma = plasma
+        self.magnetic = magnetic
+        self.electric = electric
+        self._axes = (plasma.x.si.value, plasma.y.si.value, plasma.z.si.value)
+
+        # B and E are interleaved into one array of shape (nx, ny, nz, 6)
+        # so that both fields are gathered together
+        fields = []
+        if magnetic:
+            fields.append(np.moveaxis(plasma.magnetic_field.si.value, 0, -1))
+        if electric:
+            fields.append(np.moveaxis(plasma.electric_field.si.value, 0, -1))
+        # contiguous, so that the interpolators refer to it without a copy
+        self._values = np.ascontiguousarray(np.concatenate(fields, axis=-1))
+        # computed when the gradient is first needed
+        self._jacobian_values = None
+        self._set_interpolators()
+
+    def _set_interpolators(self):
+        self._interpolator = _make_interpolator(self._axes, self._values)
+        self._jacobian_interpolator = None
+        if self._jacobian_values is not None:
+            self._jacobian_interpolator = _make_interpolator(
+                self._axes, self._jacobian_values
+            )
+        self._result = np.zeros((0, 6))
+
+    def __getstate__(self):
+        # the interpolators are rebuilt from the values when unpickled,
+        # and the plasma is not needed to evaluate the fields
+        state = self.__dict__.copy()
+        for name in ("_interpolator", "_jacobian_interpolator", "_result"):
+            del state[name]
+        state["plasma"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._set_interpolators()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.plasma!r}, "
+            f"magnetic={self.magnetic}, electric={self.electric})"
+        )
+
+    @property
+    def bounds(self):
+        return np.array(
+            [[axis[0] for axis in self._axes], [axis[-1] for axis in self._axes]]
+        )
+
+    def _evaluate(self, x):
+        fields = self._interpolator(x)
+        if self.magnetic and self.electric:
+            return fields
+        if self._result.shape[0] != x.shape[0]:
+            self._result = np.zeros((x.shape[0], 6))
+        if self.magnetic:
+            self._result[:, :3] = fields
+        else:
+            self._result[:, 3:] = fields
+        return self._result
+
+    def _set_jacobian(self):
+        """Compute the Jacobian of B on the grid, if not done yet."""
+        if self._jacobian_values is not None:
+            return
+        shape = self._values.shape[:-1] + (3,)
+        B = self._values[..., :3] if self.magnetic else np.zeros(shape)
+        E = self._values[..., -3:] if self.electric else np.zeros(shape)
+        # jacobian[..., i, j] is the derivative of B_i along axis j
+        jacobian = np.stack(
+            [np.stack(np.gradient(B[..., i], *self._axes), axis=-1) for i in range(3)],
+            axis=-2,
+        )
+        self._jacobian_values = np.concatenate(
+            (B, E, jacobian.reshape(shape[:-1] + (9,))), axis=-1
+        )
+        self._jacobian_interpolator = _make_interpolator(
+            self._axes, self._jacobian_values
+        )
+
+    def _evaluate_with_jacobian(self, x):
+        self._set_jacobian()
+        return self._jacobian_interpolator(x)
+
+    def _shared(self, blocks):
+        """
+        Return a copy whose grid values are moved to shared memory blocks,
+        which are appended to ``blocks``, so that the copy is pickled
+        without the values.
+        """
+        shared = copy.copy(self)
+        for name in ("_values", "_jacobian_values"):
+            values = getattr(self, name)
+            if values is not None:
+                block = _SharedArray(values)
+                blocks.append(block)
+                setattr(shared, name, block)
+        return shared
+
+
+class ElectrostaticFields(GriddedFields):
+    r"""
+    The electric field of the charge of the particles on the periodic
+    grid of a `~plasmapy.plasma.sources.Plasma3D`, solved again after
+    every time step for an electrostatic particle-in-cell simulation.
+
+    Parameters
+    ----------
+    plasma : `~plasmapy.plasma.sources.Plasma3D`
+        The plasma defining the grid, which must be uniformly spaced.
+
+    magnetic : bool, optional
+        Whether to add the static magnetic field of ``plasma``.
+        Defaults to `False`.
+
+    Notes
+    -----
+    The last grid points along each axis are the periodic images of the
+    first ones, so that the period is the extent of the grid, which is
+    the box of a `~plasmapy.simulation.particletracker.ParticleTracker`
+    with ``boundary="periodic"``.
+
+    Each update deposits the charge of the macroparticles on the grid
+    with cloud-in-cell weighting and solves Poisson's equation
+    :math:`-\nabla^2 \phi = \rho / \epsilon_0` by FFT, with the second
+    order finite difference Laplacian, for :math:`\mathbf{E} = -\nabla
+    \phi` by central differences.  The mean charge density is left out,
+    as if a uniform background neutralized the particles.  The field is
+    gathered with the same weighting, so that the particles exert no
+    force on themselves and the total momentum is conserved.
+
+    The electric field of ``plasma`` is not used nor updated.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> from plasmapy.plasma.sources import Plasma3D
+    >>> x = np.linspace(0, 1, 17) * u.m
+    >>> fields = ElectrostaticFields(Plasma3D(x, x, x))
+    >>> fields.potential.shape
+    (16, 16, 16)
+    """
+
+    _self_consistent = True
+
+    def __init__(self, plasma, magnetic=False):
+        super().__init__(plasma, magnetic=magnetic, electric=True)
+        self._deposit = _Deposit(self._axes, "cic", periodic=True)
+        shape = self._deposit.shape
+        step = self._deposit._step
+        self._cell_volume = np.prod(step)
+
+        # wave numbers of the real FFT of the grid, broadcast along each axis
+        k = np.meshgrid(
+            2 * np.pi * np.fft.fftfreq(shape[0], step[0]),
+            2 * np.pi * np.fft.fftfreq(shape[1], step[1]),
+            2 * np.pi * np.fft.rfftfreq(shape[2], step[2]),
+            indexing="ij",
+            sparse=True,
+        )
+        laplacian = sum(
+            (2 * np.sin(k[i] * step[i] / 2) / step[i]) ** 2 for i in range(3)
+        )
+        laplacian[0, 0, 0] = np.inf
+        self._green = 1 / (constants.eps0.si.value * laplacian)
+
+        # work buffers of the updates
+        self._charges = np.empty(0)
+        self._ahead = np.empty(shape)
+        self._behind = np.empty(shape)
+
+        self._charge_density = np.zeros(shape)
+        self._potential = np.zeros(shape)
+        self._values[..., -3:] = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.plasma!r}, magnetic={self.magnetic})"
+
+    @property
+    def charge_density(self):
+        """
+        The charge density deposited by the last update, on the grid
+        points without their periodic images.
+        """
+        return u.Quantity(self._charge_density, u.C / u.m ** 3)
+
+    @property
+    def potential(self):
+        """
+        The electric potential of the last update, on the grid points
+        without their periodic images.
+        """
+        return u.Quantity(self._potential, u.V)
+
+    def _update(self, tracker):
+        if self._charges.size < tracker.N:
+            self._charges = np.empty(tracker.N)
+        charges = self._charges[: tracker.N]
+        np.multiply(tracker._q_over_m[:, 0], tracker._eff_m, out=charges)
+
+        density = self._deposit(tracker._x, lambda chunk: [charges[chunk]])[0]
+        np.divide(density, self._cell_volume, out=self._charge_density)
+        shape = density.shape
+        spectrum = np.fft.rfftn(self._charge_density)
+        spectrum *= self._green
+        self._potential[...] = np.fft.irfftn(spectrum, s=shape)
+
+        # the field is updated in place, since the interpolators refer to it,
+        # by periodic central differences of the potential
+        E = self._values[..., -3:]
+        inner = E[: shape[0], : shape[1], : shape[2]]
+        step = self._deposit._step
+        for axis, n in enumerate(shape):
+            np.take(
+                self._potential,
+                np.arange(1, n + 1),
+                axis=axis,
+                mode="wrap",
+                out=self._ahead,
+            )
+            np.take(
+                self._potential,
+                np.arange(-1, n - 1),
+                axis=axis,
+                mode="wrap",
+                out=self._behind,
+            )
+            np.subtract(self._behind, self._ahead, out=inner[..., axis])
+            inner[..., axis] /= 2 * step[axis]
+        E[shape[0]] = E[0]
+        E[:, shape[1]] = E[:, 0]
+        E[:, :, shape[2]] = E[:, :, 0]
+        if self._jacobian_values is not None:
+            self._jacobian_values[..., 3:6] = E
+
+
+def _si_field(field, unit):
+    """
+    Return a function of SI positions of shape (n, 3) evaluating ``field``
+    in SI units, or `None` if ``field`` is `None`.
+    """
+    if field is None:
+        return None
+    if isinstance(field, MagnetoStatics):
+        if unit != u.T:
+            raise TypeError("MagnetoStatics objects are magnetic fields.")
+        return lambda x: field.magnetic_field(x).to_value(u.T)
+    if callable(field):
+        return lambda x: u.Quantity(field(u.Quantity(x, u.m, copy=False)), unit).value
+    value = u.Quantity(field, unit).value
+    if value.shape != (3,):
+        raise ValueError("A uniform field must be a vector of shape (3,).")
+    return lambda x: value
+
+
+class AnalyticFields(FieldSource):
+    """
+    Magnetic and electric fields given by functions of position, which
+    are evaluated exactly at the particle positions.
+
+    Parameters
+    ----------
+    magnetic_field, electric_field : callable or ~astropy.units.Quantity, optional
+        The magnetic field in units convertible to T and the electric
+        field in units convertible to V/m.  Each field may be
+
+        * a vectorized function mapping positions of shape (n, 3), given
+          as a `~astropy.units.Quantity` in m, to the field of shape (n, 3);
+        * a `~plasmapy.formulary.magnetostatics.MagnetoStatics` object,
+          for the magnetic field only, which is evaluated at positions in m;
+        * a `~astropy.units.Quantity` of shape (3,), for a uniform field;
+        * `None`, the default, for no field.
+
+    gradient_step : ~astropy.units.Quantity, optional
+        The step of the central differences approximating the gradient of
+        the magnetic field for the guiding-center pusher.  Defaults to
+        1 μm.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> from plasmapy.formulary.magnetostatics import MagneticDipole
+    >>> dipole = MagneticDipole([0, 0, 1] * u.A * u.m ** 2, [0, 0, 0] * u.m)
+    >>> fields = AnalyticFields(dipole, [0, 1, 0] * u.V / u.m)
+    >>> B, E = fields([[1, 0, 0]] * u.m)
+    >>> B
+    <Quantity [[ 0.e+00,  0.e+00, -1.e-07]] T>
+    """
+
+    @validate_quantities(gradient_step=u.m)
+    def __init__(
+        self, magnetic_field=None, electric_field=None, gradient_step=1e-6 * u.m
+    ):
+        self.magnetic_field = magnetic_field
+        self.electric_field = electric_field
+        self.gradient_step = gradient_step.value
+        self._magnetic = _si_field(magnetic_field, u.T)
+        self._electric = _si_field(electric_field, u.V / u.m)
+        self._result = np.zeros((0, 6))
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(magnetic_field={self.magnetic_field!r}, "
+            f"electric_field={self.electric_field!r})"
+        )
+
+    def _evaluate(self, x):
+        if self._result.shape[0] != x.shape[0]:
+            # fields that are not given stay zero
+            self._result = np.zeros((x.shape[0], 6))
+        if self._magnetic is not None:
+            self._result[:, :3] = self._magnetic(x)
+        if self._electric is not None:
+            self._result[:, 3:] = self._electric(x)
+        return self._result
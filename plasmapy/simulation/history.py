@@ -0,0 +1,427 @@
+"""
+Policies for saving the trajectory history of a
+`~plasmapy.simulation.particletracker.ParticleTracker`.
+"""
+__all__ = ["HDF5History", "MemoryHistory"]
+
+import astropy.units as u
+import numpy as np
+import queue
+import threading
+
+from abc import ABC, abstractmethod
+
+# openPMD unit dimensions (L, M, T, I, theta, N, J) of the saved records
+_POSITION_DIMENSION = np.array([1, 0, 0, 0, 0, 0, 0], dtype=float)
+_VELOCITY_DIMENSION = np.array([1, 0, -1, 0, 0, 0, 0], dtype=float)
+
+
+def _select_particles(particles, n_particles):
+    """
+    Normalize a particle selection to a slice or an integer index array
+    into the ``n_particles`` tracked particles.
+    """
+    if particles is None:
+        return slice(None)
+    if isinstance(particles, slice):
+        return particles
+    particles = np.arange(n_particles)[np.asarray(particles)]
+    if particles.ndim != 1:
+        raise ValueError("The particle selection must be one-dimensional.")
+    return particles
+
+
+class _History(ABC):
+    """
+    Common interface of the history policies.
+
+    Parameters
+    ----------
+    every : int
+        Save every ``every``-th step, starting with the first one.
+
+    particles : slice, array_like of int or bool, or None
+        The particles whose trajectories are saved.  Defaults to `None`,
+        which saves all particles.
+    """
+
+    def __init__(self, every=1, particles=None):
+        every = int(every)
+        if every < 1:
+            raise ValueError("every must be a positive integer.")
+        self.every = every
+        self.particles = particles
+        # no particles are saved before a run
+        self._selection = slice(0)
+
+    def _saved_steps(self, nt):
+        """Return the number of steps saved out of ``nt``."""
+        return -(-nt // self.every)
+
+    def open(self, tracker):
+        """
+        Prepare to save the history of a run of ``tracker``.  Called by
+        `~plasmapy.simulation.particletracker.ParticleTracker.run`.
+        """
+        self._selection = _select_particles(self.particles, tracker.N)
+        self._n_selected = np.empty(tracker.N)[self._selection].shape[0]
+
+    def record(self, step, x, v):
+        """
+        Save the positions ``x`` and velocities ``v`` (SI float arrays of
+        shape (n, 3)) at time step ``step``, if the policy keeps it.
+        """
+        if step % self.every == 0:
+            self._record(step, x[self._selection], v[self._selection])
+
+    @abstractmethod
+    def _record(self, step, x, v):
+        """Save the selected positions and velocities at ``step``."""
+
+    def close(self):
+        """Finish saving the history of a run."""
+
+    def _flush(self):
+        """
+        Return a `threading.Event` set once the steps recorded so far are
+        saved, or `None` if they already are.
+        """
+        return None
+
+    def _state(self):
+        """Return the saved history, to be checkpointed."""
+        return {}
+
+    def _resume(self, tracker, state, step):
+        """
+        Prepare to continue saving the history of a run of ``tracker``
+        restarted after time step ``step`` from the checkpointed ``state``.
+        """
+        self.open(tracker)
+
+    @property
+    @abstractmethod
+    def steps(self):
+        """The indices of the saved time steps, in chronological order."""
+
+    @property
+    @abstractmethod
+    def positions(self):
+        """The saved positions, shape (saved steps, saved particles, 3)."""
+
+    @property
+    @abstractmethod
+    def velocities(self):
+        """The saved velocities, shape (saved steps, saved particles, 3)."""
+
+
+class _NoHistory(_History):
+    """Policy saving no trajectory history at all."""
+
+    def __init__(self):
+        super().__init__(particles=slice(0))
+
+    def _record(self, step, x, v):
+        pass
+
+    @property
+    def steps(self):
+        return np.zeros(0, dtype=int)
+
+    @property
+    def positions(self):
+        return np.zeros((0, 0, 3)) * u.m
+
+    @property
+    def velocities(self):
+        return np.zeros((0, 0, 3)) * u.m / u.s
+
+
+class MemoryHistory(_History):
+    """
+    Keep the trajectory history of a
+    `~plasmapy.simulation.particletracker.ParticleTracker` in memory.
+
+    Parameters
+    ----------
+    every : int, optional
+        Save every ``every``-th time step, starting with the first one.
+        Defaults to ``1``.
+
+    particles : slice, array_like of int or bool, or None, optional
+        The particles whose trajectories are saved.  Defaults to `None`,
+        which saves all particles.
+
+    last : int, optional
+        If given, only the last ``last`` saved steps are kept in a ring
+        buffer, so that memory use does not grow with the number of
+        time steps.  Defaults to `None`, which keeps all saved steps.
+
+    Examples
+    --------
+    >>> history = MemoryHistory(every=10, particles=slice(0, 100), last=50)
+    """
+
+    def __init__(self, every=1, particles=None, last=None):
+        super().__init__(every, particles)
+        if last is not None and int(last) < 1:
+            raise ValueError("last must be a positive integer.")
+        self.last = None if last is None else int(last)
+        self._positions = np.zeros((0, 0, 3))
+        self._velocities = np.zeros((0, 0, 3))
+        self._steps = np.zeros(0, dtype=int)
+        self._count = 0
+
+    def open(self, tracker):
+        super().open(tracker)
+        size = self._saved_steps(tracker.NT)
+        if self.last is not None:
+            size = min(size, self.last)
+        shape = (size, self._n_selected, 3)
+        self._positions = np.zeros(shape)
+        self._velocities = np.zeros(shape)
+        self._steps = np.zeros(size, dtype=int)
+        self._count = 0
+
+    def _record(self, step, x, v):
+        slot = self._count % self._steps.size
+        self._positions[slot] = x
+        self._velocities[slot] = v
+        self._steps[slot] = step
+        self._count += 1
+
+    def _state(self):
+        return {
+            "_positions": self._positions.copy(),
+            "_velocities": self._velocities.copy(),
+            "_steps": self._steps.copy(),
+            "_count": self._count,
+        }
+
+    def _resume(self, tracker, state, step):
+        super()._resume(tracker, state, step)
+        self._positions = state["_positions"]
+        self._velocities = state["_velocities"]
+        self._steps = state["_steps"]
+        self._count = int(state["_count"])
+
+    def _chronological(self, array):
+        if self._count <= self._steps.size:
+            return array[: self._count]
+        return np.roll(array, -(self._count % self._steps.size), axis=0)
+
+    @property
+    def steps(self):
+        return self._chronological(self._steps)
+
+    @property
+    def positions(self):
+        return u.Quantity(self._chronological(self._positions), u.m, copy=False)
+
+    @property
+    def velocities(self):
+        return u.Quantity(self._chronological(self._velocities), u.m / u.s, copy=False)
+
+
+class HDF5History(_History):
+    """
+    Stream the trajectory history of a
+    `~plasmapy.simulation.particletracker.ParticleTracker` to an HDF5
+    file with the openPMD_ layout.
+
+    .. _openPMD: http://openpmd.org/
+
+    Each saved step is copied and handed to a background thread that
+    writes it to the file, so that only ``max_queued`` steps are held
+    in memory at any time.
+
+    Parameters
+    ----------
+    path : str
+        Path of the HDF5 file, which is overwritten.
+
+    every : int, optional
+        Save every ``every``-th time step, starting with the first one.
+        Defaults to ``1``.
+
+    particles : slice, array_like of int or bool, or None, optional
+        The particles whose trajectories are saved.  Defaults to `None`,
+        which saves all particles.
+
+    max_queued : int, optional
+        The maximum number of steps waiting to be written before the
+        simulation blocks.  Defaults to ``4``.
+
+    Notes
+    -----
+    Step ``i`` is written to the iteration group ``/data/i/`` with one
+    species group ``particles/<name>`` per tracked particle type, holding
+    the records ``position``, ``positionOffset`` and ``velocity``, each
+    with the components ``x``, ``y`` and ``z`` in SI units.
+
+    The ``steps``, ``positions`` and ``velocities`` attributes read the
+    history back from the file once the run has finished.
+
+    Examples
+    --------
+    >>> history = HDF5History("trajectories.h5", every=100)  # doctest: +SKIP
+    """
+
+    def __init__(self, path, every=1, particles=None, max_queued=4):
+        super().__init__(every, particles)
+        self.path = path
+        self.max_queued = int(max_queued)
+        self._species = {}
+        self._thread = None
+        self._error = None
+
+    def open(self, tracker):
+        self._open(tracker, "w")
+
+    def _resume(self, tracker, state, step):
+        # the steps after the checkpoint are saved again
+        self._open(tracker, "a", after=step)
+
+    def _open(self, tracker, mode, after=None):
+        """
+        Open the file with the h5py ``mode``, deleting the saved steps
+        after ``after`` if given, and start the writing thread.
+        """
+        try:
+            import h5py
+        except (ImportError, ModuleNotFoundError) as e:
+            from plasmapy.optional_deps import h5py_import_error
+
+            raise ImportError(h5py_import_error) from e
+
+        super().open(tracker)
+        # rows of the saved particles belonging to each species
+        indices = np.arange(tracker.N)[self._selection]
+        self._species = {}
+        for name, particles in tracker._species_particles.items():
+            rows = np.flatnonzero(
+                (indices >= particles.start) & (indices < particles.stop)
+            )
+            if rows.size:
+                self._species[str(name)] = rows
+        self._dt = tracker.dt.si.value
+        self._error = None
+
+        h5 = h5py.File(self.path, mode)
+        h5.attrs["openPMD"] = np.string_("1.1.0")
+        h5.attrs["openPMDextension"] = np.uint32(0)
+        h5.attrs["basePath"] = np.string_("/data/%T/")
+        h5.attrs["particlesPath"] = np.string_("particles/")
+        h5.attrs["iterationEncoding"] = np.string_("groupBased")
+        h5.attrs["iterationFormat"] = np.string_("/data/%T/")
+        data = h5.require_group("data")
+        if after is not None:
+            for step in list(data):
+                if int(step) > after:
+                    del data[step]
+
+        self._queue = queue.Queue(maxsize=self.max_queued)
+        self._thread = threading.Thread(target=self._write, args=(h5,), daemon=True)
+        self._thread.start()
+
+    def _write(self, h5):
+        """Write the queued steps to the open file ``h5`` until `None`."""
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                if isinstance(item, threading.Event):
+                    h5.flush()
+                    item.set()
+                    continue
+                self._write_step(h5, *item)
+        except Exception as e:  # reported by the simulation thread
+            self._error = e
+            # drain the queue so that the simulation does not block
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+        finally:
+            h5.close()
+
+    def _write_step(self, h5, step, x, v):
+        iteration = h5.create_group(f"data/{step}")
+        iteration.attrs["time"] = step * self._dt
+        iteration.attrs["dt"] = self._dt
+        iteration.attrs["timeUnitSI"] = 1.0
+
+        for species_name, rows in self._species.items():
+            species = iteration.create_group(f"particles/{species_name}")
+            for name, data, dimension in (
+                ("position", x[rows], _POSITION_DIMENSION),
+                ("velocity", v[rows], _VELOCITY_DIMENSION),
+                ("positionOffset", None, _POSITION_DIMENSION),
+            ):
+                record = species.create_group(name)
+                record.attrs["unitDimension"] = dimension
+                record.attrs["timeOffset"] = 0.0
+                for i, axis in enumerate("xyz"):
+                    if data is None:
+                        # constant record component
+                        component = record.create_group(axis)
+                        component.attrs["value"] = 0.0
+                        component.attrs["shape"] = np.array(
+                            [rows.size], dtype=np.uint64
+                        )
+                    else:
+                        component = record.create_dataset(axis, data=data[:, i])
+                    component.attrs["unitSI"] = 1.0
+
+    def _check_error(self):
+        if self._error is not None:
+            raise RuntimeError(
+                f"Writing the history to {self.path} failed."
+            ) from self._error
+
+    def _record(self, step, x, v):
+        self._check_error()
+        # copy, since the simulation updates x and v in place
+        self._queue.put((step, np.array(x), np.array(v)))
+
+    def _flush(self):
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        return flushed
+
+    def close(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._check_error()
+
+    def _read(self, record=None):
+        import h5py
+
+        with h5py.File(self.path, "r") as h5:
+            steps = np.sort(np.array([int(step) for step in h5["data"]], dtype=int))
+            if record is None:
+                return steps
+            history = np.empty((steps.size, self._n_selected, 3))
+            for i, step in enumerate(steps):
+                for species, rows in self._species.items():
+                    group = h5[f"data/{step}/particles/{species}/{record}"]
+                    for j, axis in enumerate("xyz"):
+                        history[i, rows, j] = group[axis][...]
+            return history
+
+    @property
+    def steps(self):
+        return self._read()
+
+    @property
+    def positions(self):
+        return self._read("position") * u.m
+
+    @property
+    def velocities(self):
+        return self._read("velocity") * u.m / u.s
@@ -0,0 +1,90 @@
+"""
+Helpers running the particles of a
+`~plasmapy.simulation.particletracker.ParticleTracker` in several worker
+processes.
+
+The particles are split into groups that the workers push independently
+of each other.  Large arrays, such as gridded fields, are copied once to
+shared memory blocks that each worker maps without copying them.
+"""
+__all__ = []
+
+import concurrent.futures
+import numpy as np
+
+# the shared memory blocks attached by this process, which must stay open
+# while their arrays are in use
+_attached = []
+
+
+class _SharedArray:
+    """
+    A copy of ``array`` in a shared memory block, which is pickled as the
+    name of the block and unpickled as an array mapping the block.
+    """
+
+    def __init__(self, array):
+        # imported here since it is only available on Python 3.8+
+        from multiprocessing import shared_memory
+
+        array = np.ascontiguousarray(array)
+        self.shape = array.shape
+        self.dtype = array.dtype
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=max(array.nbytes, 1)
+        )
+        np.ndarray(self.shape, self.dtype, buffer=self._memory.buf)[...] = array
+
+    def __reduce__(self):
+        return _attach, (self._memory.name, self.shape, self.dtype.str)
+
+    def release(self):
+        """Free the shared memory block."""
+        self._memory.close()
+        self._memory.unlink()
+
+
+def _attach(name, shape, dtype):
+    """Return an array of ``shape`` mapping the shared memory block ``name``."""
+    from multiprocessing import shared_memory
+
+    memory = shared_memory.SharedMemory(name=name)
+    _attached.append(memory)
+    return np.ndarray(shape, dtype, buffer=memory.buf)
+
+
+class _PartialDiagnostic:
+    """
+    Stand-in for a reduction ``diagnostic`` in a worker process, saving
+    the partial sums over the particles of the worker.
+    """
+
+    def __init__(self, diagnostic):
+        self.diagnostic = diagnostic
+        self.every = diagnostic.every
+        self.steps = []
+        self.partials = []
+
+    def open(self, tracker):
+        self.steps = []
+        self.partials = []
+
+    def update(self, step, tracker):
+        if step % self.every == 0:
+            self.steps.append(step)
+            self.partials.append(self.diagnostic._partial(tracker))
+
+
+def _run_group(tracker):
+    """Run the group of particles ``tracker`` and return its final state."""
+    tracker.run()
+    return tracker._group_state()
+
+
+def _run_groups(trackers, processes):
+    """
+    Run each of the ``trackers`` in one of ``processes`` worker processes,
+    and return their final states.
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(_run_group, trackers))
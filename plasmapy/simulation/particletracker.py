@@ -1,55 +1,163 @@
 """
 Class representing a group of particles.
 """
-__all__ = ["ParticleTracker"]
+__all__ = ["ExitLog", "ParticleTracker"]
 
 import astropy.units as u
+import copy
 import numpy as np
-import scipy.interpolate as interp
+import sys
 
 from astropy import constants
+from collections import namedtuple
 
+from plasmapy.formulary.relativity import _Lorentz_factor
 from plasmapy.particles import atomic
+from plasmapy.simulation.checkpoint import _read_checkpoint
+from plasmapy.simulation.deposition import deposit_moments
+from plasmapy.simulation.diagnostics import _Reduction
+from plasmapy.simulation.fields import FieldSource, GriddedFields
+from plasmapy.simulation.history import _NoHistory, _select_particles, MemoryHistory
+from plasmapy.simulation.parallel import _PartialDiagnostic, _run_groups
+from plasmapy.simulation.scheduler import _Stage, ScheduledSimulation
 from plasmapy.utils.decorators import validate_quantities
 
+_c = constants.c.si.value
 
-class ParticleTracker:
+_PUSHERS = ("boris", "relativistic_boris", "vay", "higuera_cary", "guiding_center")
+
+_BOUNDARIES = ("absorbing", "periodic", "reflecting")
+
+# state of each live particle, compacted when particles are lost
+_PARTICLE_ARRAYS = ("_x", "_v", "_u", "_gamma", "_q_over_m", "_eff_m", "_ids")
+# state of each live particle updated by the full-orbit pushers
+_PUSHED_ARRAYS = ("_x", "_v", "_u", "_gamma")
+# state of the guiding-center particles, set up by push(init=True)
+_GUIDING_CENTER_ARRAYS = (
+    "_gc_index",
+    "_gc_q_over_m",
+    "_gc_x",
+    "_gc_v_parallel",
+    "_gc_mu",
+)
+# the fields of the log of lost particles
+_LOST_FIELDS = ("particles", "steps", "positions", "velocities")
+# work arrays of the pushers, one row per live particle
+_WORK_ARRAYS = (
+    "_t_vector",
+    "_s_vector",
+    "_v_prime",
+    "_v_cross",
+    "_t_squared",
+    "_dot",
+    "_component",
+)
+
+ExitLog = namedtuple("ExitLog", ["particle", "time", "position", "velocity"])
+ExitLog.__doc__ = "Particles lost through an absorbing boundary of a `ParticleTracker`."
+
+
+def _format(value, format_spec):
+    """Format a scalar, or each element of an array, with ``format_spec``."""
+    if np.ndim(value) == 0:
+        return format(value, format_spec)
+    return "[" + ", ".join(format(element, format_spec) for element in value) + "]"
+
+
+class ParticleTracker(ScheduledSimulation):
     """
     Object representing a species of particles: ions, electrons, or simply
     a group of particles with a particular initial velocity distribution.
+    Several species can be tracked together in the same fields.
 
     Parameters
     ----------
-    plasma : `Plasma`
-        plasma from which fields can be pulled
-    type : str
-        particle type. See `plasmapy.particles.atomic` for suitable arguments.
+    plasma : `Plasma` or `~plasmapy.simulation.fields.FieldSource`
+        plasma from which fields can be pulled, or a source of the fields
+        evaluated directly at the particle positions, such as
+        `~plasmapy.simulation.fields.AnalyticFields` or a sum of sources.
+        With `~plasmapy.simulation.fields.ElectrostaticFields`, the
+        electric field of the particles is solved after every step for
+        an electrostatic particle-in-cell simulation
+    type : str or list of str
+        particle type, or a list of particle types to track several
+        species. See `plasmapy.particles.atomic` for suitable arguments.
         The default is a proton.
-    n_particles : int
-        number of macroparticles. The default is a single particle.
-    scaling : float
-        number of particles represented by each macroparticle.
+    n_particles : int or list of int
+        number of macroparticles, per species if a list. The default is a
+        single particle.
+    scaling : float or list of float
+        number of particles represented by each macroparticle, per species
+        if a list.
         The default is 1, which means a 1:1 correspondence between particles
         and macroparticles.
     dt : `astropy.units.Quantity`
         length of timestep
     nt : int
         number of timesteps
+    history : `~plasmapy.simulation.history.MemoryHistory` or \
+`~plasmapy.simulation.history.HDF5History`, optional
+        policy deciding which steps and particles of the trajectories are
+        saved, and where.  The default keeps every step of every particle
+        in memory, while `False` saves no history.
+    diagnostics : list of `~plasmapy.simulation.diagnostics.Diagnostic`, optional
+        diagnostics evaluated during the run.
+    pusher : str, optional
+        the particle pusher used by `push`: ``"boris"`` (the default),
+        ``"relativistic_boris"``, ``"vay"``, ``"higuera_cary"`` or
+        ``"guiding_center"``.
+    magnetization_threshold : float, optional
+        if given, particles whose magnetization parameter is below this
+        value are advanced with the guiding-center pusher and the others
+        with ``pusher``.  The particles switch between the two during a
+        run as their magnetization changes.  See `push`.
+    boundary : str or list of str, optional
+        what happens to particles leaving ``domain``: ``"absorbing"``
+        removes them from the simulation, ``"periodic"`` moves them back
+        in through the opposite face and ``"reflecting"`` reflects them
+        specularly.  Guiding centers keep their parallel velocity, which
+        is reversed only if the magnetic field is mostly normal to the
+        wall.  A list of three gives the condition along each axis.
+        The default, `None`, applies no condition, so that a particle
+        leaving a gridded field raises a `ValueError`.
+    domain : `astropy.units.Quantity`, optional
+        the lower and upper corner of the simulation box, shape (2, 3),
+        for ``boundary``.  Defaults to the extent of the grid of
+        ``plasma``.
+    checkpoint : `~plasmapy.simulation.checkpoint.Checkpoint`, optional
+        policy saving the state of the run periodically, so that it can
+        be continued with `restart`.
+    collisions : `~plasmapy.simulation.collisions.BinaryCollisions`, optional
+        Monte Carlo binary Coulomb collisions between the particles,
+        applied after the boundary conditions.
 
     Attributes
     ----------
     x : `astropy.units.Quantity`
     v : `astropy.units.Quantity`
-        Current position and velocity, respectively. Shape (n, 3).
+        Current position and velocity, respectively, of the particles
+        that have not been lost. Shape (n, 3).
     position_history : `astropy.units.Quantity`
     velocity_history : `astropy.units.Quantity`
-        History of position and velocity. Shape (nt, n, 3).
+        History of position and velocity saved by ``history``.
+        Shape (saved steps, saved particles, 3).
+    time_history : `astropy.units.Quantity`
+        Times of the saved steps.
     q : `astropy.units.Quantity`
     m : `astropy.units.Quantity`
-        Charge and mass of particle.
+        Charge and mass of particle, per species if several are tracked.
     eff_q : `astropy.units.Quantity`
     eff_m : `astropy.units.Quantity`
-        Total charge and mass of macroparticle.
+        Total charge and mass of macroparticle, per species if several
+        are tracked.
+    species : list of str
+        The tracked particle types.
+    species_slices : dict
+        The slice of the particle arrays, such as ``x`` and ``v``, holding
+        each species.  The particles of each species are contiguous, in
+        the order of ``species``.
+    exit_log : `ExitLog`
+        The particles removed by an absorbing boundary.
 
     Examples
     ----------
@@ -67,67 +175,222 @@ class ParticleTracker:
         scaling=1,
         dt=np.inf * u.s,
         nt=np.inf,
+        history=None,
+        diagnostics=(),
+        pusher="boris",
+        magnetization_threshold=None,
+        boundary=None,
+        domain=None,
+        checkpoint=None,
+        collisions=None,
     ):
 
+        super().__init__()
         if np.isinf(dt) and np.isinf(nt):  # coverage: ignore
             raise ValueError("Both dt and nt are infinite.")
+        if pusher not in _PUSHERS:
+            raise ValueError(
+                f"Unknown pusher {pusher!r}, expected one of {', '.join(_PUSHERS)}."
+            )
 
-        self.q = atomic.integer_charge(particle_type) * constants.e.si
-        self.m = atomic.particle_mass(particle_type)
-        self.N = int(n_particles)
+        several_species = isinstance(particle_type, (list, tuple))
+        species = list(particle_type) if several_species else [particle_type]
+        if len(set(species)) != len(species):
+            raise ValueError("Each particle type can only be given once.")
+        if np.ndim(n_particles) > 0 and np.size(n_particles) != len(species):
+            raise ValueError("n_particles must be given for each particle type.")
+        if np.ndim(scaling) > 0 and np.size(scaling) != len(species):
+            raise ValueError("scaling must be given for each particle type.")
+        counts = np.broadcast_to(n_particles, len(species)).astype(int)
+
+        q = u.Quantity([atomic.integer_charge(s) for s in species]) * constants.e.si
+        m = u.Quantity([atomic.particle_mass(s) for s in species])
+        eff_q = q * scaling
+        eff_m = m * scaling
+        if several_species:
+            self.q, self.m, self.eff_q, self.eff_m = q, m, eff_q, eff_m
+        else:
+            self.q, self.m, self.eff_q, self.eff_m = q[0], m[0], eff_q[0], eff_m[0]
+        self.N = int(counts.sum())
         self.scaling = scaling
-        self.eff_q = self.q * scaling
-        self.eff_m = self.m * scaling
+
+        self.species = species
+        stops = np.cumsum(counts)
+        self.species_slices = {
+            s: slice(int(stop - count), int(stop))
+            for s, count, stop in zip(species, counts, stops)
+        }
+        # the slices of the particle indices, which do not change when
+        # particles are lost
+        self._species_particles = dict(self.species_slices)
+        # per-particle charge to mass ratio and macroparticle mass
+        self._q_over_m = np.repeat((q / m).si.value, counts)[:, np.newaxis]
+        self._eff_m = np.repeat(eff_m.si.value, counts)
+        self._all_eff_m = self._eff_m.copy()
+        # the index of each live particle among all particles
+        self._ids = np.arange(self.N)
 
         self.plasma = plasma
+        if isinstance(plasma, FieldSource):
+            self.fields = plasma
+        else:
+            self.fields = GriddedFields(plasma)
+        self._set_boundaries(boundary, domain)
 
         self.dt = dt
         self.NT = int(nt)
         self.t = np.arange(nt) * dt
 
-        self.x = np.zeros((n_particles, 3), dtype=float) * u.m
-        self.v = np.zeros((n_particles, 3), dtype=float) * (u.m / u.s)
-        self.name = particle_type
+        # the time stepping works on SI float arrays; x and v are
+        # Quantity views of them
+        self._x = np.zeros((self.N, 3), dtype=float)
+        self._v = np.zeros((self.N, 3), dtype=float)
+        self.name = ", ".join(str(s) for s in species)
 
-        self.position_history = np.zeros((self.NT, *self.x.shape), dtype=float) * u.m
-        self.velocity_history = np.zeros((self.NT, *self.v.shape), dtype=float) * (
-            u.m / u.s
-        )
-        # create intermediate array of dimension (nx,ny,nz,3) in order to allow
-        # interpolation on non-equal spatial domain dimensions
-        _B = np.moveaxis(self.plasma.magnetic_field.si.value, 0, -1)
-        _E = np.moveaxis(self.plasma.electric_field.si.value, 0, -1)
-
-        self._B_interpolator = interp.RegularGridInterpolator(
-            (self.plasma.x.si.value, self.plasma.y.si.value, self.plasma.z.si.value),
-            _B,
-            method="linear",
-            bounds_error=True,
-        )
+        if history is None:
+            history = MemoryHistory()
+        elif history is False:
+            history = _NoHistory()
+        self.history = history
+        self.diagnostics = list(diagnostics)
+        self.checkpoint = checkpoint
+        self.collisions = collisions
 
-        self._E_interpolator = interp.RegularGridInterpolator(
-            (self.plasma.x.si.value, self.plasma.y.si.value, self.plasma.z.si.value),
-            _E,
-            method="linear",
-            bounds_error=True,
-        )
+        self.pusher = pusher
+        self.magnetization_threshold = magnetization_threshold
+        # the full-orbit push, if any particle needs one
+        self._push = None
+        if pusher != "guiding_center":
+            self._push = getattr(self, f"_{pusher}_push")
+        # guiding-center particles, with their guiding centers, parallel
+        # velocity and magnetic moment per unit mass; set up by
+        # push(init=True)
+        self._gc_index = None
+        self._gc_x = None
+        self._gc_v_parallel = None
+        self._gc_mu = None
+        # the relativistic pushers advance u = gamma * v
+        self._u = np.zeros((self.N, 3), dtype=float)
+        self._gamma = np.ones((self.N, 1))
+
+        # preallocated work arrays of the pushers
+        self._t_vector = np.empty((self.N, 3))
+        self._s_vector = np.empty((self.N, 3))
+        self._v_prime = np.empty((self.N, 3))
+        self._v_cross = np.empty((self.N, 3))
+        self._t_squared = np.empty((self.N, 1))
+        self._dot = np.empty((self.N, 1))
+        self._component = np.empty(self.N)
+
+    @property
+    def x(self):
+        """Current position of the particles, shape (n, 3)."""
+        return u.Quantity(self._x, u.m, copy=False)
+
+    @x.setter
+    def x(self, value):
+        self._x[...] = u.Quantity(value, u.m).value
+
+    @property
+    def v(self):
+        """Current velocity of the particles, shape (n, 3)."""
+        return u.Quantity(self._v, u.m / u.s, copy=False)
+
+    @v.setter
+    def v(self, value):
+        self._v[...] = u.Quantity(value, u.m / u.s).value
+        if self.pusher != "boris":
+            self._set_proper_velocity()
+
+    @property
+    def position_history(self):
+        """Saved history of the particle positions."""
+        return self.history.positions
+
+    @property
+    def velocity_history(self):
+        """Saved history of the particle velocities."""
+        return self.history.velocities
+
+    @property
+    def time_history(self):
+        """Times of the saved history steps."""
+        return self.t[self.history.steps]
+
+    @property
+    def saved_iterations(self):
+        """Number of saved history steps."""
+        return len(self.history.steps)
+
+    def _interpolate_fields_si(self):
+        """Interpolate B and E in SI units at the particle positions."""
+        fields = self.fields._evaluate(self._x)
+        return fields[:, :3], fields[:, 3:]
 
     def _interpolate_fields(self):
-        interpolated_b = self._B_interpolator(self.x.si.value) * u.T
-        interpolated_e = self._E_interpolator(self.x.si.value) * u.V / u.m
-        return interpolated_b, interpolated_e
+        interpolated_b, interpolated_e = self._interpolate_fields_si()
+        return interpolated_b * u.T, interpolated_e * u.V / u.m
+
+    def moments(self, plasma, species=None, shape="cic", periodic=False):
+        """
+        Compute the fluid moments of the particles on the grid of a
+        plasma with `~plasmapy.simulation.deposition.deposit_moments`.
+
+        Parameters
+        ----------
+        plasma : `~plasmapy.plasma.sources.Plasma3D`
+            The plasma defining the grid, which must be uniformly spaced.
+        species : str, optional
+            If given, only the particles of this species are included.
+            Defaults to `None`, which includes all particles.
+        shape : str, optional
+            The shape of the particles, ``"ngp"``, ``"cic"`` (the
+            default) or ``"tsc"``.
+        periodic : bool, optional
+            Whether the grid is periodic.  Defaults to `False`.
+
+        Returns
+        -------
+        `~plasmapy.simulation.deposition.Moments`
+            The number density, mass density, momentum density and
+            pressure tensor of the macroparticles, each of which
+            represents ``scaling`` particles.
+        """
+        n = self._x.shape[0]
+        mass = np.empty(n)
+        weights = np.empty(n)
+        masses = np.broadcast_to(self.m.si.value, len(self.species))
+        scalings = np.broadcast_to(self.scaling, len(self.species))
+        for i, name in enumerate(self.species):
+            particles = self.species_slices[name]
+            mass[particles] = masses[i]
+            weights[particles] = scalings[i]
+        particles = slice(None) if species is None else self.species_slices[species]
+        return deposit_moments(
+            plasma,
+            self.x[particles],
+            self.v[particles],
+            mass[particles] * u.kg,
+            weights[particles],
+            shape=shape,
+            periodic=periodic,
+        )
 
     @property
     def kinetic_energy_history(self):
         r"""
         Calculates the kinetic energy history for each particle.
 
+        See `~plasmapy.simulation.diagnostics.TotalKineticEnergy` to
+        compute the total kinetic energy during the run instead.
+
         Returns
         --------
         ~astropy.units.Quantity
-            Array of kinetic energies, shape (nt, n).
+            Array of kinetic energies, shape (saved steps, saved particles).
         """
-        return (self.velocity_history ** 2).sum(axis=-1) * self.eff_m / 2
+        eff_m = u.Quantity(self._all_eff_m[self.history._selection], u.kg)
+        return (self.velocity_history ** 2).sum(axis=-1) * eff_m / 2
 
     def boris_push(self, init=False):
         r"""
@@ -160,47 +423,1054 @@ class ParticleTracker:
         .. [1] C. K. Birdsall, A. B. Langdon, "Plasma Physics via Computer
                Simulation", 2004, p. 58-63
         """
-        dt = -self.dt / 2 if init else self.dt
-        b, e = self._interpolate_fields()
+        dt = self.dt.si.value
+        self._boris_push(-dt / 2 if init else dt, move=not init)
+
+    def push(self, init=False):
+        r"""
+        Move the particles and update their velocities by one time step
+        of the pusher selected with the ``pusher`` argument.
+
+        Arguments
+        ----------
+        init : bool (optional)
+            If `True`, does not change the particle positions and sets dt
+            to -dt/2.
+
+        Notes
+        ----------
+        ``"boris"`` is the non-relativistic `boris_push`.  The
+        relativistic pushers advance the proper velocity
+        :math:`\mathbf{u} = \gamma \mathbf{v}` with :math:`\gamma =
+        \sqrt{1 + u^2 / c^2}`, and then update ``v`` from it.  ``u`` is
+        computed from ``v`` with ``init`` and when ``v`` is set, and is
+        otherwise carried from step to step:
+
+        * ``"relativistic_boris"`` is the Boris algorithm with the
+          rotation vector :math:`\mathbf{t} = q \mathbf{B} \Delta t /
+          2 \gamma m`, taking :math:`\gamma` after the first electric
+          half impulse [1]_.
+        * ``"vay"`` is the pusher of Vay [2]_, which keeps the
+          :math:`\mathbf{E} \times \mathbf{B}` drift of relativistic
+          particles exact when the electric and magnetic forces cancel.
+        * ``"higuera_cary"`` is the pusher of Higuera & Cary [3]_, which
+          is volume preserving and also has the correct
+          :math:`\mathbf{E} \times \mathbf{B}` drift.
+
+        All of them are second order accurate and conserve the energy in
+        a magnetic field.
+
+        ``"guiding_center"`` follows the guiding centers of strongly
+        magnetized particles instead of their gyration, so that the time
+        step need not resolve the gyroperiod.  With ``init``, each
+        particle is replaced by its guiding center
+        :math:`\mathbf{X} = \mathbf{x} + \mathbf{w} \times \hat{b} /
+        \Omega`, where :math:`\mathbf{w}` is its gyration velocity in
+        the frame drifting with :math:`\mathbf{E} \times \mathbf{B}`
+        and :math:`\Omega = qB/m`.  The parallel velocity
+        :math:`v_\parallel` and the magnetic moment :math:`\mu = m w^2 /
+        2B` are kept, and
+
+        .. math::
+            \frac{d\mathbf{X}}{dt} = v_\parallel \hat{b}
+            + \frac{\mathbf{F} \times \mathbf{B}}{q B^2},
+            \qquad
+            m \frac{dv_\parallel}{dt} = \hat{b} \cdot
+            \left( q \mathbf{E} - \mu \nabla B \right),
+
+        with :math:`\mathbf{F} = q \mathbf{E} - \mu \nabla B - m
+        v_\parallel^2 (\hat{b} \cdot \nabla) \hat{b}`, which gives the
+        :math:`\mathbf{E} \times \mathbf{B}`, grad-B and curvature drifts
+        of `~plasmapy.formulary.drifts`.  They are integrated with the
+        classical fourth order Runge-Kutta method, with the gradients
+        of the field source.  The positions and velocities of these
+        particles are those of their guiding centers, and their
+        velocities are averaged over the step instead of being half a
+        step behind.
+
+        With ``magnetization_threshold``, the guiding-center pusher is
+        used for the particles whose magnetization parameter
+        :math:`\epsilon = (w / |\Omega|) \max(|\nabla B| / B,
+        |(\hat{b} \cdot \nabla) \hat{b}|)` (the Larmor radius over the
+        field scale length) is below the threshold when ``init`` is
+        used, and ``pusher`` for the others.  After each step of `run`,
+        guiding centers whose magnetization parameter rose above the
+        threshold are replaced by particles gyrating around them, at an
+        arbitrary gyrophase, and particles whose magnetization parameter
+        fell below half the threshold by their guiding centers.  The
+        margin keeps particles close to the threshold from switching at
+        every step.
+
+        References
+        ----------
+        .. [1] C. K. Birdsall, A. B. Langdon, "Plasma Physics via Computer
+               Simulation", 2004, p. 356-357
+        .. [2] J.-L. Vay, "Simulation of beams or plasmas crossing at
+               relativistic velocity", Physics of Plasmas 15, 056701 (2008)
+        .. [3] A. V. Higuera, J. R. Cary, "Structure-preserving
+               second-order integration of relativistic charged particle
+               trajectories in electromagnetic fields", Physics of
+               Plasmas 24, 052104 (2017)
+        """
+        dt = self.dt.si.value
+        if init or self._gc_index is None:
+            self._set_guiding_centers()
+        if init:
+            if self.pusher != "boris":
+                self._set_proper_velocity()
+            self._full_orbit_push(-dt / 2, move=False)
+        else:
+            self._step(dt)
+
+    def _set_proper_velocity(self, index=slice(None)):
+        """
+        Compute the proper velocity ``u = gamma * v`` from ``v`` for the
+        particles ``index``.
+        """
+        v = self._v[index]
+        speed = np.sqrt(np.einsum("ij,ij->i", v, v))
+        self._gamma[index, 0] = _Lorentz_factor(speed)
+        self._u[index] = v * self._gamma[index]
+
+    def _cross(self, a, b, out):
+        """Compute ``np.cross(a, b)`` into ``out`` without allocating."""
+        tmp = self._component
+        for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+            np.multiply(a[:, j], b[:, k], out=out[:, i])
+            np.multiply(a[:, k], b[:, j], out=tmp)
+            out[:, i] -= tmp
+
+    def _dot_rows(self, a, b, out):
+        """Compute the row-wise dot product of ``a`` and ``b`` into ``out``."""
+        np.einsum("ij,ij->i", a, b, out=out[:, 0])
+        return out
+
+    def _boris_rotation(self, v, t):
+        """Rotate ``v`` in place with the Boris rotation vector ``t``."""
+        t_squared = self._dot_rows(t, t, self._t_squared)
+        t_squared += 1
+        s = np.divide(t, t_squared, out=self._s_vector)
+        s *= 2
+        v_prime = self._v_prime
+        self._cross(v, t, v_prime)
+        v_prime += v
+        self._cross(v_prime, s, self._v_cross)
+        v += self._v_cross
+
+    def _boris_push(self, dt, move=True):
+        """
+        Advance the SI velocity (and position, if ``move``) arrays in
+        place by one Boris step of length ``dt`` seconds.
+        """
+        b, e = self._interpolate_fields_si()
+        half_impulse = self._q_over_m * dt * 0.5
+        v = self._v
 
         # add first half of electric impulse
-        vminus = self.v + self.eff_q * e / self.eff_m * dt * 0.5
+        e *= half_impulse
+        v += e
 
         # rotate to add magnetic field
-        t = -b * self.eff_q / self.eff_m * dt * 0.5
-        s = 2 * t / (1 + (t * t).sum(axis=1, keepdims=True))
-        vprime = vminus + np.cross(vminus.si.value, t) * u.m / u.s
-        vplus = vminus + np.cross(vprime.si.value, s) * u.m / u.s
+        t = np.multiply(b, half_impulse, out=self._t_vector)
+        self._boris_rotation(v, t)
 
         # add second half of electric impulse
-        v_new = vplus + self.eff_q * e / self.eff_m * dt * 0.5
+        v += e
+
+        self._move(dt, move)
+
+    def _move(self, dt, move):
+        """Advance the positions with the updated velocities, if ``move``."""
+        if move:
+            np.multiply(self._v, dt, out=self._v_prime)
+            self._x += self._v_prime
+
+    def _update_gamma(self, u):
+        """Compute ``gamma`` of the proper velocity ``u`` in place."""
+        gamma = self._dot_rows(u, u, self._gamma)
+        gamma *= 1 / _c ** 2
+        gamma += 1
+        return np.sqrt(gamma, out=gamma)
+
+    def _finish_relativistic_push(self, dt, move):
+        """Update ``v`` from ``u`` and advance the positions."""
+        gamma = self._update_gamma(self._u)
+        np.divide(self._u, gamma, out=self._v)
+        self._move(dt, move)
+
+    def _relativistic_boris_push(self, dt, move=True):
+        """
+        Advance the proper velocity (and position, if ``move``) by one
+        relativistic Boris step of length ``dt`` seconds.
+        """
+        b, e = self._interpolate_fields_si()
+        half_impulse = self._q_over_m * dt * 0.5
+        u = self._u
+
+        e *= half_impulse
+        u += e
+
+        t = np.multiply(b, half_impulse, out=self._t_vector)
+        t /= self._update_gamma(u)
+        self._boris_rotation(u, t)
+
+        u += e
+
+        self._finish_relativistic_push(dt, move)
+
+    def _implicit_rotation(self, u, tau):
+        """
+        Rotate ``u`` in place about the magnetic field, with the Lorentz
+        factor at the end of the step solved for as in the Vay and
+        Higuera-Cary pushers; ``tau`` is overwritten with the rotation
+        vector ``t``.
+        """
+        tau_squared = self._dot_rows(tau, tau, self._t_squared)
+        u_star = self._dot_rows(u, tau, self._dot)
+        u_star *= 1 / _c
+
+        # gamma at the end of the step
+        sigma = self._update_gamma(u)
+        sigma *= sigma
+        sigma -= tau_squared
+        np.multiply(u_star, u_star, out=u_star)
+        u_star += tau_squared
+        u_star *= 4
+        gamma = np.multiply(sigma, sigma, out=self._t_squared)
+        gamma += u_star
+        np.sqrt(gamma, out=gamma)
+        gamma += sigma
+        gamma *= 0.5
+        np.sqrt(gamma, out=gamma)
+
+        t = np.divide(tau, gamma, out=tau)
+        t_squared = self._dot_rows(t, t, self._t_squared)
+        t_squared += 1
+        u_dot_t = self._dot_rows(u, t, self._dot)
+
+        # u = s [u + (u . t) t + u x t] with s = 1 / (1 + t^2)
+        self._cross(u, t, self._v_cross)
+        np.multiply(t, u_dot_t, out=self._v_prime)
+        u += self._v_prime
+        u += self._v_cross
+        u /= t_squared
+        return t
+
+    def _vay_push(self, dt, move=True):
+        """
+        Advance the proper velocity (and position, if ``move``) by one
+        step of the Vay pusher of length ``dt`` seconds.
+        """
+        b, e = self._interpolate_fields_si()
+        half_impulse = self._q_over_m * dt * 0.5
+        u = self._u
+
+        # explicit half step with the old velocity, then the electric
+        # half impulse of the second half step
+        tau = np.multiply(b, half_impulse, out=self._t_vector)
+        self._cross(self._v, tau, self._v_cross)
+        e *= half_impulse
+        u += e
+        u += e
+        u += self._v_cross
+
+        self._implicit_rotation(u, tau)
+
+        self._finish_relativistic_push(dt, move)
+
+    def _higuera_cary_push(self, dt, move=True):
+        """
+        Advance the proper velocity (and position, if ``move``) by one
+        step of the Higuera-Cary pusher of length ``dt`` seconds.
+        """
+        b, e = self._interpolate_fields_si()
+        half_impulse = self._q_over_m * dt * 0.5
+        u = self._u
+
+        e *= half_impulse
+        u += e
+
+        tau = np.multiply(b, half_impulse, out=self._t_vector)
+        t = self._implicit_rotation(u, tau)
+        self._cross(u, t, self._v_cross)
+        u += self._v_cross
+
+        u += e
+
+        self._finish_relativistic_push(dt, move)
+
+    def _interpolate_guiding_center_fields(self, x):
+        """
+        Return B, E, the gradient of the field strength and the field line
+        curvature at the positions ``x``, with B split into its strength
+        and direction.
+        """
+        fields = self.fields._evaluate_with_jacobian(x)
+        B = fields[:, :3]
+        # jacobian[:, i, j] is the derivative of B_i along axis j
+        jacobian = fields[:, 6:].reshape(-1, 3, 3)
+        B_magnitude = np.sqrt(np.einsum("ij,ij->i", B, B))[:, np.newaxis]
+        b = B / B_magnitude
+
+        grad_B = np.einsum("ni,nij->nj", b, jacobian)
+        # (b . grad) b, with grad b = (jacobian - b grad_B) / |B|
+        curvature = (
+            np.einsum("nij,nj->ni", jacobian, b)
+            - b * np.einsum("nj,nj->n", grad_B, b)[:, np.newaxis]
+        ) / B_magnitude
+        return b, B_magnitude, fields[:, 3:6], grad_B, curvature
+
+    @staticmethod
+    def _magnetization(w_speed, q_over_m, B_magnitude, grad_B, curvature):
+        """
+        Return the magnetization parameter of particles with gyration
+        speed ``w_speed``, the Larmor radius over the field scale length.
+        """
+        scale = np.maximum(
+            np.linalg.norm(grad_B, axis=1) / B_magnitude[:, 0],
+            np.linalg.norm(curvature, axis=1),
+        )
+        return w_speed / np.abs(q_over_m[:, 0] * B_magnitude[:, 0]) * scale
 
-        self.v = v_new
-        if not init:
-            self.x += self.v * dt
+    def _gyration(self, index):
+        """
+        Return the field direction and strength, the parallel velocity,
+        the gyration velocity in the frame drifting with E x B and the
+        magnetization parameter of the particles ``index``.
+        """
+        v = self._v[index]
+        b, B_magnitude, E, grad_B, curvature = self._interpolate_guiding_center_fields(
+            self._x[index]
+        )
+        v_parallel = np.einsum("ij,ij->i", v, b)
+        w = v - v_parallel[:, np.newaxis] * b - np.cross(E, b) / B_magnitude
+        magnetization = self._magnetization(
+            np.sqrt(np.einsum("ij,ij->i", w, w)),
+            self._q_over_m[index],
+            B_magnitude,
+            grad_B,
+            curvature,
+        )
+        return b, B_magnitude, v_parallel, w, magnetization
+
+    def _set_guiding_centers(self):
+        """
+        Select the guiding-center particles and replace their positions
+        with their guiding centers.
+        """
+        self._gc_index = np.zeros(0, dtype=int)
+        self._gc_q_over_m = np.zeros((0, 1))
+        self._gc_x = np.zeros((0, 3))
+        self._gc_v_parallel = np.zeros(0)
+        self._gc_mu = np.zeros(0)
+        if self.pusher != "guiding_center" and self.magnetization_threshold is None:
+            return
+
+        index = np.arange(self._x.shape[0])
+        b, B_magnitude, v_parallel, w, magnetization = self._gyration(index)
+        if self.pusher != "guiding_center":
+            index = np.flatnonzero(magnetization < self.magnetization_threshold)
+        self._add_guiding_centers(
+            index, b[index], B_magnitude[index], v_parallel[index], w[index]
+        )
+
+    def _add_guiding_centers(self, index, b, B_magnitude, v_parallel, w):
+        """
+        Replace the particles ``index`` with their guiding centers, given
+        the field direction and strength, their parallel velocity and
+        their gyration velocity.
+        """
+        q_over_m = self._q_over_m[index]
+        x = self._x[index] + np.cross(w, b) / (q_over_m * B_magnitude)
+        n = self._gc_index.size
+        self._gc_index = np.concatenate([self._gc_index, index])
+        self._gc_q_over_m = np.concatenate([self._gc_q_over_m, q_over_m])
+        self._gc_x = np.concatenate([self._gc_x, x])
+        self._gc_v_parallel = np.concatenate([self._gc_v_parallel, v_parallel])
+        self._gc_mu = np.concatenate(
+            [self._gc_mu, np.einsum("ij,ij->i", w, w) / (2 * B_magnitude[:, 0])]
+        )
+        self._x[index] = x
+        self._v[index] = self._guiding_center_derivatives(
+            x, v_parallel, slice(n, None)
+        )[0]
+
+    def _release_guiding_centers(self, released):
+        """
+        Replace the guiding centers selected by the boolean array
+        ``released`` with particles gyrating around them, and return the
+        indices of these particles.
+        """
+        index = self._gc_index[released]
+        x = self._gc_x[released]
+        q_over_m = self._gc_q_over_m[released]
+        b, B_magnitude, E = self._interpolate_guiding_center_fields(x)[:3]
+
+        # the gyration velocity at the gyrophase where it is normal to
+        # the axis along which b is smallest
+        normal = np.cross(b, np.eye(3)[np.argmin(np.abs(b), axis=1)])
+        normal /= np.linalg.norm(normal, axis=1)[:, np.newaxis]
+        w = np.sqrt(2 * self._gc_mu[released] * B_magnitude[:, 0])
+        w = w[:, np.newaxis] * normal
+
+        self._x[index] = x - np.cross(w, b) / (q_over_m * B_magnitude)
+        self._v[index] = (
+            self._gc_v_parallel[released, np.newaxis] * b
+            + w
+            + np.cross(E, b) / B_magnitude
+        )
+        for name in _GUIDING_CENTER_ARRAYS:
+            setattr(self, name, getattr(self, name)[~released])
+        return index
+
+    def _switch_guiding_centers(self, step):
+        """
+        Replace the guiding centers whose magnetization parameter rose
+        above the threshold with gyrating particles, and the particles
+        whose magnetization parameter fell below half the threshold with
+        their guiding centers.
+        """
+        threshold = self.magnetization_threshold
+        dt = self.dt.si.value
+
+        captured = self._full_orbit_index()
+        if captured.size:
+            captured = captured[self._gyration(captured)[-1] < threshold / 2]
+
+        released = np.zeros(0, dtype=int)
+        if self._gc_index.size:
+            fields = self._interpolate_guiding_center_fields(self._gc_x)
+            B_magnitude, grad_B, curvature = fields[1], fields[3], fields[4]
+            magnetization = self._magnetization(
+                np.sqrt(2 * self._gc_mu * B_magnitude[:, 0]),
+                self._gc_q_over_m,
+                B_magnitude,
+                grad_B,
+                curvature,
+            )
+            if np.any(magnetization > threshold):
+                released = self._release_guiding_centers(magnetization > threshold)
+
+        if released.size:
+            # velocities half a step behind the positions
+            if self.pusher != "boris":
+                self._set_proper_velocity(released)
+            self._push_particles(released, -dt / 2, move=False)
+        if captured.size:
+            # velocities at the time of the positions
+            self._push_particles(captured, dt / 2, move=False)
+            b, B_magnitude, v_parallel, w, _ = self._gyration(captured)
+            self._add_guiding_centers(captured, b, B_magnitude, v_parallel, w)
+
+    def _full_orbit_index(self):
+        """Return the indices of the particles that are not guiding centers."""
+        full_orbit = np.ones(self._x.shape[0], dtype=bool)
+        full_orbit[self._gc_index] = False
+        return np.flatnonzero(full_orbit)
+
+    def _full_orbit_push(self, dt, move=True):
+        """
+        Advance the particles that are not guiding centers with the
+        full-orbit pusher.
+        """
+        if self._push is None:
+            return
+        if self._gc_index.size == 0:
+            self._push(dt, move)
+        else:
+            self._push_particles(self._full_orbit_index(), dt, move)
+
+    def _push_particles(self, index, dt, move):
+        """
+        Advance the particles ``index`` only with the full-orbit pusher,
+        which then works on copies of their arrays.
+        """
+        if index.size == 0:
+            return
+        arrays = {
+            name: getattr(self, name)
+            for name in _PUSHED_ARRAYS + ("_q_over_m",) + _WORK_ARRAYS
+        }
+        try:
+            for name in _PUSHED_ARRAYS + ("_q_over_m",):
+                setattr(self, name, arrays[name][index])
+            for name in _WORK_ARRAYS:
+                setattr(self, name, arrays[name][: index.size])
+            self._push(dt, move)
+            for name in _PUSHED_ARRAYS:
+                arrays[name][index] = getattr(self, name)
+        finally:
+            for name, array in arrays.items():
+                setattr(self, name, array)
+
+    def _guiding_center_derivatives(self, x, v_parallel, particles=slice(None)):
+        """
+        Return the time derivatives of the guiding center positions ``x``
+        and parallel velocities ``v_parallel`` of the guiding centers
+        ``particles``.
+        """
+        if self.boundary is not None:
+            # the Runge-Kutta stages of particles close to the boundary
+            # may be outside of the domain, where the fields are taken
+            # at the boundary
+            x = np.clip(x, self._lower, self._upper)
+        b, B_magnitude, E, grad_B, curvature = self._interpolate_guiding_center_fields(
+            x
+        )
+        q_over_m = self._gc_q_over_m[particles]
+        mu = self._gc_mu[particles, np.newaxis]
+
+        # force per unit mass perpendicular to the field
+        force = q_over_m * E - mu * grad_B - v_parallel[:, np.newaxis] ** 2 * curvature
+        drift = np.cross(force, b) / (q_over_m * B_magnitude)
+
+        x_dot = v_parallel[:, np.newaxis] * b + drift
+        v_parallel_dot = np.einsum("ij,ij->i", q_over_m * E - mu * grad_B, b)
+        return x_dot, v_parallel_dot
+
+    def _guiding_center_push(self, dt):
+        """
+        Advance the guiding-center particles by one fourth order
+        Runge-Kutta step of length ``dt`` seconds.
+        """
+        if self._gc_index.size == 0:
+            return
+        x = self._gc_x
+        v_parallel = self._gc_v_parallel
+        derivative = self._guiding_center_derivatives
 
-    def run(self):
+        k1_x, k1_v = derivative(x, v_parallel)
+        k2_x, k2_v = derivative(x + dt / 2 * k1_x, v_parallel + dt / 2 * k1_v)
+        k3_x, k3_v = derivative(x + dt / 2 * k2_x, v_parallel + dt / 2 * k2_v)
+        k4_x, k4_v = derivative(x + dt * k3_x, v_parallel + dt * k3_v)
+
+        velocity = (k1_x + 2 * k2_x + 2 * k3_x + k4_x) / 6
+        self._gc_v_parallel = v_parallel + dt / 6 * (k1_v + 2 * k2_v + 2 * k3_v + k4_v)
+        self._gc_x = x + dt * velocity
+        # the positions and velocities of these particles are those of
+        # their guiding centers
+        self._x[self._gc_index] = self._gc_x
+        self._v[self._gc_index] = velocity
+
+    def _step(self, dt):
+        """Advance all particles by one step of length ``dt`` seconds."""
+        self._full_orbit_push(dt)
+        self._guiding_center_push(dt)
+
+    def run(self, processes=None):
         r"""
-        Runs a simulation instance.
+        Runs a simulation instance: `initialize`, `simulate` and
+        `finalize`.
+
+        Each time step calls the stages returned by ``_stages`` at their
+        cadences: the push and the boundary conditions every step, the
+        collisions every ``collisions.every``-th step, the stages added
+        with `add_stage`, the history every
+        ``history.every``-th step, each diagnostic every
+        ``diagnostic.every``-th step and the checkpoint every
+        ``checkpoint.every``-th step.  The wall time of each stage is
+        kept in `timings` and printed by `summarize`.
+
+        Parameters
+        ----------
+        processes : int, optional
+            if given, the particles are split into ``processes`` groups
+            that are pushed in parallel by as many worker processes.
+
+        Notes
+        -----
+        The groups can be pushed independently since the particles do
+        not interact with each other, so that parallel runs cannot have
+        collisions or self-consistent fields.  Gridded fields are copied
+        once to shared memory, which every worker maps without copying
+        it, so that parallel runs require Python 3.8 or later.  Analytic
+        fields, the history policy and the diagnostics are pickled, so
+        that their functions must be defined at module level.  The
+        history and the diagnostics of the groups are gathered into
+        those of the tracker after the run.  Only the built-in reduction
+        diagnostics of `~plasmapy.simulation.diagnostics` can be gathered,
+        and `timings` sums the wall times of all workers.
+        """
+        if processes is not None and int(processes) > 1:
+            self._run_parallel(int(processes))
+            return
+
+        super().run()
+
+    def initialize(self):
+        """
+        Open the history, the diagnostics and the checkpoints, and set
+        up the initial state of the pusher.
+        """
+        self._reset_timings()
+        self._start = 1
+        self.history.open(self)
+        for diagnostic in self.diagnostics:
+            diagnostic.open(self)
+        if self.collisions is not None:
+            self.collisions.open(self)
+        if self.checkpoint is not None:
+            self.checkpoint.open(self)
+        self._update_fields(0)
+        self.push(init=True)
+        self._record(0)
+
+    def finalize(self):
+        """Finish saving the history and the checkpoints."""
+        self.history.close()
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+
+    def summarize(self):
+        """
+        Print a summary of the tracker and the wall time spent in each
+        stage of the time steps during the last run.
+        """
+        print(self)
+        super().summarize()
+
+    def _stages(self):
+        """
+        Return the stages of a time step: the push, the boundary
+        conditions, the switch between full orbits and guiding centers,
+        the collisions, the update of self-consistent fields, the stages
+        added by `add_stage`, the history, the diagnostics and the
+        checkpoints.
+        """
+        dt = self.dt.si.value
+        stages = [_Stage("push", lambda step: self._step(dt), 1)]
+        if self.boundary is not None:
+            stages.append(_Stage("boundaries", self._apply_boundaries, 1))
+        if self.pusher != "guiding_center" and self.magnetization_threshold is not None:
+            stages.append(_Stage("magnetization", self._switch_guiding_centers, 1))
+        if self.collisions is not None:
+            collisions = self.collisions
+            stages.append(
+                _Stage(
+                    "collisions",
+                    lambda step: collisions.update(step, self),
+                    collisions.every,
+                )
+            )
+        if self.fields._self_consistent:
+            stages.append(_Stage("fields", self._update_fields, 1))
+        stages.extend(self.added_stages)
+        if not isinstance(self.history, _NoHistory):
+            stages.append(_Stage("history", self._save_history, self.history.every))
+        for diagnostic in self.diagnostics:
+            stages.append(
+                _Stage(
+                    "diagnostics",
+                    lambda step, diagnostic=diagnostic: diagnostic.update(step, self),
+                    diagnostic.every,
+                )
+            )
+        if self.checkpoint is not None:
+            checkpoint = self.checkpoint
+            stages.append(
+                _Stage(
+                    "checkpoint",
+                    lambda step: checkpoint.update(step, self),
+                    checkpoint.every,
+                )
+            )
+        return stages
+
+    def restart(self, path):
+        """
+        Continue a run from the checkpoint file ``path`` saved by a
+        `~plasmapy.simulation.checkpoint.Checkpoint`.
+
+        The tracker must be created with the same arguments as the one
+        that saved the checkpoint.  The run then continues exactly as it
+        would have without the interruption, appending to the saved
+        history and diagnostics.
+
+        Parameters
+        ----------
+        path : str
+            Path of the checkpoint file.
+        """
+        state = _read_checkpoint(path)
+        if (
+            state["N"] != self.N
+            or state["NT"] != self.NT
+            or state["dt"] != self.dt.si.value
+            or str(state["pusher"]) != self.pusher
+            or list(state["species"]) != [str(s) for s in self.species]
+            or len(state["diagnostics"]) != len(self.diagnostics)
+            or bool(state["collisions"]) != (self.collisions is not None)
+        ):
+            raise ValueError(
+                f"The checkpoint {path} was saved by a different simulation."
+            )
+        step = int(state["step"])
+
+        for name in _PARTICLE_ARRAYS + _GUIDING_CENTER_ARRAYS:
+            setattr(self, name, state[name])
+        n = self._x.shape[0]
+        for name in _WORK_ARRAYS:
+            shape = getattr(self, name).shape
+            setattr(self, name, np.empty((n,) + shape[1:]))
+        self.species_slices = {
+            species: slice(
+                *np.searchsorted(self._ids, [particles.start, particles.stop])
+            )
+            for species, particles in self._species_particles.items()
+        }
+        self._lost = []
+        if state["lost_particles"].size:
+            self._lost.append(tuple(state[f"lost_{name}"] for name in _LOST_FIELDS))
+
+        self._reset_timings()
+        self._start = step + 1
+        try:
+            self.history._resume(self, state["history"], step)
+            for diagnostic, values in zip(self.diagnostics, state["diagnostics"]):
+                diagnostic._resume(self, values)
+            if self.collisions is not None:
+                self.collisions._resume(self, state["collisions"])
+            if self.checkpoint is not None:
+                self.checkpoint.open(self)
+            self._update_fields(step)
+            self.simulate()
+        finally:
+            self.finalize()
+
+    def _update_fields(self, step):
+        """Update self-consistent fields from the particles at ``step``."""
+        if self.fields._self_consistent:
+            self.fields._update(self)
+
+    def _checkpoint_state(self, step):
+        """Return a copy of the state of the run after time step ``step``."""
+        state = {
+            "step": step,
+            "N": self.N,
+            "NT": self.NT,
+            "dt": self.dt.si.value,
+            "pusher": self.pusher,
+            "species": [str(s) for s in self.species],
+            "history": self.history._state(),
+            "diagnostics": [diagnostic._state() for diagnostic in self.diagnostics],
+            "collisions": {} if self.collisions is None else self.collisions._state(),
+        }
+        for name in _PARTICLE_ARRAYS + _GUIDING_CENTER_ARRAYS:
+            state[name] = getattr(self, name).copy()
+        lost = self._lost or [
+            (
+                np.zeros(0, dtype=int),
+                np.zeros(0, dtype=int),
+                np.zeros((0, 3)),
+                np.zeros((0, 3)),
+            )
+        ]
+        for name, field in zip(_LOST_FIELDS, zip(*lost)):
+            state[f"lost_{name}"] = np.concatenate(field)
+        return state
+
+    def _record(self, step):
+        """Save the history and update the diagnostics at ``step``."""
+        self._save_history(step)
+        for diagnostic in self.diagnostics:
+            diagnostic.update(step, self)
+
+    def _save_history(self, step):
+        """Save the history at ``step``."""
+        x, v = self._x, self._v
+        if x.shape[0] < self.N:
+            # lost particles are saved as NaN
+            x = np.full((self.N, 3), np.nan)
+            v = np.full((self.N, 3), np.nan)
+            x[self._ids] = self._x
+            v[self._ids] = self._v
+        self.history.record(step, x, v)
+
+    def _set_boundaries(self, boundary, domain):
+        """Validate the boundary conditions and the simulation box."""
+        self.boundary = boundary
+        self._lost = []
+        if boundary is None:
+            return
+        boundary = np.broadcast_to(np.asarray(boundary, dtype=object), 3)
+        for condition in boundary:
+            if condition not in _BOUNDARIES:
+                raise ValueError(
+                    f"Unknown boundary {condition!r}, expected one of "
+                    f"{', '.join(_BOUNDARIES)}."
+                )
+        if domain is None:
+            domain = self.fields.bounds
+            if domain is None:
+                raise ValueError("The fields do not define the domain.")
+        else:
+            domain = u.Quantity(domain, u.m).value
+        self._lower, self._upper = np.array(domain, dtype=float)
+        self._boundary_axes = {
+            condition: [axis for axis in range(3) if boundary[axis] == condition]
+            for condition in _BOUNDARIES
+        }
+
+    def _apply_boundaries(self, step):
+        """
+        Apply the boundary conditions to the particles that left the
+        simulation box during time step ``step``.
+        """
+        x, v = self._x, self._v
+        outside = (x < self._lower) | (x > self._upper)
+        if not outside.any():
+            return
+        lower, upper = self._lower, self._upper
+        length = upper - lower
+        gc_index = self._gc_index
+
+        for axis in self._boundary_axes["periodic"]:
+            x[:, axis] = lower[axis] + np.mod(x[:, axis] - lower[axis], length[axis])
+
+        for axis in self._boundary_axes["reflecting"]:
+            # fold the position into a box of twice the length, in which
+            # the second half is the mirror image of the first
+            folded = np.mod(x[:, axis] - lower[axis], 2 * length[axis])
+            mirrored = folded > length[axis]
+            x[:, axis] = lower[axis] + np.where(
+                mirrored, 2 * length[axis] - folded, folded
+            )
+            v[mirrored, axis] *= -1
+            self._u[mirrored, axis] *= -1
+            gc_mirrored = np.flatnonzero(mirrored[gc_index])
+            if gc_mirrored.size:
+                # the mirrored parallel velocity v_parallel b projects on b
+                # as v_parallel (1 - 2 b[axis] ** 2), which only changes
+                # sign if the field is mostly normal to the wall
+                b = self._interpolate_guiding_center_fields(x[gc_index[gc_mirrored]])[0]
+                flip = gc_mirrored[1 - 2 * b[:, axis] ** 2 < 0]
+                self._gc_v_parallel[flip] *= -1
+
+        # the guiding centers are the positions of their particles
+        self._gc_x[...] = x[gc_index]
+
+        absorbing = self._boundary_axes["absorbing"]
+        if absorbing:
+            lost = np.any(outside[:, absorbing], axis=1)
+            if lost.any():
+                self._remove(lost, step)
+
+    def _remove(self, lost, step):
+        """
+        Log the particles selected by the boolean array ``lost`` and
+        compact them out of the arrays of live particles.
+        """
+        self._lost.append(
+            (self._ids[lost], np.full(lost.sum(), step), self._x[lost], self._v[lost])
+        )
+        self._compact(lost)
+
+    def _compact(self, lost):
+        """
+        Remove the particles selected by the boolean array ``lost`` from
+        the arrays of live particles, keeping the order of the others.
+        """
+        keep = np.flatnonzero(~lost)
+        n = keep.size
+        for name in _PARTICLE_ARRAYS:
+            array = getattr(self, name)
+            array[:n] = array[keep]
+            setattr(self, name, array[:n])
+        for name in _WORK_ARRAYS:
+            setattr(self, name, getattr(self, name)[:n])
+
+        self.species_slices = {
+            species: slice(
+                *np.searchsorted(self._ids, [particles.start, particles.stop])
+            )
+            for species, particles in self._species_particles.items()
+        }
+
+        if self._gc_index is None:
+            return
+        # new index of each old live particle, -1 if it was lost
+        new_index = np.full(lost.size, -1)
+        new_index[keep] = np.arange(n)
+        gc_index = new_index[self._gc_index]
+        gc_kept = gc_index >= 0
+        self._gc_index = gc_index[gc_kept]
+        for name in ("_gc_q_over_m", "_gc_x", "_gc_v_parallel", "_gc_mu"):
+            setattr(self, name, getattr(self, name)[gc_kept])
+
+    def _run_parallel(self, processes):
+        """Run the particles in groups on ``processes`` worker processes."""
+        if sys.version_info < (3, 8):
+            raise RuntimeError(
+                "Parallel runs need multiprocessing.shared_memory, "
+                "available on Python 3.8 or later."
+            )
+        if self.checkpoint is not None:
+            raise ValueError("Parallel runs cannot be checkpointed.")
+        if self.added_stages:
+            raise ValueError("Parallel runs cannot call added stages.")
+        if self.collisions is not None:
+            raise ValueError("Colliding particles must be in the same process.")
+        if self.fields._self_consistent:
+            raise ValueError(
+                "Self-consistent fields need all particles in the same process."
+            )
+        for diagnostic in self.diagnostics:
+            if not isinstance(diagnostic, _Reduction):
+                raise ValueError(
+                    f"The diagnostic {diagnostic!r} cannot be gathered from "
+                    f"several processes."
+                )
+        if self.pusher == "guiding_center" or self.magnetization_threshold is not None:
+            self.fields._set_jacobian()
+
+        n_live = self._x.shape[0]
+        groups = [
+            slice(particles[0], particles[-1] + 1)
+            for particles in np.array_split(np.arange(n_live), processes)
+            if particles.size
+        ]
+        blocks = []
+        try:
+            fields = self.fields._shared(blocks)
+            trackers = [self._group(particles, fields) for particles in groups]
+            states = _run_groups(trackers, processes)
+        finally:
+            for block in blocks:
+                block.release()
+
+        # the particles that are still alive, in their original order
+        lost = np.ones(n_live, dtype=bool)
+        for particles, state in zip(groups, states):
+            lost[particles.start + state["ids"]] = False
+        self._compact(lost)
+        for name in ("_x", "_v", "_u", "_gamma"):
+            getattr(self, name)[...] = np.concatenate([state[name] for state in states])
+
+        lost = []
+        for tracker, state in zip(trackers, states):
+            for ids, steps, x, v in state["lost"]:
+                lost.append((tracker._original_ids[ids], steps, x, v))
+        if lost:
+            particles, steps, x, v = (np.concatenate(field) for field in zip(*lost))
+            order = np.argsort(steps, kind="stable")
+            self._lost.append((particles[order], steps[order], x[order], v[order]))
+
+        self._gather_history(trackers, states)
+        self._reset_timings()
+        for state in states:
+            timings, calls = state["timings"]
+            for name, seconds in timings.items():
+                self._time(name, seconds, calls[name])
+        for i, diagnostic in enumerate(self.diagnostics):
+            diagnostic.open(self)
+            for k, step in enumerate(states[0]["diagnostics"][i][0]):
+                total = sum(state["diagnostics"][i][1][k] for state in states)
+                diagnostic._steps.append(step)
+                diagnostic._values.append(diagnostic._finish(total))
+
+    def _group(self, particles, fields):
+        """
+        Return a tracker of the live particles in the slice ``particles``
+        in the field source ``fields``, to be run in a worker process.
+        """
+        group = copy.copy(self)
+        group.plasma = None
+        group.fields = fields
+        for name in _PARTICLE_ARRAYS:
+            setattr(group, name, getattr(self, name)[particles].copy())
+        for name in _WORK_ARRAYS:
+            setattr(group, name, np.empty_like(getattr(self, name)[particles]))
+
+        ids = self._ids[particles].copy()
+        group.N = ids.size
+        group._ids = np.arange(ids.size)
+        group._original_ids = ids
+        group._all_eff_m = self._all_eff_m[ids]
+        group._species_particles = {
+            species: slice(*np.searchsorted(ids, [p.start, p.stop]))
+            for species, p in self._species_particles.items()
+        }
+        group.species_slices = dict(group._species_particles)
+        group._lost = []
+        # set up by push(init=True) in the worker
+        group._gc_index = None
+        group._gc_x = group._gc_v_parallel = group._gc_mu = None
+        if self._push is not None:
+            group._push = getattr(group, f"_{self.pusher}_push")
+
+        # save the particles of the group among those saved by the history
+        if isinstance(self.history, _NoHistory):
+            group.history = _NoHistory()
+        else:
+            saved = np.arange(self.N)[_select_particles(self.history.particles, self.N)]
+            group._saved = np.flatnonzero(np.isin(ids, saved))
+            group.history = MemoryHistory(
+                self.history.every, group._saved, getattr(self.history, "last", None)
+            )
+        group.diagnostics = [_PartialDiagnostic(d) for d in self.diagnostics]
+        return group
+
+    def _group_state(self):
+        """Return the state of a group of particles after a parallel run."""
+        return {
+            "ids": self._ids,
+            "_x": self._x,
+            "_v": self._v,
+            "_u": self._u,
+            "_gamma": self._gamma,
+            "lost": self._lost,
+            "steps": self.history.steps,
+            "positions": self.history.positions.value,
+            "velocities": self.history.velocities.value,
+            "diagnostics": [(d.steps, d.partials) for d in self.diagnostics],
+            "timings": (self.timings, self._calls),
+        }
+
+    def _gather_history(self, trackers, states):
+        """Save the histories of the groups of a parallel run to ``history``."""
+        if isinstance(self.history, _NoHistory):
+            return
+        self.history.open(self)
+        try:
+            x = np.full((self.N, 3), np.nan)
+            v = np.full((self.N, 3), np.nan)
+            for k, step in enumerate(states[0]["steps"]):
+                for tracker, state in zip(trackers, states):
+                    saved = tracker._original_ids[tracker._saved]
+                    x[saved] = state["positions"][k]
+                    v[saved] = state["velocities"][k]
+                self.history.record(step, x, v)
+        finally:
+            self.history.close()
+
+    @property
+    def exit_log(self):
+        """
+        The particles removed by an absorbing boundary, as an `ExitLog`
+        of their indices among all particles, the times at which they
+        were found outside of the domain, and their positions and
+        velocities at that time.
         """
-        self.boris_push(init=True)
-        self.position_history[0] = self.x
-        self.velocity_history[0] = self.v
-        for i in range(1, self.NT):
-            self.boris_push()
-            self.position_history[i] = self.x
-            self.velocity_history[i] = self.v
+        if not self._lost:
+            return ExitLog(
+                np.zeros(0, dtype=int),
+                np.zeros(0) * u.s,
+                np.zeros((0, 3)) * u.m,
+                np.zeros((0, 3)) * u.m / u.s,
+            )
+        particles, steps, x, v = (np.concatenate(field) for field in zip(*self._lost))
+        return ExitLog(particles, self.t[steps], x * u.m, v * u.m / u.s)
 
     def __repr__(self, *args, **kwargs):
         return (
-            f"Species(q={self.q:.4e},m={self.m:.4e},N={self.N},"
-            f'name="{self.name}",NT={self.NT})'
+            f"Species(q={_format(self.q, '.4e')},m={_format(self.m, '.4e')},"
+            f'N={self.N},name="{self.name}",NT={self.NT})'
         )
 
     def __str__(self):  # coverage: ignore
         return (
-            f"{self.N} {self.scaling:.2e}-{self.name} with "
-            f"q = {self.q:.2e}, m = {self.m:.2e}, "
+            f"{self.N} {_format(self.scaling, '.2e')}-{self.name} with "
+            f"q = {_format(self.q, '.2e')}, m = {_format(self.m, '.2e')}, "
             f"{self.saved_iterations} saved history "
             f"steps over {self.NT} iterations"
         )
@@ -215,8 +1485,7 @@ class ParticleTracker:
         quantity_support()
         fig = plt.figure()
         ax = fig.add_subplot(111, projection="3d")
-        for p_index in range(self.N):
-            r = self.position_history[:, p_index]
+        for r in np.moveaxis(self.position_history, 1, 0):
             x, y, z = r.T
             ax.plot(x, y, z)
         ax.set_title(self.name)
@@ -242,15 +1511,15 @@ class ParticleTracker:
 
         quantity_support()
         fig, ax = plt.subplots()
-        for p_index in range(self.N):
-            r = self.position_history[:, p_index]
+        t = self.time_history
+        for p_index, r in enumerate(np.moveaxis(self.position_history, 1, 0)):
             x, y, z = r.T
             if "x" in plot:
-                ax.plot(self.t, x, label=f"x_{p_index}")
+                ax.plot(t, x, label=f"x_{p_index}")
             if "y" in plot:
-                ax.plot(self.t, y, label=f"y_{p_index}")
+                ax.plot(t, y, label=f"y_{p_index}")
             if "z" in plot:
-                ax.plot(self.t, z, label=f"z_{p_index}")
+                ax.plot(t, z, label=f"z_{p_index}")
         ax.set_title(self.name)
         ax.legend(loc="best")
         ax.grid()
@@ -0,0 +1,111 @@
+"""
+A time-dependent simulation driver calling the stages of each time step
+at their own cadences.
+"""
+__all__ = ["ScheduledSimulation"]
+
+import time
+
+from collections import namedtuple
+
+from plasmapy.simulation.abstractions import AbstractTimeDependentSimulation
+
+_Stage = namedtuple("_Stage", ["name", "function", "every"])
+
+
+class ScheduledSimulation(AbstractTimeDependentSimulation):
+    """
+    A simulation advanced by ``NT`` time steps, each of which calls a
+    sequence of stages, such as the particle push, the field update, the
+    diagnostics and the output.  Each stage is called every ``every``-th
+    time step and its wall time is measured.
+
+    Subclasses set ``NT`` and implement `initialize`, `finalize` and
+    ``_stages``, returning the stages of the simulation in the order in
+    which they are called, with the stages added by `add_stage`.
+
+    Attributes
+    ----------
+    added_stages : list
+        The stages added by `add_stage`.
+    timings : dict
+        The total wall time spent in each stage during the last run, in
+        seconds.
+    """
+
+    def __init__(self):
+        self.added_stages = []
+        self.timings = {}
+        self._calls = {}
+        # the first time step of simulate
+        self._start = 1
+
+    def add_stage(self, name, function, every=1):
+        """
+        Add a stage to the time steps, called every ``every``-th time
+        step after the particles are advanced.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage in `timings`.
+
+        function : callable
+            Function called with the index of the time step.
+
+        every : int, optional
+            Call ``function`` every ``every``-th time step.  Defaults to
+            ``1``.
+        """
+        every = int(every)
+        if every < 1:
+            raise ValueError("every must be a positive integer.")
+        self.added_stages.append(_Stage(name, function, every))
+
+    def _stages(self):
+        """Return the stages of a time step in the order they are called."""
+        return list(self.added_stages)
+
+    def _reset_timings(self):
+        self.timings = {}
+        self._calls = {}
+
+    def _time(self, name, seconds, calls=1):
+        """Add ``calls`` calls of the stage ``name`` taking ``seconds``."""
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+        self._calls[name] = self._calls.get(name, 0) + calls
+
+    def run(self):
+        """Initialize, simulate and finalize the simulation."""
+        try:
+            self.initialize()
+            self.simulate()
+        finally:
+            self.finalize()
+
+    def simulate(self):
+        """Run the time steps from the one after the initial state."""
+        stages = self._stages()
+        for stage in stages:
+            self._time(stage.name, 0.0, calls=0)
+        timings, calls = self.timings, self._calls
+        clock = time.perf_counter
+        for step in range(self._start, self.NT):
+            for name, function, every in stages:
+                if step % every == 0:
+                    start = clock()
+                    function(step)
+                    timings[name] += clock() - start
+                    calls[name] += 1
+
+    def summarize(self):
+        """Print the wall time spent in each stage during the last run."""
+        total = sum(self.timings.values())
+        print(f"{'stage':<16}{'calls':>8}{'time [s]':>12}{'per call [ms]':>15}{'':>8}")
+        for name, seconds in self.timings.items():
+            calls = self._calls[name]
+            per_call = 1e3 * seconds / calls if calls else 0.0
+            share = 100 * seconds / total if total else 0.0
+            print(
+                f"{name:<16}{calls:>8}{seconds:>12.4f}{per_call:>15.4f}{share:>7.1f}%"
+            )
@@ -0,0 +1,58 @@
+"""Fixtures shared by the tests of `plasmapy.simulation`."""
+import astropy.units as u
+import numpy as np
+import pytest
+
+from plasmapy.plasma.sources import Plasma3D
+from plasmapy.simulation.particletracker import ParticleTracker
+
+
+@pytest.fixture()
+def uniform_magnetic_field(N=3, max_x=1):
+    x = np.linspace(-max_x, max_x, N) * u.m
+    test_plasma = Plasma3D(x, x, x)
+    magfieldstr = 1 * u.T
+    test_plasma.magnetic_field[2] = magfieldstr
+    return test_plasma
+
+
+@pytest.fixture()
+def make_tracker(uniform_magnetic_field):
+    """
+    Return a function creating a `ParticleTracker` in ``fields``, by
+    default the ``uniform_magnetic_field`` plasma.
+
+    The positions and velocities are set to ``x`` and ``v`` if they are
+    given.  Otherwise, with ``x_spread`` in m or ``v_spread`` in m/s,
+    they are drawn with the random ``seed`` uniformly within
+    ``x_spread`` of the origin along each axis, or from a normal
+    distribution of standard deviation ``v_spread``.  The other
+    arguments are passed to `ParticleTracker`.
+    """
+
+    def make_tracker(
+        particle_type="p",
+        n_particles=1,
+        fields=None,
+        x=None,
+        v=None,
+        x_spread=None,
+        v_spread=None,
+        seed=0,
+        **kwargs,
+    ):
+        if fields is None:
+            fields = uniform_magnetic_field
+        s = ParticleTracker(fields, particle_type, n_particles, **kwargs)
+        rng = np.random.default_rng(seed)
+        if x_spread is not None:
+            s.x = rng.uniform(-x_spread, x_spread, (s.N, 3)) * u.m
+        if v_spread is not None:
+            s.v = rng.normal(0, v_spread, (s.N, 3)) * u.m / u.s
+        if x is not None:
+            s.x = x
+        if v is not None:
+            s.v = v
+        return s
+
+    return make_tracker
@@ -0,0 +1,131 @@
+import astropy.units as u
+import functools
+import numpy as np
+import os
+import pytest
+
+from plasmapy.simulation.checkpoint import _read_checkpoint, Checkpoint
+from plasmapy.simulation.diagnostics import (
+    Diagnostic,
+    KineticEnergyConservation,
+    MeanVelocity,
+    ParticleCount,
+)
+from plasmapy.simulation.history import HDF5History, MemoryHistory
+
+
+@pytest.fixture()
+def drifting_particles(make_tracker, uniform_magnetic_field):
+    """
+    Return a function creating a tracker of drifting, gyrating particles,
+    some of which leave through an absorbing boundary.
+    """
+    uniform_magnetic_field.magnetic_field[2] = 0.1 * u.T
+    uniform_magnetic_field.electric_field[0] = 10 * u.V / u.m
+    return functools.partial(
+        make_tracker,
+        ["e", "p"],
+        [6, 4],
+        x_spread=0.5,
+        v_spread=1e7,
+        seed=1,
+        dt=2e-9 * u.s,
+        nt=40,
+        boundary="absorbing",
+    )
+
+
+class Preempted(Exception):
+    pass
+
+
+def preempt(tracker, step):
+    """Interrupt the run of ``tracker`` at time step ``step``."""
+
+    def interrupt(i):
+        raise Preempted
+
+    tracker.add_stage("preempt", interrupt, every=step)
+
+
+def diagnostics():
+    return [
+        Diagnostic(lambda tracker: np.abs(tracker.v).max(), every=4),
+        KineticEnergyConservation(),
+        MeanVelocity(every=3, species="p"),
+        ParticleCount([-1, -1, 0] * u.m, [1, 1, 1] * u.m, every=5),
+    ]
+
+
+@pytest.mark.parametrize("pusher", ["boris", "vay", "guiding_center"])
+def test_restart(drifting_particles, pusher, tmp_path):
+    """Test that a restarted run continues bit for bit."""
+    path = tmp_path / "checkpoint.npz"
+    reference = drifting_particles(pusher=pusher, diagnostics=diagnostics())
+    reference.run()
+
+    # the run is interrupted after the checkpoint of step 20
+    interrupted = drifting_particles(
+        pusher=pusher, diagnostics=diagnostics(), checkpoint=Checkpoint(path, 10)
+    )
+    preempt(interrupted, 23)
+    with pytest.raises(Preempted):
+        interrupted.run()
+    assert int(_read_checkpoint(path)["step"]) == 20
+    assert not os.path.exists(f"{path}.tmp")
+    # the checkpoint holds no pickled objects
+    with np.load(path, allow_pickle=False) as arrays:
+        assert all(arrays[name].dtype != object for name in arrays.files)
+
+    s = drifting_particles(pusher=pusher, diagnostics=diagnostics())
+    s.restart(path)
+
+    assert np.array_equal(s.x, reference.x)
+    assert np.array_equal(s.v, reference.v)
+    assert s.species_slices == reference.species_slices
+    assert np.array_equal(s.history.steps, reference.history.steps)
+    assert np.array_equal(
+        s.position_history.value, reference.position_history.value, equal_nan=True
+    )
+    for field, expected in zip(s.exit_log, reference.exit_log):
+        assert np.array_equal(field, expected)
+    for diagnostic, expected in zip(s.diagnostics, reference.diagnostics):
+        assert np.array_equal(diagnostic.steps, expected.steps)
+        assert np.array_equal(diagnostic.values, expected.values)
+
+
+def test_restart_hdf5_history(drifting_particles, tmp_path):
+    """Test that the steps after the checkpoint are saved again to HDF5."""
+    pytest.importorskip("h5py")
+    path = tmp_path / "checkpoint.npz"
+    history = tmp_path / "history.h5"
+    interrupted = drifting_particles(
+        history=HDF5History(history, every=2, particles=[0, 9]),
+        checkpoint=Checkpoint(path, 10),
+    )
+    preempt(interrupted, 25)
+    with pytest.raises(Preempted):
+        interrupted.run()
+    assert interrupted.history.steps[-1] == 24
+
+    s = drifting_particles(history=HDF5History(history, every=2, particles=[0, 9]))
+    s.restart(path)
+    reference = drifting_particles(history=MemoryHistory(every=2, particles=[0, 9]))
+    reference.run()
+
+    assert np.array_equal(s.history.steps, np.arange(0, 40, 2))
+    assert np.array_equal(
+        s.velocity_history.value, reference.velocity_history.value, equal_nan=True
+    )
+
+
+def test_checkpoint_errors(drifting_particles, tmp_path):
+    """Test errors for invalid checkpoints."""
+    path = tmp_path / "checkpoint.npz"
+    with pytest.raises(ValueError):
+        Checkpoint(path, 0)
+    drifting_particles(checkpoint=Checkpoint(path, 10)).run()
+    with pytest.raises(ValueError):
+        drifting_particles(pusher="vay").restart(path)
+    with pytest.raises(ValueError):
+        drifting_particles(checkpoint=Checkpoint(path, 10)).run(processes=2)
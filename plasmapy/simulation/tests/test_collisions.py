@@ -0,0 +1,146 @@
+import astropy.units as u
+import numpy as np
+import pytest
+
+from astropy import constants
+
+from plasmapy.plasma.sources import Plasma3D
+from plasmapy.simulation.checkpoint import Checkpoint
+from plasmapy.simulation.collisions import BinaryCollisions
+from plasmapy.simulation.particletracker import ParticleTracker
+
+# density [m^-3] and temperature [K] of the plasmas
+DENSITY = 1e20
+TEMPERATURE = 1e5
+
+
+@pytest.fixture()
+def plasma():
+    x = np.linspace(0, 1e-3, 3) * u.m
+    return Plasma3D(x, x, x)
+
+
+def thermal_tracker(plasma, species, n_particles, collisions, dt, nt, seed=1):
+    """
+    Return a tracker of Maxwellian particles of ``species`` filling the
+    periodic box of ``plasma`` with the density ``DENSITY``.
+    """
+    n_particles = np.broadcast_to(n_particles, len(species))
+    s = ParticleTracker(
+        plasma,
+        species,
+        n_particles,
+        scaling=DENSITY * 1e-9 / n_particles.sum(),
+        dt=dt,
+        nt=nt,
+        boundary="periodic",
+        history=False,
+        collisions=collisions,
+    )
+    rng = np.random.default_rng(seed)
+    s.x = rng.uniform(0, 1e-3, (s.N, 3)) * u.m
+    mass = np.repeat(s.m, n_particles)
+    speed = np.sqrt(constants.k_B * TEMPERATURE * u.K / mass).to(u.m / u.s)
+    s.v = rng.normal(0, 1, (s.N, 3)) * speed[:, np.newaxis]
+    return s
+
+
+def test_conservation(plasma):
+    """Test that the collisions conserve the momentum and the energy."""
+    collisions = BinaryCollisions(plasma, every=2, seed=0)
+    s = thermal_tracker(plasma, ["e", "p"], [301, 200], collisions, 1e-10 * u.s, 9)
+    mass = np.repeat(s.m.si.value, [301, 200])[:, np.newaxis]
+    momentum = np.sum(mass * s.v.value, axis=0)
+    energy = np.sum(mass * s.v.value ** 2)
+    v = s.v.copy()
+    s.run()
+
+    assert s._calls["collisions"] == 4
+    assert not np.allclose(s.v.value, v.value)
+    scale = np.sqrt(energy * mass.sum())
+    assert np.allclose(
+        np.sum(mass * s.v.value, axis=0), momentum, rtol=0, atol=1e-13 * scale
+    )
+    assert np.sum(mass * s.v.value ** 2) == pytest.approx(energy, rel=1e-13)
+
+
+def test_isotropization(plasma):
+    """
+    Test that an anisotropic temperature relaxes at the rate of the NRL
+    Plasma Formulary, within the statistical noise.
+    """
+    kT = constants.k_B.si.value * TEMPERATURE
+    mass = constants.m_e.si.value
+    charge = constants.e.si.value
+    log = 10
+    parallel, perpendicular = 1.3, 0.85
+    a = perpendicular / parallel - 1
+    nu = (
+        2
+        * np.sqrt(np.pi)
+        * DENSITY
+        * log
+        * charge ** 4
+        / (
+            (4 * np.pi * constants.eps0.si.value) ** 2
+            * np.sqrt(mass)
+            * (parallel * kT) ** 1.5
+        )
+        * (-3 + (a + 3) * np.arctanh(np.sqrt(-a)) / np.sqrt(-a))
+        / a ** 2
+    )
+    # the anisotropy decays as exp(-3 nu t), over half of its decay time
+    dt = 0.5 / 25 / (3 * nu) * u.s
+    collisions = BinaryCollisions(plasma, coulomb_log=log, seed=0)
+    s = thermal_tracker(plasma, "e", 20000, collisions, dt, 26)
+    s._v *= np.sqrt([parallel, perpendicular, perpendicular])
+
+    def anisotropy():
+        temperature = np.mean(s._v ** 2, axis=0) * mass / kT
+        return temperature[0] - temperature[1:].mean()
+
+    initial = anisotropy()
+    s.run()
+    assert np.log(initial / anisotropy()) == pytest.approx(0.5, rel=0.2)
+
+
+def test_restart(plasma, tmp_path):
+    """Test that a restarted run collides the particles identically."""
+    path = tmp_path / "checkpoint.npz"
+    dt = 1e-10 * u.s
+
+    def tracker():
+        collisions = BinaryCollisions(plasma, seed=3)
+        return thermal_tracker(plasma, ["e", "p"], 50, collisions, dt, 12)
+
+    reference = tracker()
+    reference.run()
+    s = tracker()
+    s.checkpoint = Checkpoint(path, 5)
+    s.run()
+    restarted = tracker()
+    restarted.restart(path)
+    assert np.array_equal(restarted.v.value, reference.v.value)
+    # the checkpoint of a run with collisions cannot restart one without
+    without = thermal_tracker(plasma, ["e", "p"], 50, None, dt, 12)
+    with pytest.raises(ValueError):
+        without.restart(path)
+
+
+def test_collision_errors(plasma):
+    """Test errors for particles that cannot collide."""
+    with pytest.raises(ValueError):
+        BinaryCollisions(plasma, every=0)
+    collisions = BinaryCollisions(plasma)
+    dt = 1e-10 * u.s
+    s = ParticleTracker(plasma, ["e", "p"], 2, [1, 2], dt, 2, collisions=collisions)
+    with pytest.raises(ValueError):
+        s.run()
+    s = ParticleTracker(
+        plasma, "p", 2, dt=dt, nt=2, pusher="guiding_center", collisions=collisions
+    )
+    with pytest.raises(ValueError):
+        s.run()
+    s = ParticleTracker(plasma, "p", 2, dt=dt, nt=2, collisions=collisions)
+    with pytest.raises(ValueError):
+        s.run(processes=2)
@@ -0,0 +1,103 @@
+import astropy.units as u
+import numpy as np
+import pytest
+
+from plasmapy.plasma.sources import Plasma3D
+from plasmapy.simulation.deposition import deposit_moments
+from plasmapy.simulation.particletracker import ParticleTracker
+
+
+@pytest.fixture()
+def plasma():
+    x = np.linspace(0, 1, 5) * u.m
+    return Plasma3D(x, x, x)
+
+
+@pytest.fixture()
+def beam():
+    """
+    Return pairs of particles on a lattice, with a mean velocity along x
+    and opposite thermal velocities along y in each pair.
+    """
+    lattice = (np.arange(8) + 0.5) / 8
+    x = np.stack(np.meshgrid(lattice, lattice, lattice), axis=-1).reshape(-1, 3)
+    x = np.repeat(x, 2, axis=0)
+    v = np.zeros_like(x)
+    v[:, 0] = 3
+    v[:, 1] = np.tile([-2, 2], x.shape[0] // 2)
+    return x * u.m, v * u.m / u.s
+
+
+@pytest.mark.parametrize("shape", ["ngp", "cic", "tsc"])
+def test_periodic_moments(plasma, beam, shape):
+    """Test the moments of a uniform beam on a periodic grid."""
+    x, v = beam
+    weights = 1e3
+    moments = deposit_moments(plasma, x, v, 2 * u.kg, weights, shape, periodic=True)
+
+    # the total number is conserved
+    total = moments.number_density[:-1, :-1, :-1].sum().value * 0.25 ** 3
+    assert total == pytest.approx(weights * x.shape[0])
+    # the last points are the periodic images of the first ones
+    assert u.allclose(moments.mass_density[-1], moments.mass_density[0])
+
+    density = weights * x.shape[0] / u.m ** 3
+    assert u.allclose(moments.number_density, density)
+    assert u.allclose(moments.mass_density, 2 * u.kg * density)
+    assert u.allclose(moments.momentum_density[0], 6 * u.kg * u.m / u.s * density)
+    assert u.allclose(moments.momentum_density[1:], 0 * u.kg / u.m ** 2 / u.s)
+    expected = np.zeros((3, 3))
+    expected[1, 1] = 8
+    expected = expected[..., np.newaxis, np.newaxis, np.newaxis] * u.J * density
+    assert u.allclose(moments.pressure, expected, atol=1e-9 * u.Pa)
+
+
+@pytest.mark.parametrize("shape", ["ngp", "cic", "tsc"])
+def test_chunked_deposition(plasma, shape):
+    """Test that processing the particles in chunks gives the same moments."""
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 1, (100, 3)) * u.m
+    v = rng.normal(0, 1, (100, 3)) * u.m / u.s
+    mass = rng.uniform(1, 2, 100) * u.kg
+    whole = deposit_moments(plasma, x, v, mass, shape=shape)
+    chunked = deposit_moments(plasma, x, v, mass, shape=shape, chunk_size=7)
+    for moment, expected in zip(chunked, whole):
+        assert u.allclose(moment, expected)
+    # the pressure tensor is symmetric and positive on the diagonal
+    assert u.allclose(whole.pressure, np.swapaxes(whole.pressure, 0, 1))
+    assert np.all(np.diagonal(whole.pressure.value) >= -1e-12)
+
+
+def test_open_grid_drops_outside(plasma):
+    """Test that the parts of the shapes outside of an open grid are dropped."""
+    x = [[0, 0.5, 0.5], [0.5, 0.5, 0.5]] * u.m
+    v = np.zeros((2, 3)) * u.m / u.s
+    moments = deposit_moments(plasma, x, v, 1 * u.kg, shape="tsc")
+    # a particle on a boundary point loses the part beyond it
+    total = moments.number_density.sum().value * 0.25 ** 3
+    assert total == pytest.approx(2 - 0.125)
+
+
+def test_tracker_moments(plasma):
+    """Test the moments of one species of a ParticleTracker."""
+    s = ParticleTracker(
+        plasma, ["e", "p"], [4, 2], scaling=[10, 20], dt=1e-9 * u.s, nt=2
+    )
+    s.x = np.full((6, 3), 0.5) * u.m
+    s.v[:, 0] = 1 * u.m / u.s
+    protons = s.moments(plasma, species="p", shape="ngp")
+    assert u.isclose(protons.number_density[2, 2, 2], 40 / (0.25 * u.m) ** 3)
+    assert u.isclose(protons.mass_density[2, 2, 2], s.m[1] * 40 / (0.25 * u.m) ** 3)
+    assert u.allclose(s.moments(plasma).number_density.sum(), 80 / (0.25 * u.m) ** 3)
+
+
+def test_deposition_errors(plasma, beam):
+    """Test errors for invalid depositions."""
+    x, v = beam
+    with pytest.raises(ValueError):
+        deposit_moments(plasma, x, v, 1 * u.kg, shape="pic")
+    with pytest.raises(ValueError):
+        deposit_moments(plasma, x, v, 1 * u.kg, chunk_size=0)
+    y = np.linspace(0, 1, 5) ** 2 * u.m
+    with pytest.raises(ValueError):
+        deposit_moments(Plasma3D(y, y, y), x, v, 1 * u.kg)
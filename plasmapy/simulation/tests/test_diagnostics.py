@@ -0,0 +1,118 @@
+import astropy.units as u
+import functools
+import numpy as np
+import pytest
+
+from plasmapy.simulation.diagnostics import (
+    _Reduction,
+    Diagnostic,
+    KineticEnergyConservation,
+    MeanKineticEnergy,
+    MeanVelocity,
+    ParticleCount,
+    TotalKineticEnergy,
+    VelocityCovariance,
+)
+
+
+@pytest.fixture()
+def tracker(make_tracker):
+    """
+    Return a function creating a tracker of particles gyrating in a
+    uniform magnetic field.
+    """
+    return functools.partial(
+        make_tracker, "p", 10, x_spread=0.5, v_spread=1e5, dt=1e-9 * u.s, nt=30
+    )
+
+
+def test_reducers_match_history(tracker):
+    """Test that the diagnostics agree with the full trajectory history."""
+    diagnostics = [
+        TotalKineticEnergy(),
+        MeanKineticEnergy(every=7),
+        MeanVelocity(),
+        VelocityCovariance(every=2),
+        ParticleCount([-1, -1, 0] * u.m, [1, 1, 1] * u.m, every=3),
+    ]
+    s = tracker(diagnostics=diagnostics)
+    s.run()
+    total, mean, velocity, covariance, count = diagnostics
+
+    energy = s.kinetic_energy_history.sum(axis=1)
+    assert np.all(total.steps == np.arange(30))
+    assert u.allclose(total.values, energy, rtol=1e-12)
+    assert np.all(mean.steps == [0, 7, 14, 21, 28])
+    assert u.allclose(mean.values, energy[::7] / s.N, rtol=1e-12)
+    assert u.allclose(velocity.values, s.velocity_history.mean(axis=1))
+
+    expected = [np.cov(v.T, bias=True) for v in s.velocity_history[::2].value]
+    assert covariance.values.unit == u.m ** 2 / u.s ** 2
+    assert np.allclose(covariance.values.value, expected, rtol=1e-10)
+
+    z = s.position_history[::3, :, 2]
+    assert np.all(count.values == np.count_nonzero(z >= 0 * u.m, axis=1))
+
+
+def test_energy_conservation_without_history(tracker):
+    """
+    Test that the kinetic energy is conserved in a magnetic field,
+    without saving the trajectory history.
+    """
+    conservation = KineticEnergyConservation()
+    s = tracker(history=False, diagnostics=[conservation])
+    s.run()
+
+    assert s.position_history.size == 0
+    assert conservation.values[0] == 0
+    assert np.all(np.abs(conservation.values) < 1e-12)
+
+
+def test_custom_diagnostic(tracker):
+    """Test a diagnostic computed by a function of the tracker."""
+    fastest = Diagnostic(lambda tracker: np.abs(tracker.v).max(), every=10)
+    s = tracker(diagnostics=[fastest])
+    s.run()
+
+    assert np.all(fastest.steps == [0, 10, 20])
+    assert fastest.values.unit == u.m / u.s
+    assert u.allclose(fastest.values, np.abs(s.velocity_history[::10]).max(axis=(1, 2)))
+
+    # a second run starts a new time series
+    s.run()
+    assert fastest.steps.size == 3
+
+
+def test_diagnostic_errors():
+    """Test errors for invalid diagnostics."""
+    with pytest.raises(ValueError):
+        TotalKineticEnergy(every=0)
+    with pytest.raises(ValueError):
+        Diagnostic()
+    # reductions must implement _partial
+    with pytest.raises(TypeError):
+        _Reduction()
+
+
+def test_species_diagnostics(make_tracker):
+    """Test diagnostics restricted to one of several species."""
+    diagnostics = [
+        TotalKineticEnergy(species="p"),
+        MeanVelocity(species="e"),
+        ParticleCount([-1, -1, 0] * u.m, [1, 1, 1] * u.m, species="p"),
+    ]
+    s = make_tracker(
+        ["e", "p"],
+        [4, 2],
+        v=np.arange(18).reshape(6, 3) * 1e3 * u.m / u.s,
+        dt=1e-10 * u.s,
+        nt=5,
+        diagnostics=diagnostics,
+    )
+    s.x[:, 2] = [0.5, 0.5, -0.5, -0.5, 0.5, -0.5] * u.m
+    s.run()
+    energy, velocity, count = diagnostics
+
+    assert u.allclose(energy.values, s.kinetic_energy_history[:, 4:].sum(axis=1))
+    assert u.allclose(velocity.values, s.velocity_history[:, :4].mean(axis=1))
+    assert count.values[0] == 1
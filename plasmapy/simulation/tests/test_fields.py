@@ -0,0 +1,185 @@
+import astropy.units as u
+import numpy as np
+import pytest
+
+from astropy import constants
+
+from plasmapy.formulary.magnetostatics import InfiniteStraightWire, MagneticDipole
+from plasmapy.plasma.sources import Plasma3D
+from plasmapy.simulation.fields import (
+    AnalyticFields,
+    ElectrostaticFields,
+    FieldSource,
+    GriddedFields,
+)
+from plasmapy.simulation.particletracker import ParticleTracker
+
+
+@pytest.fixture()
+def plasma():
+    """Return a plasma with uniform crossed magnetic and electric fields."""
+    x = np.linspace(-1, 1, 3) * u.m
+    plasma = Plasma3D(x, x, x)
+    plasma.magnetic_field[2] = 1 * u.T
+    plasma.electric_field[0] = 1e3 * u.V / u.m
+    return plasma
+
+
+def run(fields, pusher="boris"):
+    """Return the trajectory of a proton tracked in ``fields``."""
+    s = ParticleTracker(fields, "p", 2, dt=1e-9 * u.s, nt=50, pusher=pusher)
+    s.v = [[1e4, 0, 0], [0, 2e4, 1e3]] * u.m / u.s
+    s.run()
+    return s.position_history
+
+
+def test_analytic_fields(plasma):
+    """Test that uniform analytic fields move particles like gridded fields."""
+    fields = AnalyticFields([0, 0, 1] * u.T, lambda x: [1, 0, 0] * u.kV / u.m)
+    assert u.allclose(run(fields), run(plasma), rtol=1e-12)
+
+
+def test_gridded_plus_analytic_fields(plasma):
+    """Test the superposition of a gridded and an analytic field."""
+    fields = GriddedFields(plasma, magnetic=False) + AnalyticFields([0, 0, 1] * u.T)
+    assert u.allclose(run(fields), run(plasma), rtol=1e-12)
+
+    B, E = fields([[0.5, 0, 0]] * u.m)
+    assert u.allclose(B, [[0, 0, 1]] * u.T)
+    assert u.allclose(E, [[1e3, 0, 0]] * u.V / u.m)
+
+
+def test_guiding_center_analytic_gradient():
+    """
+    Test the gradient of analytic fields by central differences against
+    the gradient of the same fields on a grid.
+    """
+    x = np.linspace(-1, 1, 5) * u.m
+    plasma = Plasma3D(x, x, x)
+    plasma.magnetic_field[2] = (1 + plasma.grid[1] / 10) * u.T
+
+    def B(x):
+        return (
+            np.stack(
+                [np.zeros(len(x)), np.zeros(len(x)), 1 + x[:, 1].value / 10], axis=-1
+            )
+            * u.T
+        )
+
+    gridded = run(plasma, pusher="guiding_center")
+    analytic = run(AnalyticFields(B), pusher="guiding_center")
+    assert u.allclose(analytic, gridded, rtol=1e-6)
+
+
+def test_magnetostatics_sum():
+    """Test fields of a sum of magnetostatic sources at many positions."""
+    dipole = MagneticDipole([0, 0, 1] * u.A * u.m ** 2, [0, 0, 0] * u.m)
+    wire = InfiniteStraightWire(np.array([0, 1, 0]), [0, 0, 0] * u.m, 1 * u.A)
+    fields = sum([AnalyticFields(dipole), AnalyticFields(wire)])
+    positions = np.random.default_rng(0).uniform(1, 2, (10, 3))
+
+    B, E = fields(positions * u.m)
+    expected = [dipole.magnetic_field(p) + wire.magnetic_field(p) for p in positions]
+    assert u.allclose(B, u.Quantity(expected), rtol=1e-12)
+    assert np.all(E == 0)
+
+
+def test_field_errors(plasma):
+    """Test errors for invalid field sources."""
+    dipole = MagneticDipole([0, 0, 1] * u.A * u.m ** 2, [0, 0, 0] * u.m)
+    with pytest.raises(TypeError):
+        AnalyticFields(electric_field=dipole)
+    with pytest.raises(ValueError):
+        AnalyticFields([0, 1] * u.T)
+    with pytest.raises(u.UnitsError):
+        AnalyticFields([0, 0, 1] * u.V / u.m)
+    with pytest.raises(ValueError):
+        GriddedFields(plasma, magnetic=False, electric=False)
+    with pytest.raises(TypeError):
+        AnalyticFields() + plasma
+    # field sources must implement _evaluate
+    with pytest.raises(TypeError):
+        FieldSource()
+
+
+def test_langmuir_oscillation():
+    """
+    Test that displaced cold electrons oscillate at the plasma frequency
+    in their electrostatic field.
+    """
+    x = np.linspace(0, 1, 17) * u.m
+    y = np.linspace(0, 1, 3) * u.m
+    fields = ElectrostaticFields(Plasma3D(x, y, y))
+    density = 1e6 / u.m ** 3
+    plasma_frequency = np.sqrt(
+        density * constants.e.si ** 2 / (constants.eps0 * constants.m_e)
+    ).si
+    period = 2 * np.pi / plasma_frequency
+    s = ParticleTracker(
+        fields,
+        "e",
+        512,
+        scaling=(density * u.m ** 3 / 512).value,
+        dt=period / 100,
+        nt=101,
+        boundary="periodic",
+    )
+
+    # a lattice of electrons with a sinusoidal displacement along x
+    lattice = np.stack(
+        np.meshgrid((np.arange(128) + 0.5) / 128, [0.25, 0.75], [0.25, 0.75]),
+        axis=-1,
+    ).reshape(-1, 3)
+    mode = np.sin(2 * np.pi * lattice[:, 0])
+    s.x = lattice * u.m
+    s.x[:, 0] += 1e-3 * mode * u.m
+    s.run()
+
+    displacement = s.position_history[:, :, 0].value - lattice[:, 0]
+    amplitude = (displacement * mode).mean(axis=1) / (displacement[0] * mode).mean()
+    assert abs(amplitude[25]) < 0.05
+    assert amplitude[50] == pytest.approx(-1, abs=0.01)
+    assert amplitude[100] == pytest.approx(1, abs=0.02)
+    assert u.isclose(fields.charge_density.mean(), -density * constants.e.si)
+
+
+def test_electrostatic_momentum_conservation():
+    """Test that the total momentum of a two-species plasma is conserved."""
+    x = np.linspace(0, 1, 9) * u.m
+    fields = ElectrostaticFields(Plasma3D(x, x, x))
+    s = ParticleTracker(
+        fields,
+        ["e", "p"],
+        [500, 500],
+        scaling=1e3,
+        dt=1e-7 * u.s,
+        nt=20,
+        boundary="periodic",
+        history=False,
+    )
+    rng = np.random.default_rng(0)
+    s.x = rng.uniform(0, 1, (s.N, 3)) * u.m
+    s.v = rng.normal(0, 1e4, (s.N, 3)) * u.m / u.s
+    initial = s._eff_m @ s._v
+    s.run()
+
+    assert np.abs(fields._values).max() > 0
+    scale = s._eff_m @ np.abs(s._v)
+    assert np.all(np.abs(s._eff_m @ s._v - initial) < 1e-12 * scale)
+
+
+def test_electrostatic_field_errors():
+    """Test errors for invalid electrostatic particle-in-cell runs."""
+    x = np.linspace(0, 1, 5) * u.m
+    with pytest.raises(ValueError):
+        ElectrostaticFields(Plasma3D(x ** 2 / u.m, x, x))
+    s = ParticleTracker(
+        ElectrostaticFields(Plasma3D(x, x, x)),
+        "e",
+        4,
+        dt=1e-9 * u.s,
+        nt=2,
+        boundary="periodic",
+    )
+    with pytest.raises(ValueError):
+        s.run(processes=2)
@@ -0,0 +1,115 @@
+import astropy.units as u
+import functools
+import numpy as np
+import pytest
+
+from plasmapy.simulation.history import _History, HDF5History, MemoryHistory
+
+
+@pytest.fixture()
+def gyrating_particles(make_tracker):
+    """Return a function creating a tracker with gyrating particles."""
+    v = np.arange(18).reshape(6, 3) * u.m / u.s
+    return functools.partial(make_tracker, "p", 6, v=v, dt=1e-9 * u.s, nt=25)
+
+
+@pytest.fixture()
+def full_history(gyrating_particles):
+    s = gyrating_particles()
+    s.run()
+    return s
+
+
+@pytest.mark.parametrize(
+    "kwargs, steps, particles",
+    [
+        ({}, np.arange(25), np.arange(6)),
+        ({"every": 4}, np.arange(0, 25, 4), np.arange(6)),
+        ({"particles": slice(1, 4)}, np.arange(25), np.arange(1, 4)),
+        ({"particles": [5, 0]}, np.arange(25), np.array([5, 0])),
+        ({"every": 3, "last": 4}, np.arange(15, 25, 3), np.arange(6)),
+        ({"last": 30}, np.arange(25), np.arange(6)),
+    ],
+)
+def test_memory_history(gyrating_particles, full_history, kwargs, steps, particles):
+    """Test the steps and particles kept by MemoryHistory."""
+    s = gyrating_particles(history=MemoryHistory(**kwargs))
+    s.run()
+
+    assert np.all(s.history.steps == steps)
+    assert s.saved_iterations == steps.size
+    assert u.allclose(s.time_history, full_history.t[steps])
+    expected = full_history.position_history[steps][:, particles]
+    assert u.allclose(s.position_history, expected)
+    expected = full_history.velocity_history[steps][:, particles]
+    assert u.allclose(s.velocity_history, expected)
+
+
+def test_ring_buffer_memory(gyrating_particles):
+    """Test that a ring buffer does not grow with the number of steps."""
+    s = gyrating_particles(history=MemoryHistory(last=3))
+    s.run()
+    assert s.history._positions.shape == (3, 6, 3)
+
+
+def test_hdf5_history(gyrating_particles, full_history, tmp_path):
+    """Test that streaming to HDF5 saves the same history."""
+    h5py = pytest.importorskip("h5py")
+    path = tmp_path / "history.h5"
+    s = gyrating_particles(history=HDF5History(path, every=5, particles=[1, 3]))
+    s.run()
+
+    assert np.all(s.history.steps == np.arange(0, 25, 5))
+    expected = full_history.position_history[::5][:, [1, 3]]
+    assert u.allclose(s.position_history, expected)
+    expected = full_history.velocity_history[::5][:, [1, 3]]
+    assert u.allclose(s.velocity_history, expected)
+
+    with h5py.File(path, "r") as h5:
+        assert h5.attrs["openPMD"].decode("utf-8") == "1.1.0"
+        position = h5["data/10/particles/p/position"]
+        assert np.all(position.attrs["unitDimension"] == [1, 0, 0, 0, 0, 0, 0])
+        assert position["x"].shape == (2,)
+        assert h5["data/10"].attrs["time"] == pytest.approx(1e-8)
+
+
+@pytest.mark.parametrize("kwargs", [{"every": 0}, {"last": 0}])
+def test_history_errors(kwargs):
+    """Test errors for invalid history policies."""
+    with pytest.raises(ValueError):
+        MemoryHistory(**kwargs)
+
+
+def test_incomplete_history():
+    """Test that history policies must implement the abstract methods."""
+
+    class Incomplete(_History):
+        def _record(self, step, x, v):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_hdf5_history_species(make_tracker, tmp_path):
+    """Test that each species is saved to its own openPMD species group."""
+    h5py = pytest.importorskip("h5py")
+    path = tmp_path / "history.h5"
+    s = make_tracker(
+        ["e", "p"],
+        [3, 2],
+        v=np.arange(15).reshape(5, 3) * u.m / u.s,
+        dt=1e-10 * u.s,
+        nt=5,
+        history=HDF5History(path, particles=[4, 0, 2]),
+    )
+    s.run()
+
+    assert s.velocity_history.shape == (5, 3, 3)
+    assert u.allclose(s.velocity_history[-1], s.v[[4, 0, 2]])
+    with h5py.File(path, "r") as h5:
+        assert set(h5["data/4/particles"]) == {"e", "p"}
+        electrons = h5["data/4/particles/e/velocity/x"][...]
+        protons = h5["data/4/particles/p/velocity/x"][...]
+    assert np.all(electrons == s.v[[0, 2], 0].si.value)
+    assert np.all(protons == s.v[[4], 0].si.value)
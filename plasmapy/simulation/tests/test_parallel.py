@@ -0,0 +1,115 @@
+import astropy.units as u
+import numpy as np
+import pickle
+import pytest
+import sys
+
+from plasmapy.simulation.diagnostics import (
+    Diagnostic,
+    KineticEnergyConservation,
+    MeanVelocity,
+    ParticleCount,
+    VelocityCovariance,
+)
+from plasmapy.simulation.history import HDF5History, MemoryHistory
+from plasmapy.simulation.parallel import _SharedArray
+
+
+@pytest.fixture()
+def tracker(make_tracker, uniform_magnetic_field):
+    """
+    Return a function creating a tracker of two species in nonuniform
+    fields, from which some particles are lost.
+    """
+    plasma = uniform_magnetic_field
+    plasma.electric_field[0] = 1e4 * (1 + plasma.grid[1]) * u.V / u.m
+
+    def make_species(**kwargs):
+        diagnostics = [
+            KineticEnergyConservation(every=3),
+            MeanVelocity(species="e"),
+            VelocityCovariance(),
+            ParticleCount([-1, -1, 0] * u.m, [1, 1, 1] * u.m, species="p"),
+        ]
+        return make_tracker(
+            ["e", "p"],
+            [10, 15],
+            x_spread=0.9,
+            v_spread=1e7,
+            dt=1e-8 * u.s,
+            nt=40,
+            diagnostics=diagnostics,
+            boundary="absorbing",
+            **kwargs,
+        )
+
+    return make_species
+
+
+@pytest.mark.parametrize("processes", [2, 3])
+def test_parallel_run(tracker, processes):
+    """Test that a parallel run gathers the results of a serial run."""
+    serial = tracker()
+    serial.run()
+    parallel = tracker(history=MemoryHistory(every=2, particles=[20, 3, 12]))
+    parallel.run(processes=processes)
+
+    assert 0 < serial.exit_log.particle.size < serial.N
+    assert np.all(parallel.exit_log.particle == serial.exit_log.particle)
+    assert u.allclose(parallel.exit_log.time, serial.exit_log.time)
+    assert u.allclose(parallel.exit_log.position, serial.exit_log.position)
+
+    assert parallel.species_slices == serial.species_slices
+    assert u.allclose(parallel.x, serial.x)
+    assert u.allclose(parallel.v, serial.v)
+
+    expected = serial.position_history[::2][:, [20, 3, 12]]
+    assert np.all(parallel.history.steps == np.arange(0, 40, 2))
+    assert np.allclose(parallel.position_history, expected, equal_nan=True)
+
+    for d_serial, d_parallel in zip(serial.diagnostics, parallel.diagnostics):
+        assert np.all(d_parallel.steps == d_serial.steps)
+        assert u.allclose(d_parallel.values, d_serial.values, equal_nan=True)
+
+
+def test_parallel_hdf5_history(tracker, tmp_path):
+    """Test that a parallel run streams the gathered history to HDF5."""
+    pytest.importorskip("h5py")
+    serial = tracker()
+    serial.run()
+    parallel = tracker(history=HDF5History(tmp_path / "history.h5", every=5))
+    parallel.run(processes=2)
+
+    expected = serial.velocity_history[::5]
+    assert np.allclose(parallel.velocity_history, expected, equal_nan=True)
+
+
+def test_parallel_errors(tracker):
+    """Test that diagnostics that cannot be gathered raise a ValueError."""
+    s = tracker()
+    s.diagnostics.append(Diagnostic(np.mean))
+    with pytest.raises(ValueError):
+        s.run(processes=2)
+
+
+def test_parallel_python_version(tracker, monkeypatch):
+    """Test that parallel runs are refused before Python 3.8."""
+    s = tracker()
+    monkeypatch.setattr(sys, "version_info", (3, 7, 16))
+    with pytest.raises(RuntimeError):
+        s.run(processes=2)
+
+
+def test_shared_array():
+    """Test that unpickled shared arrays map the same memory."""
+    array = np.arange(6.0).reshape(2, 3)
+    shared = _SharedArray(array)
+    try:
+        first = pickle.loads(pickle.dumps(shared))
+        second = pickle.loads(pickle.dumps(shared))
+        assert np.all(first == array)
+        first[1, 2] = -1
+        assert second[1, 2] == -1
+    finally:
+        del first, second
+        shared.release()
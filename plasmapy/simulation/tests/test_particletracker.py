@@ -1,22 +1,20 @@
 import astropy.units as u
+import functools
 import numpy as np
 import pytest
 
+from astropy import constants
 from astropy import units as u
 from astropy.modeling import fitting, models
+from scipy.interpolate import RegularGridInterpolator
 from scipy.optimize import curve_fit
 
+from plasmapy.formulary.drifts import ExB_drift, force_drift
+from plasmapy.formulary.parameters import gyrofrequency
 from plasmapy.plasma.sources import Plasma3D
+from plasmapy.simulation.fields import _UniformGridInterpolator, AnalyticFields
 from plasmapy.simulation.particletracker import ParticleTracker
-
-
-@pytest.fixture()
-def uniform_magnetic_field(N=3, max_x=1):
-    x = np.linspace(-max_x, max_x, N) * u.m
-    test_plasma = Plasma3D(x, x, x)
-    magfieldstr = 1 * u.T
-    test_plasma.magnetic_field[2] = magfieldstr
-    return test_plasma
+from plasmapy.utils import RelativityError
 
 
 # def test_basic_particletracker_functionality():
@@ -106,7 +104,7 @@ def test_particle_exb_drift(uniform_magnetic_field):
     r"""
     Tests the particle stepper for a field with magnetic field in the Z
     direction, electric field in the y direction. This should produce a
-    drift in the negative X direction, with the drift velocity
+    drift in the positive X direction, with the drift velocity
 
     v_e = ExB / B^2
 
@@ -115,7 +113,7 @@ def test_particle_exb_drift(uniform_magnetic_field):
     test_plasma = uniform_magnetic_field
     test_plasma.electric_field[1] = 1 * u.V / u.m
     expected_drift_velocity = (
-        -(test_plasma.electric_field_strength / test_plasma.magnetic_field_strength)
+        (test_plasma.electric_field_strength / test_plasma.magnetic_field_strength)
         .mean()
         .to(u.m / u.s)
     )
@@ -211,3 +209,437 @@ def test_particle_exb_nonuniform_drift():
 #     plasma = Plasma3D(x, y, z)
 
 #     ParticleTracker(plasma, 'e', dt=1e-14*u.s, nt=2).run()
+
+
+@pytest.mark.parametrize(
+    "y",
+    [np.linspace(-1, 2, 7), np.array([-1, -0.5, 0.5, 1, 2])],
+)
+def test_field_interpolation(y):
+    """
+    Test that the fields are gathered with trilinear interpolation on
+    uniform grids and on grids with unequally spaced points.
+    """
+    x = np.linspace(0, 1, 5)
+    z = np.linspace(-2, 0, 4)
+    plasma = Plasma3D(x * u.m, y * u.m, z * u.m)
+    rng = np.random.default_rng(0)
+    plasma.magnetic_field[...] = rng.normal(size=plasma.magnetic_field.shape) * u.T
+    plasma.electric_field[...] = (
+        rng.normal(size=plasma.electric_field.shape) * u.V / u.m
+    )
+
+    s = ParticleTracker(plasma, "p", 50, dt=1e-10 * u.s, nt=2)
+    s.x = rng.uniform([0, -1, -2], [1, 2, 0], (s.N, 3)) * u.m
+    s.x[0] = [1, 2, 0] * u.m
+    b, e = s._interpolate_fields()
+
+    expected_b = RegularGridInterpolator(
+        (x, y, z), np.moveaxis(plasma.magnetic_field.si.value, 0, -1)
+    )(s.x.si.value)
+    expected_e = RegularGridInterpolator(
+        (x, y, z), np.moveaxis(plasma.electric_field.si.value, 0, -1)
+    )(s.x.si.value)
+    uniform = y.size == 7
+    assert isinstance(s.fields._interpolator, _UniformGridInterpolator) == uniform
+    assert np.allclose(b.si.value, expected_b, rtol=1e-12)
+    assert np.allclose(e.si.value, expected_e, rtol=1e-12)
+
+
+def test_particle_outside_grid(uniform_magnetic_field):
+    """Test that gathering fields outside the grid raises a ValueError."""
+    s = ParticleTracker(uniform_magnetic_field, "p", 2, dt=1e-10 * u.s, nt=2)
+    s.x[1, 0] = 1.5 * u.m
+    with pytest.raises(ValueError):
+        s.run()
+
+
+@pytest.fixture()
+def relativistic_electron(make_tracker):
+    """
+    Return a function setting up an electron with a Lorentz factor of 10
+    gyrating in a uniform magnetic field, and its gyrofrequency.
+    """
+    gamma = 10
+    speed = constants.c * np.sqrt(1 - 1 / gamma ** 2)
+    omega = (constants.e.si * 1 * u.T / (gamma * constants.m_e)).to(
+        u.rad / u.s, equivalencies=u.dimensionless_angles()
+    )
+
+    def make_electron(pusher, steps_per_period, periods=4):
+        return make_tracker(
+            "e",
+            v=u.Quantity([speed, 0 * u.m / u.s, 0 * u.m / u.s]),
+            dt=2 * np.pi * u.rad / omega / steps_per_period,
+            nt=periods * steps_per_period + 1,
+            pusher=pusher,
+            history=False,
+        )
+
+    return make_electron, omega
+
+
+@pytest.mark.parametrize("pusher", ["relativistic_boris", "vay", "higuera_cary"])
+def test_relativistic_gyration(relativistic_electron, pusher):
+    """
+    Test that the relativistic pushers conserve the energy in a magnetic
+    field and converge to the relativistic gyration at second order.
+    """
+    make_tracker, omega = relativistic_electron
+    errors = []
+    for steps_per_period in (32, 64, 128):
+        s = make_tracker(pusher, steps_per_period)
+        s.run()
+
+        speed = np.linalg.norm(s.v.si.value)
+        assert np.isclose(speed, np.sqrt(1 - 1e-2) * constants.c.si.value, rtol=1e-13)
+
+        # the velocity is half a step behind the positions
+        phase = (omega * (s.NT - 1.5) * s.dt).to(u.rad).value
+        vx, vy = s.v[0, :2].si.value
+        errors.append(np.abs(np.angle((vx + 1j * vy) * np.exp(-1j * phase))))
+
+    assert errors[0] < 0.1
+    assert np.allclose(np.diff(np.log2(errors)), -2, atol=0.05)
+
+
+def test_relativistic_push_keeps_proper_velocity(relativistic_electron):
+    """
+    Test that successive calls of push carry the proper velocity instead
+    of recomputing it from the velocity, so that they match run.
+    """
+    make_tracker, omega = relativistic_electron
+    s = make_tracker("vay", 32, periods=1)
+    s.run()
+
+    manual = make_tracker("vay", 32, periods=1)
+    manual.push(init=True)
+    for _ in range(manual.NT - 1):
+        manual.push()
+    assert np.array_equal(manual._u, s._u)
+    assert np.array_equal(manual._v, s._v)
+
+    # setting v resets u
+    manual.v = s.v / 2
+    assert np.allclose(manual._u, manual._v * manual._gamma, rtol=1e-15)
+    assert manual._gamma[0, 0] < 2
+
+
+@pytest.mark.parametrize(
+    "pusher, exact",
+    [("relativistic_boris", False), ("vay", True), ("higuera_cary", True)],
+)
+def test_relativistic_force_free_drift(uniform_magnetic_field, pusher, exact):
+    """
+    Test that the Vay and Higuera-Cary pushers keep a relativistic
+    particle moving at the E x B drift velocity in crossed fields.
+    """
+    drift = 0.99 * constants.c
+    uniform_magnetic_field.electric_field[1] = drift * 1 * u.T
+
+    s = ParticleTracker(
+        uniform_magnetic_field, "e", dt=3e-11 * u.s, nt=100, pusher=pusher
+    )
+    s.x = [-0.9, 0, 0] * u.m
+    s.v = u.Quantity([drift, 0 * u.m / u.s, 0 * u.m / u.s])
+    s.run()
+
+    error = np.abs(s.velocity_history / drift - [1, 0, 0]).max()
+    assert (error < 1e-14) == exact
+
+
+def test_pusher_errors(uniform_magnetic_field):
+    """Test errors for unknown pushers and superluminal particles."""
+    with pytest.raises(ValueError):
+        ParticleTracker(uniform_magnetic_field, dt=1e-10 * u.s, nt=2, pusher="leap")
+
+    s = ParticleTracker(uniform_magnetic_field, dt=1e-10 * u.s, nt=2, pusher="vay")
+    with pytest.raises(RelativityError):
+        s.v = [2 * constants.c.si.value, 0, 0] * u.m / u.s
+    s.v[0, 0] = 2 * constants.c
+    with pytest.raises(RelativityError):
+        s.run()
+
+
+@pytest.fixture()
+def magnetic_gradient():
+    """Return a plasma with a magnetic field B_z = (1 + y / 10 m) T."""
+    x = np.linspace(-1, 1, 5) * u.m
+    plasma = Plasma3D(x, x, x)
+    plasma.magnetic_field[2] = (1 + plasma.grid[1] / 10) * u.T
+    return plasma
+
+
+@pytest.mark.slow
+def test_guiding_center_grad_B_drift(magnetic_gradient):
+    """
+    Test that the guiding-center pusher reproduces the grad-B drift of
+    the full orbit with steps much longer than the gyroperiod.
+    """
+    v_perp = 1e6 * u.m / u.s
+    gc = ParticleTracker(
+        magnetic_gradient, "p", dt=1e-6 * u.s, nt=11, pusher="guiding_center"
+    )
+    gc.v = u.Quantity([0 * u.m / u.s, v_perp, 0 * u.m / u.s])
+    gc.run()
+
+    mu = gc.m * v_perp ** 2 / (2 * u.T)
+    expected = force_drift(-mu * [0, 0.1, 0] * u.T / u.m, [0, 0, 1] * u.T, gc.q)
+    assert u.allclose(gc.velocity_history[:, 0], expected, rtol=1e-6)
+    assert u.allclose(
+        gc.position_history[-1, 0] - gc.position_history[0, 0],
+        expected * 10 * gc.dt,
+        rtol=1e-6,
+    )
+
+    # gyroaverage the full orbit over a gyroperiod at each end
+    period = 64
+    dt = 2 * np.pi * u.rad / gyrofrequency(1 * u.T, "p") / period
+    full = ParticleTracker(magnetic_gradient, "p", dt=dt, nt=300 * period + 1)
+    full.v = [0 * u.m / u.s, v_perp, 0 * u.m / u.s]
+    full.run()
+    start = full.position_history[:period, 0].mean(axis=0)
+    end = full.position_history[-period:, 0].mean(axis=0)
+    drift = (end - start) / ((full.NT - period) * full.dt)
+    assert u.isclose(drift[0], expected[0], rtol=1e-3)
+
+
+def test_guiding_center_ExB_drift(uniform_magnetic_field):
+    """Test the E x B drift and parallel motion of guiding centers."""
+    uniform_magnetic_field.electric_field[1] = 1e3 * u.V / u.m
+    s = ParticleTracker(
+        uniform_magnetic_field, "p", 2, dt=1e-5 * u.s, nt=5, pusher="guiding_center"
+    )
+    s.v = [[1e5, 0, 1e3], [0, -1e5, -2e3]] * u.m / u.s
+    s.run()
+
+    expected = ExB_drift([0, 1e3, 0] * u.V / u.m, [0, 0, 1] * u.T)
+    assert u.allclose(s.velocity_history[..., :2], expected[:2])
+    assert u.allclose(s.velocity_history[..., 2], [1e3, -2e3] * u.m / u.s)
+
+
+def test_magnetization_threshold(magnetic_gradient):
+    """
+    Test that only the particles with a small Larmor radius compared
+    to the field scale length follow their guiding centers.
+    """
+    s = ParticleTracker(
+        magnetic_gradient, "p", 2, dt=1e-9 * u.s, nt=3, magnetization_threshold=0.01
+    )
+    # magnetization parameters of about 1e-3 and 2e-2
+    s.v = [[0, 1e6, 0], [0, 2e7, 0]] * u.m / u.s
+    s.run()
+
+    assert np.all(s._gc_index == [0])
+    assert np.isclose(s.position_history[0, 0, 0].si.value, 1.044e-2, rtol=1e-3)
+    assert np.all(s.position_history[0, 1] == 0)
+
+
+@pytest.mark.parametrize("released", [True, False])
+def test_magnetization_switch(released):
+    """
+    Test that particles switch between their guiding centers and their
+    full orbits as they drift along the field gradient during a run, and
+    stay close to their full orbits.
+    """
+    fields = AnalyticFields(
+        lambda x: 0.1 * np.exp(-10 * x[:, 0:1].si.value) * [0, 0, 1] * u.T,
+        [0, 1e2 if released else -1e3, 0] * u.V / u.m,
+    )
+    trackers = []
+    for threshold in (0.02, None):
+        s = ParticleTracker(
+            fields, "p", dt=1e-7 * u.s, nt=251, magnetization_threshold=threshold
+        )
+        if released:
+            # a magnetization parameter of about 0.018, which grows as
+            # the particle drifts into the weaker field
+            s.x = [0.055, 0, 0] * u.m
+            s.v = [0, 1e4, 0] * u.m / u.s
+        else:
+            # a magnetization parameter of about 0.021, which falls as
+            # the particle drifts into the stronger field
+            s.x = [0.1 * np.log(2), 0, 0] * u.m
+            s.v = [-2e4, 1e4, 0] * u.m / u.s
+        s.initialize()
+        if threshold is not None:
+            assert s._gc_index.size == released
+        s.simulate()
+        s.finalize()
+        trackers.append(s)
+
+    mixed, full = trackers
+    assert mixed._gc_index.size == (not released)
+    # within about two Larmor radii after a drift of about 0.06 m or 0.18 m
+    assert u.allclose(mixed.x, full.x, atol=5e-3 * u.m)
+    assert "magnetization" in mixed.timings
+
+
+def test_several_species(uniform_magnetic_field):
+    """
+    Test that several species tracked together move as if each was
+    tracked on its own.
+    """
+    kwargs = dict(dt=1e-10 * u.s, nt=20)
+    s = ParticleTracker(uniform_magnetic_field, ["e", "p"], [3, 2], **kwargs)
+    assert s.N == 5
+    assert s.species_slices == {"e": slice(0, 3), "p": slice(3, 5)}
+    assert u.allclose(s.q, [-1, 1] * constants.e.si)
+    repr(s), str(s)
+
+    speeds = np.arange(1, 6) * 1e3 * u.m / u.s
+    s.v[:, 0] = speeds
+    s.run()
+    for species, particles in s.species_slices.items():
+        alone = ParticleTracker(
+            uniform_magnetic_field, species, particles.stop - particles.start, **kwargs
+        )
+        alone.v[:, 0] = speeds[particles]
+        alone.run()
+        assert u.allclose(
+            s.position_history[:, particles], alone.position_history, rtol=1e-12
+        )
+
+
+@pytest.mark.parametrize(
+    "particle_type, n_particles, scaling",
+    [(["e", "e"], 1, 1), (["e", "p"], [1, 2, 3], 1), (["e", "p"], 1, [1, 2, 3])],
+)
+def test_several_species_errors(
+    uniform_magnetic_field, particle_type, n_particles, scaling
+):
+    """Test errors for inconsistent lists of species."""
+    with pytest.raises(ValueError):
+        ParticleTracker(
+            uniform_magnetic_field, particle_type, n_particles, scaling, nt=1
+        )
+
+
+@pytest.fixture()
+def free_streaming(make_tracker, uniform_magnetic_field):
+    """Return a function setting up particles in a box without fields."""
+    uniform_magnetic_field.magnetic_field[2] = 0 * u.T
+    v = np.zeros((4, 3)) * u.m / u.s
+    v[:, 0] = [0.1, 0.45, 0.65, -0.7] * u.m / u.s
+    return functools.partial(make_tracker, ["e", "p"], [2, 2], v=v, dt=0.1 * u.s, nt=30)
+
+
+def test_absorbing_boundary(free_streaming):
+    """Test that particles leaving the domain are removed and logged."""
+    s = free_streaming(boundary="absorbing")
+    s.run()
+
+    # x = v t leaves the box [-1, 1] after |1 / v| seconds
+    log = s.exit_log
+    assert np.all(log.particle == [3, 2, 1])
+    assert u.allclose(log.time, [1.5, 1.6, 2.3] * u.s)
+    assert np.all(np.abs(log.position[:, 0]) > 1 * u.m)
+    assert u.allclose(log.velocity[:, 0], [-0.7, 0.65, 0.45] * u.m / u.s)
+
+    # only the live particles are pushed
+    assert s.x.shape == (1, 3)
+    assert s.species_slices == {"e": slice(0, 1), "p": slice(1, 1)}
+    assert s._t_vector.shape == (1, 3)
+    assert u.isclose(s.x[0, 0], 0.1 * u.m / u.s * s.t[-1])
+
+    # the history of lost particles is NaN from the time they are lost
+    x = s.position_history[:, :, 0]
+    assert np.all(np.isnan(x[15:, 3])) and not np.any(np.isnan(x[:15, 3]))
+    assert not np.any(np.isnan(x[:, 0]))
+
+
+@pytest.mark.parametrize("boundary", ["periodic", "reflecting"])
+def test_open_boundaries(free_streaming, boundary):
+    """Test that periodic and reflecting boundaries keep the particles."""
+    s = free_streaming(boundary=[boundary, "absorbing", "absorbing"])
+    s.run()
+
+    # distance from the lower face of the box [-1, 1] m
+    v = s.velocity_history[0, :, 0]
+    x = (v * s.t[-1] + 1 * u.m) % (2 * u.m)
+    if boundary == "reflecting":
+        x = (v * s.t[-1] + 1 * u.m) % (4 * u.m)
+        mirrored = x > 2 * u.m
+        x = np.where(mirrored, 4 * u.m - x, x)
+        v = np.where(mirrored, -v, v)
+    assert s.exit_log.particle.size == 0
+    assert u.allclose(s.x[:, 0], x - 1 * u.m, atol=1e-12 * u.m)
+    assert u.allclose(s.v[:, 0], v)
+
+
+def test_guiding_center_losses(make_tracker, uniform_magnetic_field):
+    """Test the loss of guiding-center particles drifting out of the box."""
+    uniform_magnetic_field.electric_field[0] = 1 * u.V / u.m
+    s = make_tracker(
+        "p",
+        3,
+        x=[[0, 0.5, 0], [0, 0, 0], [0, -0.5, 0]] * u.m,
+        dt=0.1 * u.s,
+        nt=30,
+        pusher="guiding_center",
+        boundary="absorbing",
+    )
+    s.run()
+
+    # the E x B drift of 1 m/s along -y takes each particle out after y + 1 s
+    assert np.all(s.exit_log.particle == [2, 1, 0])
+    assert u.allclose(s.exit_log.time, [0.6, 1.1, 1.6] * u.s)
+    assert s.x.shape == (0, 3)
+
+
+@pytest.mark.parametrize("normal", [True, False])
+def test_guiding_center_reflection(make_tracker, uniform_magnetic_field, normal):
+    """
+    Test that guiding-center particles reflected by a wall reverse their
+    parallel velocity only if the magnetic field is normal to the wall.
+    """
+    plasma = uniform_magnetic_field
+    plasma.magnetic_field[0] = 1 * u.T
+    plasma.magnetic_field[2] = 0 * u.T
+    # the E x B drift of 1 m/s along y
+    plasma.electric_field[2] = 1 * u.V / u.m
+    if normal:
+        boundary = ["reflecting", "absorbing", "absorbing"]
+    else:
+        boundary = ["periodic", "reflecting", "absorbing"]
+    s = make_tracker(
+        x=[0.5, -0.5 if normal else 0.5, 0] * u.m,
+        v=[2, 1, 0] * u.m / u.s,
+        dt=0.1 * u.s,
+        nt=11,
+        pusher="guiding_center",
+        boundary=boundary,
+    )
+    s.run()
+
+    assert s.exit_log.particle.size == 0
+    if normal:
+        # reflected by the wall at x = 1 m after 0.25 s
+        assert np.isclose(s._gc_v_parallel[0], -2)
+        assert u.isclose(s.x[0, 0], -0.5 * u.m)
+    else:
+        # pushed against the wall at y = 1 m, along the field, from 0.5 s
+        assert np.isclose(s._gc_v_parallel[0], 2)
+        assert 0.8 * u.m < s.x[0, 1] <= 1 * u.m
+        assert u.allclose(s.velocity_history[:, 0, 0], 2 * u.m / u.s)
+
+
+def test_boundary_errors(uniform_magnetic_field):
+    """Test errors for invalid boundary conditions."""
+    with pytest.raises(ValueError):
+        ParticleTracker(uniform_magnetic_field, dt=1 * u.s, nt=1, boundary="open")
+    with pytest.raises(ValueError):
+        ParticleTracker(
+            uniform_magnetic_field, dt=1 * u.s, nt=1, boundary=["periodic"] * 2
+        )
+    with pytest.raises(ValueError):
+        ParticleTracker(
+            AnalyticFields([0, 0, 1] * u.T), dt=1 * u.s, nt=1, boundary="periodic"
+        )
+    ParticleTracker(
+        AnalyticFields([0, 0, 1] * u.T),
+        dt=1 * u.s,
+        nt=1,
+        boundary="periodic",
+        domain=[[0, 0, 0], [1, 1, 1]] * u.m,
+    )
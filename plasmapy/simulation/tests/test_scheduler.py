@@ -0,0 +1,101 @@
+import astropy.units as u
+import numpy as np
+import pytest
+
+from plasmapy.plasma.sources import Plasma3D
+from plasmapy.simulation.diagnostics import MeanVelocity
+from plasmapy.simulation.fields import AnalyticFields
+from plasmapy.simulation.history import MemoryHistory
+from plasmapy.simulation.particletracker import ParticleTracker
+from plasmapy.simulation.scheduler import ScheduledSimulation
+
+
+class Counter(ScheduledSimulation):
+    """A simulation saving the time steps of its stages."""
+
+    NT = 13
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def initialize(self):
+        self._reset_timings()
+        self.calls.append("initialize")
+
+    def finalize(self):
+        self.calls.append("finalize")
+
+
+def test_stage_cadences(capsys):
+    """Test that each stage is called at its own cadence and timed."""
+    simulation = Counter()
+    for name, every in (("a", 1), ("b", 4), ("c", 5)):
+        simulation.add_stage(
+            name, lambda step, name=name: simulation.calls.append((name, step)), every
+        )
+    simulation.run()
+
+    assert simulation.calls[0] == "initialize"
+    assert simulation.calls[-1] == "finalize"
+    assert simulation.calls[1:5] == [("a", 1), ("a", 2), ("a", 3), ("a", 4)]
+    assert simulation.calls[5] == ("b", 4)
+    for name, steps in (("a", range(1, 13)), ("b", [4, 8, 12]), ("c", [5, 10])):
+        called = [call[1] for call in simulation.calls[1:-1] if call[0] == name]
+        assert called == list(steps)
+        assert simulation._calls[name] == len(steps)
+        assert simulation.timings[name] >= 0
+
+    simulation.summarize()
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 4
+    assert lines[2].split()[:2] == ["b", "3"]
+
+
+def test_finalize_after_error():
+    """Test that the simulation is finalized when a stage fails."""
+
+    def fail(step):
+        raise RuntimeError
+
+    simulation = Counter()
+    simulation.add_stage("fail", fail, 3)
+    with pytest.raises(RuntimeError):
+        simulation.run()
+    assert simulation.calls == ["initialize", "finalize"]
+    with pytest.raises(ValueError):
+        simulation.add_stage("never", fail, 0)
+
+
+def test_particle_tracker_stages(capsys):
+    """Test the stages of a ParticleTracker run and a field update stage."""
+    x = np.linspace(-1, 1, 3) * u.m
+    plasma = Plasma3D(x, x, x)
+    s = ParticleTracker(
+        plasma,
+        "p",
+        2,
+        dt=1e-9 * u.s,
+        nt=20,
+        history=MemoryHistory(every=5),
+        diagnostics=[MeanVelocity(every=2), MeanVelocity(every=4)],
+        boundary="periodic",
+    )
+    # switch on an electric field along x at step 10
+    electric = AnalyticFields(electric_field=[1, 0, 0] * u.V / u.m)
+    s.add_stage("fields", lambda step: setattr(s, "fields", electric), every=10)
+    s.run()
+
+    assert list(s.timings) == ["push", "boundaries", "fields", "history", "diagnostics"]
+    assert s._calls == {
+        "push": 19,
+        "boundaries": 19,
+        "fields": 1,
+        "history": 3,
+        "diagnostics": 9 + 4,
+    }
+    acceleration = (s.q / s.m * 1 * u.V / u.m).si
+    assert u.allclose(s.v[:, 0], acceleration * 9 * s.dt)
+
+    s.summarize()
+    assert "push" in capsys.readouterr().out